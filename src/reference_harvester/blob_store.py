@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+BLOB_COMPRESSIONS = ("gzip",)
+
+_CHUNK = 1024 * 1024
+
+
+def blob_root_for(out_dir: Path) -> Path:
+    """`out/<provider>/blobs`, shared by every run-id of that provider."""
+
+    if out_dir.parent.name == "runs":
+        return out_dir.parent.parent / "blobs"
+    return out_dir / "blobs"
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    sha256: str
+    path: Path
+    size_bytes: int
+    stored_bytes: int
+    compression: str | None
+    existed: bool
+
+
+class BlobStore:
+    """Content-addressed body store under `root/<sha[:2]>/<sha>`.
+
+    Identical bodies are stored once however many URLs, stages or run-ids
+    produce them. With `compression="gzip"` blobs are kept as
+    `<sha>.gz`; the name is always the digest of the uncompressed body.
+    `materialize(sha, dest)` exposes a raw blob at a URL-mirroring path as
+    a hardlink (a copy when linking fails, e.g. across filesystems), so the
+    familiar trees cost no extra space. Compressed blobs have no such
+    view; callers look them up by digest instead. Writes are atomic, so a
+    blob that exists is complete. Thread-safe.
+    """
+
+    def __init__(self, root: Path, *, compression: str | None = None) -> None:
+        if compression is not None and compression not in BLOB_COMPRESSIONS:
+            raise ValueError(f"Unsupported blob compression: {compression}")
+        self.root = root
+        self.compression = compression
+        self._lock = threading.Lock()
+
+    def path_for(self, sha: str) -> Path:
+        name = f"{sha}.gz" if self.compression == "gzip" else sha
+        return self.root / sha[:2] / name
+
+    def find(self, sha: str) -> Path | None:
+        """Path of the stored blob in either form, or None."""
+
+        for name in (sha, f"{sha}.gz"):
+            path = self.root / sha[:2] / name
+            if path.exists():
+                return path
+        return None
+
+    def _ref(self, sha: str, path: Path, size: int, existed: bool) -> BlobRef:
+        return BlobRef(
+            sha256=sha,
+            path=path,
+            size_bytes=size,
+            stored_bytes=path.stat().st_size,
+            compression="gzip" if path.suffix == ".gz" else None,
+            existed=existed,
+        )
+
+    def put(self, body: bytes, sha: str | None = None) -> BlobRef:
+        sha = sha or hashlib.sha256(body).hexdigest()
+        with self._lock:
+            existing = self.find(sha)
+            if existing is not None:
+                return self._ref(sha, existing, len(body), True)
+            path = self.path_for(sha)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            if self.compression == "gzip":
+                tmp_path.write_bytes(gzip.compress(body, mtime=0))
+            else:
+                tmp_path.write_bytes(body)
+            os.replace(tmp_path, path)
+            return self._ref(sha, path, len(body), False)
+
+    def adopt(self, source: Path, sha: str) -> BlobRef:
+        """Move a finished download into the store (dropping it if known).
+
+        `sha` must be the digest of `source`'s contents; large files are
+        moved (or compressed) without being read into memory.
+        """
+
+        size = source.stat().st_size
+        with self._lock:
+            existing = self.find(sha)
+            if existing is not None:
+                source.unlink()
+                return self._ref(sha, existing, size, True)
+            path = self.path_for(sha)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            if self.compression == "gzip":
+                with (
+                    source.open("rb") as src,
+                    gzip.GzipFile(tmp_path, "wb", mtime=0) as dst,
+                ):
+                    shutil.copyfileobj(src, dst, _CHUNK)
+                source.unlink()
+            else:
+                shutil.move(str(source), str(tmp_path))
+            os.replace(tmp_path, path)
+            return self._ref(sha, path, size, False)
+
+    def open(self, sha: str) -> IO[bytes]:
+        path = self.find(sha)
+        if path is None:
+            raise FileNotFoundError(f"blob {sha} is not stored")
+        if path.suffix == ".gz":
+            return gzip.open(path, "rb")
+        return path.open("rb")
+
+    def read_bytes(self, sha: str) -> bytes:
+        with self.open(sha) as handle:
+            return handle.read()
+
+    def materialize(self, sha: str, dest: Path) -> bool:
+        """Expose a raw blob at `dest`; False when the blob is compressed."""
+
+        path = self.find(sha)
+        if path is None:
+            raise FileNotFoundError(f"blob {sha} is not stored")
+        if path.suffix == ".gz":
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if dest.samefile(path):
+                return True
+        except OSError:
+            pass
+        tmp_path = dest.with_name(dest.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        try:
+            os.link(path, tmp_path)
+        except OSError:
+            shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, dest)
+        return True
+
+
+__all__ = [
+    "BLOB_COMPRESSIONS",
+    "BlobRef",
+    "BlobStore",
+    "blob_root_for",
+]
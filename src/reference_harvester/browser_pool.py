@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable, Coroutine, Iterable
+from dataclasses import dataclass
+from typing import Any, Self, TypeVar
+
+DEFAULT_BLOCKED_RESOURCES = frozenset({"image", "font", "media"})
+
+_T = TypeVar("_T")
+
+
+class BrowserUnavailable(RuntimeError):
+    """Playwright or its Chromium build is not installed."""
+
+
+class BrowserError(RuntimeError):
+    """A page failed to load or render in the pooled browser."""
+
+
+@dataclass(frozen=True)
+class RenderedPage:
+    url: str
+    status_code: int
+    content_type: str | None
+    body: bytes
+
+
+def _default_factory() -> Any:
+    try:
+        from playwright.async_api import async_playwright  # type: ignore[import]
+    except ImportError as exc:
+        raise BrowserUnavailable("playwright is not installed") from exc
+    return async_playwright()
+
+
+class BrowserPool:
+    """One headless Chromium shared by many page renders.
+
+    The browser is launched on first use and kept until `close()`, so a
+    stage pays browser startup once instead of once per URL. Every render
+    gets its own browser context (no cookies, cache or storage leak
+    between pages) and at most `max_pages` render at once. Requests for
+    `blocked_resources` types (images, fonts and media by default) are
+    aborted before they hit the network.
+
+    Playwright's async API runs on a private event-loop thread; `render`
+    and `render_many` block and may be called from any thread.
+    `playwright_factory()` must return an object with an async `start()`
+    like `async_playwright()`; tests pass a stand-in.
+    """
+
+    def __init__(
+        self,
+        *,
+        user_agent: str | None = None,
+        max_pages: int = 4,
+        blocked_resources: Iterable[str] = DEFAULT_BLOCKED_RESOURCES,
+        headless: bool = True,
+        playwright_factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self.user_agent = user_agent
+        self.max_pages = max(1, int(max_pages))
+        self.blocked_resources = frozenset(blocked_resources)
+        self.headless = headless
+        self.launches = 0
+        self._factory = playwright_factory or _default_factory
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._playwright: Any | None = None
+        self._browser: Any | None = None
+        self._launch_lock: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="browser-pool",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    async def _ensure_browser(self) -> Any:
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_pages)
+        async with self._launch_lock:
+            if self._browser is not None:
+                return self._browser
+            playwright = await self._factory().start()
+            try:
+                browser = await playwright.chromium.launch(
+                    headless=self.headless
+                )
+            except Exception as exc:
+                await playwright.stop()
+                raise BrowserUnavailable(
+                    f"chromium launch failed: {exc}"
+                ) from exc
+            self._playwright, self._browser = playwright, browser
+            self.launches += 1
+            return browser
+
+    async def _route(self, route: Any) -> None:
+        if route.request.resource_type in self.blocked_resources:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _render(
+        self,
+        url: str,
+        timeout_ms: int,
+        on_request: Callable[[str, Any], None] | None,
+    ) -> RenderedPage:
+        browser = await self._ensure_browser()
+        assert self._slots is not None
+        async with self._slots:
+            if self.user_agent:
+                context = await browser.new_context(user_agent=self.user_agent)
+            else:
+                context = await browser.new_context()
+            try:
+                if self.blocked_resources:
+                    await context.route("**/*", self._route)
+                page = await context.new_page()
+                if on_request is not None:
+                    page.on("request", lambda req: on_request(url, req))
+                response = await page.goto(url, timeout=timeout_ms)
+                await page.wait_for_load_state(
+                    "networkidle", timeout=timeout_ms
+                )
+                body = (await page.content()).encode("utf-8")
+            finally:
+                await context.close()
+        if response is None:
+            return RenderedPage(url, 200, "text/html", body)
+        return RenderedPage(
+            url,
+            int(response.status),
+            response.headers.get("content-type"),
+            body,
+        )
+
+    async def _render_all(
+        self,
+        urls: list[str],
+        timeout_ms: int,
+        on_request: Callable[[str, Any], None] | None,
+    ) -> list[RenderedPage | BrowserError]:
+        await self._ensure_browser()
+
+        async def _one(url: str) -> RenderedPage | BrowserError:
+            try:
+                return await self._render(url, timeout_ms, on_request)
+            except BrowserUnavailable:
+                raise
+            except Exception as exc:  # noqa: BLE001 - any page failure
+                return BrowserError(f"{url}: {exc}")
+
+        return list(await asyncio.gather(*(_one(url) for url in urls)))
+
+    def render_many(
+        self,
+        urls: Iterable[str],
+        *,
+        timeout_ms: int = 30_000,
+        on_request: Callable[[str, Any], None] | None = None,
+    ) -> list[RenderedPage | BrowserError]:
+        """Render `urls` concurrently; results (or errors) come back in order.
+
+        `on_request(page_url, request)` sees every request a page makes,
+        including blocked ones, and runs on the pool's loop thread. Raises
+        `BrowserUnavailable` when no browser can be started.
+        """
+
+        return self._run(self._render_all(list(urls), timeout_ms, on_request))
+
+    def render(
+        self,
+        url: str,
+        *,
+        timeout_ms: int = 30_000,
+        on_request: Callable[[str, Any], None] | None = None,
+    ) -> RenderedPage:
+        result = self.render_many(
+            [url], timeout_ms=timeout_ms, on_request=on_request
+        )
+        if isinstance(result[0], BrowserError):
+            raise result[0]
+        return result[0]
+
+    async def _shutdown(self) -> None:
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._playwright = None
+        try:
+            if browser is not None:
+                await browser.close()
+        finally:
+            if playwright is not None:
+                await playwright.stop()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join()
+            loop.close()
+            self._launch_lock = self._slots = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+__all__ = [
+    "DEFAULT_BLOCKED_RESOURCES",
+    "BrowserError",
+    "BrowserPool",
+    "BrowserUnavailable",
+    "RenderedPage",
+]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Iterable, Mapping, Tuple
+from typing import Any, Iterable, Iterator, Mapping, Tuple
 
 from reference_harvester.models import (
     MappingDiagnostics,
@@ -97,31 +97,44 @@ def _coerce_value(value: Any, type_hint: str | None) -> Tuple[Any, str | None]:
     return value, None
 
 
-def canonicalize_batch(
+def iter_canonicalized(
     payloads: Iterable[dict[str, Any]], registry: FieldRegistry
-) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-    """Return lists of normalized and diagnostics dicts for JSONL writing."""
+) -> Iterator[tuple[dict[str, Any], dict[str, Any]]]:
+    """Yield `(normalized, diagnostics)` per payload, one at a time."""
 
-    normalized_records: list[dict[str, Any]] = []
-    diagnostics: list[dict[str, Any]] = []
     for payload in payloads:
         record, diag = canonicalize_payload(payload, registry)
-        normalized_records.append(
+        yield (
             {
                 "canonical": record.canonical,
                 "extras": record.extras,
                 "source_paths": record.source_paths,
-            }
-        )
-        diagnostics.append(
+            },
             {
                 "source_url": diag.source_url,
                 "collisions": diag.collisions,
                 "unknown_keys": diag.unknown_keys,
                 "coercions": diag.coercions,
-            }
+            },
         )
+
+
+def canonicalize_batch(
+    payloads: Iterable[dict[str, Any]], registry: FieldRegistry
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Return lists of normalized and diagnostics dicts for JSONL writing."""
+
+    normalized_records: list[dict[str, Any]] = []
+    diagnostics: list[dict[str, Any]] = []
+    for normalized, diag in iter_canonicalized(payloads, registry):
+        normalized_records.append(normalized)
+        diagnostics.append(diag)
     return normalized_records, diagnostics
 
 
-__all__ = ["canonicalize_batch", "canonicalize_payload", "snake_case"]
+__all__ = [
+    "canonicalize_batch",
+    "canonicalize_payload",
+    "iter_canonicalized",
+    "snake_case",
+]
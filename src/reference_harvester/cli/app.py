@@ -102,6 +102,14 @@ def inventory(
         None,
         help="Override swagger/OpenAPI URLs (can be passed multiple times)",
     ),
+    catalog_concurrency: int = typer.Option(
+        8,
+        help="Concurrent HEAD/hash requests when cataloging bulk assets",
+    ),
+    browser_concurrency: int = typer.Option(
+        4,
+        help="Pages rendered at once in the shared browser (XHR inventory)",
+    ),
 ) -> None:
     """Inspect or refresh inventories/spec bundles for a provider."""
 
@@ -113,6 +121,8 @@ def inventory(
             out_root,
             run_id=run_id,
             swagger_urls=swagger_url or None,
+            catalog_concurrency=catalog_concurrency,
+            browser_concurrency=browser_concurrency,
         )
     )
 
@@ -204,6 +214,9 @@ def fetch(
     browser_timeout_ms: int = typer.Option(
         60_000, help="Browser fallback timeout (ms)"
     ),
+    browser_concurrency: int = typer.Option(
+        4, help="Pages rendered at once in the shared browser"
+    ),
     convert_html_to_md: bool = typer.Option(
         True, help="Convert HTML pages to Markdown"
     ),
@@ -211,6 +224,42 @@ def fetch(
     emit_csl_json: bool = typer.Option(False, help="Emit CSL-JSON citations"),
     emit_bibtex: bool = typer.Option(False, help="Emit BibTeX citations"),
     max_attachments: int = typer.Option(200, help="Max attachment downloads"),
+    crawl_concurrency: int = typer.Option(
+        8,
+        help="Max in-flight crawl requests overall",
+    ),
+    crawl_per_host: int = typer.Option(
+        2,
+        help="Max in-flight crawl requests per host (caps adaptive windows)",
+    ),
+    crawl_host_budget: int = typer.Option(
+        0,
+        help="Max pages crawled per host (0 = only the overall max)",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume/--no-resume",
+        help="Continue an interrupted crawl from its checkpoint",
+    ),
+    compact_seen: bool = typer.Option(
+        False,
+        "--compact-seen/--no-compact-seen",
+        help="Track crawled URLs in Bloom filters backed by on-disk indexes",
+    ),
+    discovery: str = typer.Option(
+        "links",
+        help="Crawl discovery: links | sitemaps | both",
+    ),
+    sitemap_url: list[str] = typer.Option(  # noqa: B008
+        None,
+        help="Sitemap or sitemap-index URLs (multi; default: robots.txt)",
+    ),
+    max_sitemaps: int = typer.Option(50, help="Max sitemap files read"),
+    near_duplicate_distance: int = typer.Option(
+        3,
+        help="SimHash bits within which a page counts as a near-duplicate "
+        "and is not expanded (-1 disables)",
+    ),
     seed: list[str] = typer.Option(None, help="Extra seed URLs (multi)"),
     allow_host: list[str] = typer.Option(
         None,
@@ -237,10 +286,50 @@ def fetch(
         10_000_000_000,
         help="Total bulk bytes cap per run",
     ),
+    bulk_parallel_parts: int = typer.Option(
+        1,
+        help="Byte ranges to fetch concurrently for large bulk files",
+    ),
+    bulk_parallel_min_bytes: int = typer.Option(
+        256 * 1024 * 1024,
+        help="Minimum bulk file size for parallel range downloads",
+    ),
     api_sample_limit: int = typer.Option(25, help="Max API samples"),
+    api_sample_concurrency: int = typer.Option(
+        8,
+        help="Max in-flight API sample requests overall",
+    ),
     throttle_seconds: float = typer.Option(
         0.0,
-        help="Delay between HTTP calls",
+        help="Minimum delay between HTTP calls to the same host",
+    ),
+    host_rate_limit: list[str] = typer.Option(  # noqa: B008
+        None,
+        help="Per-host minimum interval as HOST=SECONDS (multi)",
+    ),
+    http_cache: bool = typer.Option(
+        True,
+        help="Reuse cached responses from out/<provider>/cache across runs",
+    ),
+    http_cache_max_bytes: int = typer.Option(
+        1024 * 1024 * 1024,
+        help="Size cap for the shared HTTP cache (LRU eviction)",
+    ),
+    blob_store: bool = typer.Option(
+        True,
+        help="Store bodies once in out/<provider>/blobs; URL paths link there",
+    ),
+    blob_compression: str | None = typer.Option(
+        None,
+        help="Compress stored blobs (gzip); bodies are read via blob_path",
+    ),
+    adaptive_concurrency: bool = typer.Option(
+        True,
+        help="Tune per-host in-flight requests from 429/5xx and latency",
+    ),
+    adaptive_max: int = typer.Option(
+        16,
+        help="Upper bound for a host's adaptive in-flight window",
     ),
     swagger_url: list[str] = typer.Option(
         None,
@@ -285,11 +374,21 @@ def fetch(
             api_key_env=api_key_env,
             browser_fallback=browser_fallback,
             browser_timeout_ms=browser_timeout_ms,
+            browser_concurrency=browser_concurrency,
             convert_html_to_md=convert_html_to_md,
             emit_ris=emit_ris,
             emit_csl_json=emit_csl_json,
             emit_bibtex=emit_bibtex,
             max_attachments=max_attachments,
+            crawl_concurrency=crawl_concurrency,
+            crawl_per_host=crawl_per_host,
+            crawl_host_budget=crawl_host_budget,
+            resume=resume,
+            compact_seen=compact_seen,
+            discovery=discovery,
+            sitemap_urls=sitemap_url or None,
+            max_sitemaps=max_sitemaps,
+            near_duplicate_distance=near_duplicate_distance,
             extra_seeds=seed or None,
             allow_host=allow_host or None,
             deny_host=deny_host or None,
@@ -298,8 +397,18 @@ def fetch(
             bulk_urls=bulk_url or None,
             max_bulk=max_bulk,
             max_bulk_bytes=max_bulk_bytes,
+            bulk_parallel_parts=bulk_parallel_parts,
+            bulk_parallel_min_bytes=bulk_parallel_min_bytes,
             api_sample_limit=api_sample_limit,
+            api_sample_concurrency=api_sample_concurrency,
             throttle_seconds=throttle_seconds,
+            host_rate_limits=host_rate_limit or None,
+            http_cache=http_cache,
+            http_cache_max_bytes=http_cache_max_bytes,
+            blob_store=blob_store,
+            blob_compression=blob_compression,
+            adaptive_concurrency=adaptive_concurrency,
+            adaptive_max=adaptive_max,
             swagger_urls=swagger_url or None,
             validate_schema=validate_schema,
             schema_path=str(schema_path),
@@ -363,6 +472,9 @@ def run_job(
     browser_timeout_ms: int = typer.Option(
         60_000, help="Browser fallback timeout (ms)"
     ),
+    browser_concurrency: int = typer.Option(
+        4, help="Pages rendered at once in the shared browser"
+    ),
     convert_html_to_md: bool = typer.Option(
         True, help="Convert HTML pages to Markdown"
     ),
@@ -370,6 +482,42 @@ def run_job(
     emit_csl_json: bool = typer.Option(False, help="Emit CSL-JSON citations"),
     emit_bibtex: bool = typer.Option(False, help="Emit BibTeX citations"),
     max_attachments: int = typer.Option(200, help="Max attachment downloads"),
+    crawl_concurrency: int = typer.Option(
+        8,
+        help="Max in-flight crawl requests overall",
+    ),
+    crawl_per_host: int = typer.Option(
+        2,
+        help="Max in-flight crawl requests per host (caps adaptive windows)",
+    ),
+    crawl_host_budget: int = typer.Option(
+        0,
+        help="Max pages crawled per host (0 = only the overall max)",
+    ),
+    resume: bool = typer.Option(
+        False,
+        "--resume/--no-resume",
+        help="Continue an interrupted crawl from its checkpoint",
+    ),
+    compact_seen: bool = typer.Option(
+        False,
+        "--compact-seen/--no-compact-seen",
+        help="Track crawled URLs in Bloom filters backed by on-disk indexes",
+    ),
+    discovery: str = typer.Option(
+        "links",
+        help="Crawl discovery: links | sitemaps | both",
+    ),
+    sitemap_url: list[str] = typer.Option(  # noqa: B008
+        None,
+        help="Sitemap or sitemap-index URLs (multi; default: robots.txt)",
+    ),
+    max_sitemaps: int = typer.Option(50, help="Max sitemap files read"),
+    near_duplicate_distance: int = typer.Option(
+        3,
+        help="SimHash bits within which a page counts as a near-duplicate "
+        "and is not expanded (-1 disables)",
+    ),
     seed: list[str] = typer.Option(None, help="Extra seed URLs (multi)"),
     allow_host: list[str] = typer.Option(
         None,
@@ -389,10 +537,50 @@ def run_job(
     max_bulk_bytes: int = typer.Option(
         10_000_000_000, help="Total bulk bytes cap per run"
     ),
+    bulk_parallel_parts: int = typer.Option(
+        1,
+        help="Byte ranges to fetch concurrently for large bulk files",
+    ),
+    bulk_parallel_min_bytes: int = typer.Option(
+        256 * 1024 * 1024,
+        help="Minimum bulk file size for parallel range downloads",
+    ),
     api_sample_limit: int = typer.Option(25, help="Max API samples"),
+    api_sample_concurrency: int = typer.Option(
+        8,
+        help="Max in-flight API sample requests overall",
+    ),
     throttle_seconds: float = typer.Option(
         0.0,
-        help="Delay between HTTP calls",
+        help="Minimum delay between HTTP calls to the same host",
+    ),
+    host_rate_limit: list[str] = typer.Option(  # noqa: B008
+        None,
+        help="Per-host minimum interval as HOST=SECONDS (multi)",
+    ),
+    http_cache: bool = typer.Option(
+        True,
+        help="Reuse cached responses from out/<provider>/cache across runs",
+    ),
+    http_cache_max_bytes: int = typer.Option(
+        1024 * 1024 * 1024,
+        help="Size cap for the shared HTTP cache (LRU eviction)",
+    ),
+    blob_store: bool = typer.Option(
+        True,
+        help="Store bodies once in out/<provider>/blobs; URL paths link there",
+    ),
+    blob_compression: str | None = typer.Option(
+        None,
+        help="Compress stored blobs (gzip); bodies are read via blob_path",
+    ),
+    adaptive_concurrency: bool = typer.Option(
+        True,
+        help="Tune per-host in-flight requests from 429/5xx and latency",
+    ),
+    adaptive_max: int = typer.Option(
+        16,
+        help="Upper bound for a host's adaptive in-flight window",
     ),
     swagger_url: list[str] = typer.Option(
         None,
@@ -436,11 +624,21 @@ def run_job(
             "api_key_env": api_key_env,
             "browser_fallback": browser_fallback,
             "browser_timeout_ms": browser_timeout_ms,
+            "browser_concurrency": browser_concurrency,
             "convert_html_to_md": convert_html_to_md,
             "emit_ris": emit_ris,
             "emit_csl_json": emit_csl_json,
             "emit_bibtex": emit_bibtex,
             "max_attachments": max_attachments,
+            "crawl_concurrency": crawl_concurrency,
+            "crawl_per_host": crawl_per_host,
+            "crawl_host_budget": crawl_host_budget,
+            "resume": resume,
+            "compact_seen": compact_seen,
+            "discovery": discovery,
+            "sitemap_urls": sitemap_url or None,
+            "max_sitemaps": max_sitemaps,
+            "near_duplicate_distance": near_duplicate_distance,
             "extra_seeds": seed or None,
             "allow_host": allow_host or None,
             "deny_host": deny_host or None,
@@ -449,8 +647,18 @@ def run_job(
             "bulk_urls": bulk_url or None,
             "max_bulk": max_bulk,
             "max_bulk_bytes": max_bulk_bytes,
+            "bulk_parallel_parts": bulk_parallel_parts,
+            "bulk_parallel_min_bytes": bulk_parallel_min_bytes,
             "api_sample_limit": api_sample_limit,
+            "api_sample_concurrency": api_sample_concurrency,
             "throttle_seconds": throttle_seconds,
+            "host_rate_limits": host_rate_limit or None,
+            "http_cache": http_cache,
+            "http_cache_max_bytes": http_cache_max_bytes,
+            "blob_store": blob_store,
+            "blob_compression": blob_compression,
+            "adaptive_concurrency": adaptive_concurrency,
+            "adaptive_max": adaptive_max,
             "swagger_urls": swagger_url or None,
             "validate_schema": validate_schema,
             "schema_path": str(schema_path),
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_INITIAL_WINDOW = 2
+DEFAULT_MAX_WINDOW = 16
+
+
+@dataclass
+class _HostWindow:
+    window: float
+    in_flight: int = 0
+    peak: int = 0
+    filled: bool = False
+    latency_ewma: float | None = None
+    samples: int = 0
+    increases: int = 0
+    decreases: int = 0
+    last_decrease: float | None = None
+    last_reason: str | None = None
+
+
+class AdaptiveConcurrency:
+    """Per-host in-flight request window tuned by AIMD.
+
+    Every host starts at `initial` concurrent requests. Once a host has
+    filled its window, each healthy completion adds `1/window`, so the
+    window grows by about one request per round of successes (additive
+    increase); a host that never fills its window never grows it.
+
+    A 429, any 5xx, a transport error, or a latency above
+    `latency_factor` times the host's running average halves the window
+    (multiplicative decrease), at most once per `cooldown` seconds so one
+    burst of failures counts as a single congestion signal. The window
+    never leaves `[minimum, maximum]`.
+
+    `acquire(host)` blocks while the host is at its window; every
+    acquire must be paired with `release(host, status, latency)`.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = DEFAULT_INITIAL_WINDOW,
+        minimum: int = 1,
+        maximum: int = DEFAULT_MAX_WINDOW,
+        latency_factor: float = 3.0,
+        min_samples: int = 5,
+        cooldown: float = 1.0,
+        alpha: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.initial = min(self.maximum, max(self.minimum, int(initial)))
+        self.latency_factor = max(1.0, float(latency_factor))
+        self.min_samples = max(1, int(min_samples))
+        self.cooldown = max(0.0, float(cooldown))
+        self.alpha = min(1.0, max(0.0, float(alpha)))
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._hosts: dict[str, _HostWindow] = {}
+
+    def _state(self, host: str) -> _HostWindow:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostWindow(window=float(self.initial))
+            self._hosts[host] = state
+        return state
+
+    def limit(self, host: str) -> int:
+        """Current number of requests `host` may have in flight."""
+
+        with self._cond:
+            return int(self._state(host.lower()).window)
+
+    def acquire(self, host: str) -> None:
+        host = host.lower()
+        with self._cond:
+            state = self._state(host)
+            while state.in_flight >= int(state.window):
+                self._cond.wait()
+            state.in_flight += 1
+            state.peak = max(state.peak, state.in_flight)
+            if state.in_flight >= int(state.window):
+                state.filled = True
+
+    def release(
+        self,
+        host: str,
+        status_code: int | None,
+        latency: float | None = None,
+    ) -> None:
+        """Free a slot and adjust the window from how the request went.
+
+        `status_code` is None when the request failed without a response.
+        """
+
+        host = host.lower()
+        with self._cond:
+            state = self._state(host)
+            state.in_flight = max(0, state.in_flight - 1)
+            reason = self._congestion(state, status_code, latency)
+            if reason is not None:
+                self._decrease(state, reason)
+            elif state.filled and state.window < self.maximum:
+                before = int(state.window)
+                state.window = min(
+                    float(self.maximum), state.window + 1.0 / state.window
+                )
+                if int(state.window) > before:
+                    # The larger window has to be filled before it grows.
+                    state.filled = False
+                    state.increases += 1
+            self._cond.notify_all()
+
+    def _congestion(
+        self,
+        state: _HostWindow,
+        status_code: int | None,
+        latency: float | None,
+    ) -> str | None:
+        if status_code is None:
+            return "error"
+        if status_code == 429 or status_code >= 500:
+            return f"status {status_code}"
+        if latency is None:
+            return None
+        baseline = state.latency_ewma
+        if (
+            baseline is not None
+            and state.samples >= self.min_samples
+            and latency > baseline * self.latency_factor
+        ):
+            return "latency"
+        # Only healthy responses move the baseline, so a slow spell does
+        # not teach the controller that slow is normal.
+        if baseline is None:
+            state.latency_ewma = latency
+        else:
+            state.latency_ewma = baseline + self.alpha * (latency - baseline)
+        state.samples += 1
+        return None
+
+    def _decrease(self, state: _HostWindow, reason: str) -> None:
+        now = self._clock()
+        if (
+            state.last_decrease is not None
+            and now - state.last_decrease < self.cooldown
+        ):
+            return
+        state.window = max(float(self.minimum), state.window / 2)
+        state.filled = False
+        state.decreases += 1
+        state.last_decrease = now
+        state.last_reason = reason
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Window, in-flight count and adjustment history per host."""
+
+        with self._cond:
+            return {
+                host: {
+                    "window": int(state.window),
+                    "in_flight": state.in_flight,
+                    "peak_in_flight": state.peak,
+                    "latency_ewma_seconds": (
+                        None
+                        if state.latency_ewma is None
+                        else round(state.latency_ewma, 4)
+                    ),
+                    "increases": state.increases,
+                    "decreases": state.decreases,
+                    "last_decrease_reason": state.last_reason,
+                }
+                for host, state in sorted(self._hosts.items())
+            }
+
+
+__all__ = [
+    "DEFAULT_INITIAL_WINDOW",
+    "DEFAULT_MAX_WINDOW",
+    "AdaptiveConcurrency",
+]
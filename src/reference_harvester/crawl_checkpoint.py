@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from reference_harvester import json_codec
+
+DEFAULT_CHECKPOINT_EVERY = 25
+
+
+@dataclass
+class CrawlResume:
+    """What a resumed crawl starts from.
+
+    `state` is the last snapshot (None if the crawl died before its first
+    one); `events` is the whole journal and `replay_from` the index of the
+    first event the snapshot does not already reflect.
+    """
+
+    state: dict[str, Any] | None
+    events: list[dict[str, Any]] = field(default_factory=list)
+    replay_from: int = 0
+
+
+class CrawlCheckpoint:
+    """Append-only crawl journal plus periodic snapshots under `root`.
+
+    Every completed fetch is appended to `journal.jsonl` (and flushed) as
+    it happens, so a killed crawl loses at most the fetches that were in
+    flight. Every `every` events `save(state)` writes `state.json`
+    atomically with the journal length it covers; set values (the crawl's
+    seen-sets) are written member by member and come back as lists, so a
+    disk-backed set is never copied into memory to be saved. `load()`
+    returns the snapshot and the journal so the caller can replay what
+    came after.
+    `clear()` removes both for a fresh start or once a crawl finishes.
+    """
+
+    def __init__(
+        self, root: Path, *, every: int = DEFAULT_CHECKPOINT_EVERY
+    ) -> None:
+        self.root = root
+        self.every = max(1, int(every))
+        self.journal_path = root / "journal.jsonl"
+        self.state_path = root / "state.json"
+        self._lines = 0
+        self._since_save = 0
+        self._handle: IO[str] | None = None
+
+    def load(self) -> CrawlResume | None:
+        """Read a previous crawl's state, or None when there is none.
+
+        A torn last journal line (killed mid-write) is dropped and the
+        journal rewritten so later appends stay line-aligned.
+        """
+
+        if not self.state_path.exists() and not self.journal_path.exists():
+            return None
+        state: dict[str, Any] | None = None
+        try:
+            loaded = json_codec.loads(self.state_path.read_bytes())
+            if isinstance(loaded, dict):
+                state = loaded
+        except (OSError, json.JSONDecodeError):
+            state = None
+        events: list[dict[str, Any]] = []
+        if self.journal_path.exists():
+            with self.journal_path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        event = json_codec.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if isinstance(event, dict):
+                        events.append(event)
+            self._rewrite(events)
+        self._lines = len(events)
+        replay_from = 0
+        if state is not None:
+            replay_from = min(
+                int(state.get("journal_offset") or 0), len(events)
+            )
+        return CrawlResume(state=state, events=events, replay_from=replay_from)
+
+    def _rewrite(self, events: list[dict[str, Any]]) -> None:
+        tmp_path = self.journal_path.with_name(self.journal_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for event in events:
+                handle.write(json_codec.dumps(event, compact=True) + "\n")
+        tmp_path.replace(self.journal_path)
+
+    def clear(self) -> None:
+        """Drop the journal and snapshot (fresh start or clean finish)."""
+
+        self.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+        self._lines = 0
+        self._since_save = 0
+
+    def record(self, event: dict[str, Any]) -> None:
+        if self._handle is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            self._handle = self.journal_path.open("a", encoding="utf-8")
+        self._handle.write(json_codec.dumps(event, compact=True) + "\n")
+        self._handle.flush()
+        self._lines += 1
+        self._since_save += 1
+
+    @property
+    def due(self) -> bool:
+        return self._since_save >= self.every
+
+    def save(self, state: dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        if self._handle is not None:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+        payload = dict(state)
+        payload["journal_offset"] = self._lines
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write("{")
+            for n, (key, value) in enumerate(payload.items()):
+                handle.write(("," if n else "") + json_codec.dumps(key) + ":")
+                if isinstance(value, AbstractSet):
+                    handle.write("[")
+                    for i, member in enumerate(value):
+                        sep = "," if i else ""
+                        handle.write(sep + json_codec.dumps(member))
+                    handle.write("]")
+                else:
+                    handle.write(json_codec.dumps(value, compact=True))
+            handle.write("}")
+            handle.flush()
+            os.fsync(handle.fileno())
+        tmp_path.replace(self.state_path)
+        self._since_save = 0
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+__all__ = ["DEFAULT_CHECKPOINT_EVERY", "CrawlCheckpoint", "CrawlResume"]
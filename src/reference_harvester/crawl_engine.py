@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import re
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class CrawlTask:
+    url: str
+    depth: int
+    host: str
+
+
+def _host_of(url: str) -> str:
+    parsed = urlparse(url)
+    return (parsed.hostname or parsed.netloc or "").lower()
+
+
+@dataclass(frozen=True)
+class PatternScorer:
+    """Crawl priority from depth, URL pattern boosts and novelty.
+
+    Lower scores are fetched first. Each depth level costs `depth_weight`;
+    every regex in `boosts` that matches the URL subtracts its bonus; a
+    URL for which `is_known(url)` is true (already in a previous manifest)
+    pays `revisit_penalty` so unseen pages go first.
+    """
+
+    boosts: tuple[tuple[str, float], ...] = ()
+    depth_weight: float = 1.0
+    revisit_penalty: float = 0.5
+    is_known: Callable[[str], bool] | None = None
+
+    def __call__(self, task: CrawlTask) -> float:
+        score = task.depth * self.depth_weight
+        for pattern, bonus in self.boosts:
+            if re.search(pattern, task.url, re.IGNORECASE):
+                score -= bonus
+        if self.is_known is not None and self.is_known(task.url):
+            score += self.revisit_penalty
+        return score
+
+
+class AsyncCrawlEngine:
+    """Asyncio scheduler that keeps many blocking fetches in flight.
+
+    The engine owns the frontier and the concurrency bookkeeping; callers
+    own everything else through three callbacks:
+
+    - `admit(task)` runs on the event loop before dispatch and returns
+      True (dispatch now), False (drop), or None (keep it queued until an
+      in-flight fetch completes, e.g. while a budget slot is reserved).
+    - `fetch(task)` runs in a worker thread and may block on network I/O.
+    - `handle(task, result)` runs back on the event loop, one result at a
+      time, so it may mutate shared crawl state and `push` new URLs
+      without locking.
+
+    The frontier keeps one priority queue per host, ordered by
+    `score(task)` (lower first, FIFO among equals; FIFO when no scorer is
+    given), and serves hosts round-robin, so one host with thousands of
+    links cannot starve the others.
+
+    At most `concurrency` fetches run at once overall and at most
+    `per_host_concurrency` per host. URLs for a saturated host stay queued
+    while other hosts are served, so one slow host does not block the
+    rest of the frontier. `host_limit(host)` (optional) is a live cap,
+    e.g. `AdaptiveConcurrency.limit`, consulted on every dispatch; it can
+    only lower the per-host cap, so `per_host_concurrency` stays a hard
+    ceiling however far the controller grows its window.
+
+    `ready_in(task)` (optional) returns how many seconds the task's host
+    must wait before its next request (see `HostRateLimiter.delay`).
+    Tasks for hosts that are not ready yet stay queued while ready hosts
+    are served; when nothing else can run the engine sleeps until the
+    earliest host becomes ready instead of blocking a worker thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        fetch: Callable[[CrawlTask], Any],
+        handle: Callable[[CrawlTask, Any], None],
+        admit: Callable[[CrawlTask], bool | None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        ready_in: Callable[[CrawlTask], float] | None = None,
+        host_limit: Callable[[str], int] | None = None,
+        score: Callable[[CrawlTask], float] | None = None,
+        concurrency: int = 8,
+        per_host_concurrency: int = 2,
+    ) -> None:
+        self._fetch = fetch
+        self._handle = handle
+        self._admit = admit
+        self._should_stop = should_stop
+        self._ready_in = ready_in
+        self._host_limit = host_limit
+        self._score = score
+        self.concurrency = max(1, int(concurrency))
+        self.per_host_concurrency = max(1, int(per_host_concurrency))
+        self._queues: dict[str, list[tuple[float, int, CrawlTask]]] = {}
+        self._hosts: deque[str] = deque()
+        self._seq = itertools.count()
+        self._size = 0
+        self._host_inflight: dict[str, int] = {}
+        self._next_ready: float | None = None
+
+    def push(self, url: str, depth: int) -> None:
+        task = CrawlTask(url=url, depth=depth, host=_host_of(url))
+        score = 0.0 if self._score is None else float(self._score(task))
+        queue = self._queues.get(task.host)
+        if queue is None:
+            queue = self._queues[task.host] = []
+            self._hosts.append(task.host)
+        heapq.heappush(queue, (score, next(self._seq), task))
+        self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def queued(self) -> list[CrawlTask]:
+        """Tasks still waiting in the frontier, best score first per host."""
+
+        return [
+            entry[2]
+            for host in self._hosts
+            for entry in sorted(self._queues[host])
+        ]
+
+    def run(self) -> None:
+        asyncio.run(self._run())
+
+    def _next_dispatchable(self) -> CrawlTask | None:
+        hosts = self._hosts
+        visited: set[str] = set()
+        while hosts and hosts[0] not in visited:
+            host = hosts[0]
+            visited.add(host)
+            # Rotate first: the next call starts with the following host.
+            hosts.rotate(-1)
+            queue = self._queues[host]
+            cap = self.per_host_concurrency
+            if self._host_limit is not None:
+                cap = max(1, min(cap, int(self._host_limit(host))))
+            if self._host_inflight.get(host, 0) >= cap:
+                continue
+            if self._ready_in is not None:
+                wait = self._ready_in(queue[0][2])
+                if wait > 0:
+                    if self._next_ready is None or wait < self._next_ready:
+                        self._next_ready = wait
+                    continue
+            picked: CrawlTask | None = None
+            deferred: list[tuple[float, int, CrawlTask]] = []
+            while queue:
+                entry = heapq.heappop(queue)
+                verdict = (
+                    True if self._admit is None else self._admit(entry[2])
+                )
+                if verdict is None:
+                    deferred.append(entry)
+                    continue
+                self._size -= 1
+                if verdict:
+                    picked = entry[2]
+                    break
+            for entry in deferred:
+                heapq.heappush(queue, entry)
+            if not queue:
+                hosts.pop()
+                del self._queues[host]
+            if picked is not None:
+                return picked
+        return None
+
+    async def _run(self) -> None:
+        pending: dict[asyncio.Future[Any], CrawlTask] = {}
+        try:
+            while True:
+                stop = self._should_stop is not None and self._should_stop()
+                self._next_ready = None
+                while not stop and len(pending) < self.concurrency:
+                    task = self._next_dispatchable()
+                    if task is None:
+                        break
+                    self._host_inflight[task.host] = (
+                        self._host_inflight.get(task.host, 0) + 1
+                    )
+                    future = asyncio.ensure_future(
+                        asyncio.to_thread(self._fetch, task)
+                    )
+                    pending[future] = task
+                wake = None if stop else self._next_ready
+                if not pending:
+                    if wake is None:
+                        break
+                    await asyncio.sleep(wake)
+                    continue
+                done, _ = await asyncio.wait(
+                    pending.keys(),
+                    timeout=wake,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for future in done:
+                    task = pending.pop(future)
+                    self._host_inflight[task.host] -= 1
+                    self._handle(task, future.result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+__all__ = ["AsyncCrawlEngine", "CrawlTask", "PatternScorer"]
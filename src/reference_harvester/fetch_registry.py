@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from reference_harvester.http_cache import normalize_url
+
+DEFAULT_REGISTRY_MAX_BYTES = 256 * 1024 * 1024
+
+# Request headers that never change which body a GET returns here; the
+# validators are answered from the shared response instead.
+_KEY_IGNORED = frozenset({"user-agent", "if-none-match", "if-modified-since"})
+# Requests carrying these are partial or conditional on a resource state
+# the registry cannot vouch for.
+_UNCOALESCED = frozenset({"range", "if-range"})
+
+_R = TypeVar("_R")
+
+
+@dataclass
+class _UrlStats:
+    url: str
+    stages: list[str] = field(default_factory=list)
+    requests: int = 0
+    network_fetches: int = 0
+    status_code: int | None = None
+    size_bytes: int = 0
+
+
+@dataclass
+class _Slot:
+    future: Future[Any]
+    stats: _UrlStats
+
+
+class FetchRegistry:
+    """Run-scoped GET de-duplication shared by every stage of a run.
+
+    The first GET for a URL goes to the network; identical GETs issued
+    while it is in flight wait for it, and later ones are answered from
+    the same response until the run ends. Only 2xx responses whose bodies
+    fit in the remaining `max_bytes` budget are kept; failures and errors
+    are never replayed to later callers. A conditional request (one with
+    validators) may share a response but never loads one for others, so
+    a 304 is never handed to a caller that asked for the body.
+
+    Requests are keyed by the normalized URL plus any headers other than
+    the User-Agent and validators. `begin_stage(name)` labels the requests
+    that follow so `report()` can show which stages consumed each body.
+    Thread-safe.
+    """
+
+    def __init__(self, *, max_bytes: int = DEFAULT_REGISTRY_MAX_BYTES) -> None:
+        self.max_bytes = max(0, int(max_bytes))
+        self.size_bytes = 0
+        self.stage = "default"
+        self._lock = threading.Lock()
+        self._slots: dict[str, _Slot] = {}
+        self._stats: dict[str, _UrlStats] = {}
+
+    def begin_stage(self, name: str) -> None:
+        self.stage = name
+
+    @staticmethod
+    def key_for(url: str, headers: Mapping[str, str]) -> str | None:
+        """Registry key for a GET, or None when it must not be shared."""
+
+        lowered = {str(k).lower(): str(v) for k, v in headers.items()}
+        if _UNCOALESCED & lowered.keys():
+            return None
+        varying = sorted(
+            f"{name}: {value}"
+            for name, value in lowered.items()
+            if name not in _KEY_IGNORED
+        )
+        return "\n".join([normalize_url(url), *varying])
+
+    def get(
+        self,
+        key: str,
+        url: str,
+        load: Callable[[], _R],
+        *,
+        conditional: bool = False,
+    ) -> tuple[_R, bool]:
+        """Return `(response, shared)` for `key`, loading it at most once.
+
+        `shared` is False only for the caller whose `load()` produced the
+        response; everyone else receives that same object and should copy
+        it before handing it out.
+        """
+
+        stage = self.stage
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = _UrlStats(url=url)
+                self._stats[key] = stats
+            stats.requests += 1
+            if stage not in stats.stages:
+                stats.stages.append(stage)
+            slot = self._slots.get(key)
+            owner = slot is None and not conditional
+            if slot is None:
+                stats.network_fetches += 1
+            if owner:
+                slot = _Slot(future=Future(), stats=stats)
+                self._slots[key] = slot
+        if slot is None:
+            return load(), False
+        if not owner:
+            return slot.future.result(), True
+        try:
+            resp = load()
+        except BaseException as exc:
+            with self._lock:
+                self._slots.pop(key, None)
+            slot.future.set_exception(exc)
+            raise
+        self._settle(key, slot, resp)
+        slot.future.set_result(resp)
+        return resp, False
+
+    def _settle(self, key: str, slot: _Slot, resp: Any) -> None:
+        status = getattr(resp, "status_code", None)
+        body = getattr(resp, "content", b"") or b""
+        size = len(body) if isinstance(body, (bytes, bytearray)) else 0
+        with self._lock:
+            slot.stats.status_code = (
+                status if isinstance(status, int) else None
+            )
+            slot.stats.size_bytes = size
+            if (
+                isinstance(status, int)
+                and 200 <= status < 300
+                and self.size_bytes + size <= self.max_bytes
+            ):
+                self.size_bytes += size
+            else:
+                # Waiters already queued still share this response; later
+                # callers go back to the network.
+                self._slots.pop(key, None)
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            rows = [
+                {
+                    "url": stats.url,
+                    "stages": list(stats.stages),
+                    "requests": stats.requests,
+                    "network_fetches": stats.network_fetches,
+                    "status_code": stats.status_code,
+                    "size_bytes": stats.size_bytes,
+                }
+                for stats in sorted(self._stats.values(), key=lambda s: s.url)
+            ]
+        requests_total = sum(row["requests"] for row in rows)
+        network_total = sum(row["network_fetches"] for row in rows)
+        return {
+            "requests": requests_total,
+            "network_fetches": network_total,
+            "served_from_registry": requests_total - network_total,
+            "retained_bytes": self.size_bytes,
+            "urls": rows,
+        }
+
+
+__all__ = ["DEFAULT_REGISTRY_MAX_BYTES", "FetchRegistry"]
@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from reference_harvester import json_codec
+
+R = TypeVar("R")
+
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Request headers that make a GET conditional or partial. A caller that
+# sends its own is managing revalidation itself.
+_CALLER_CONTROLLED = frozenset(
+    {"if-none-match", "if-modified-since", "if-range", "range"}
+)
+# Response headers describing the connection, not the stored body.
+_HOP_BY_HOP = frozenset(
+    {
+        "connection",
+        "keep-alive",
+        "transfer-encoding",
+        "content-encoding",
+        "content-length",
+        "set-cookie",
+    }
+)
+
+
+def normalize_url(url: str) -> str:
+    """Canonical cache key form: lowercase scheme/host, sorted query."""
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not (
+        (scheme == "http" and port == 80)
+        or (scheme == "https" and port == 443)
+    ):
+        host = f"{host}:{port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def cache_root_for(out_dir: Path) -> Path:
+    """`out/<provider>/cache`, shared by every run-id of that provider."""
+
+    if out_dir.parent.name == "runs":
+        return out_dir.parent.parent / "cache"
+    return out_dir / "cache"
+
+
+def _cache_control(headers: Mapping[str, str]) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in str(headers.get("cache-control") or "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _lower_headers(headers: Any) -> dict[str, str]:
+    if not headers:
+        return {}
+    return {str(k).lower(): str(v) for k, v in dict(headers).items()}
+
+
+@dataclass
+class CachedResponse:
+    """A stored GET response; `body` is read from the content store."""
+
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+    key: str = field(repr=False)
+    variant: str = field(repr=False)
+
+    def freshness_lifetime(self) -> float:
+        directives = _cache_control(self.headers)
+        if "no-cache" in directives:
+            return 0.0
+        for name in ("s-maxage", "max-age"):
+            raw = directives.get(name)
+            if raw is not None:
+                try:
+                    return max(0.0, float(raw))
+                except ValueError:
+                    return 0.0
+        expires = self.headers.get("expires")
+        if expires:
+            try:
+                expires_at = parsedate_to_datetime(expires).timestamp()
+            except (TypeError, ValueError, IndexError):
+                return 0.0
+            return max(0.0, expires_at - self.stored_at)
+        return 0.0
+
+    def is_fresh(self, now: float) -> bool:
+        return now - self.stored_at < self.freshness_lifetime()
+
+    def validators(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class HttpCache:
+    """Content-addressed on-disk HTTP cache with LRU eviction.
+
+    Bodies live under `objects/` named by their sha256, so identical
+    payloads at different URLs (or across run-ids) are stored once.
+    Per-URL records under `entries/` hold the status, headers and body
+    digest for each `Vary` variant. When the stored bodies exceed
+    `max_bytes`, the least recently used URLs are dropped along with any
+    body no longer referenced. Thread-safe within a process.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.root = root
+        self.max_bytes = max(0, int(max_bytes))
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._lru: OrderedDict[str, set[str]] | None = None
+        self._refs: dict[str, int] = {}
+        self._sizes: dict[str, int] = {}
+        self._total_bytes = 0
+        self.hits = 0
+        self.revalidated = 0
+        self.stores = 0
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            self._index()
+            return self._total_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / "entries" / key[:2] / f"{key}.json"
+
+    def _object_path(self, sha: str) -> Path:
+        return self.root / "objects" / sha[:2] / sha
+
+    def _read_entry(self, key: str) -> dict[str, Any] | None:
+        try:
+            data = json_codec.loads(self._entry_path(key).read_bytes())
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write_entry(self, key: str, data: Mapping[str, Any]) -> None:
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(
+            json_codec.dumps_bytes(data, sort_keys=True, compact=True)
+        )
+        os.replace(tmp_path, path)
+
+    def _index(self) -> OrderedDict[str, set[str]]:
+        # Rebuilt once per process from what earlier runs left on disk;
+        # entry mtimes stand in for last access.
+        if self._lru is not None:
+            return self._lru
+        found: list[tuple[float, str, set[str]]] = []
+        for path in (self.root / "entries").glob("*/*.json"):
+            key = path.stem
+            data = self._read_entry(key)
+            if data is None:
+                continue
+            shas = {
+                str(v.get("sha256"))
+                for v in (data.get("variants") or {}).values()
+                if isinstance(v, dict) and v.get("sha256")
+            }
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            found.append((mtime, key, shas))
+        lru: OrderedDict[str, set[str]] = OrderedDict()
+        for _mtime, key, shas in sorted(found):
+            lru[key] = shas
+            for sha in shas:
+                self._ref(sha)
+        self._lru = lru
+        return lru
+
+    def _ref(self, sha: str) -> None:
+        self._refs[sha] = self._refs.get(sha, 0) + 1
+        if sha not in self._sizes:
+            try:
+                size = self._object_path(sha).stat().st_size
+            except OSError:
+                size = 0
+            self._sizes[sha] = size
+            self._total_bytes += size
+
+    def _unref(self, sha: str) -> None:
+        count = self._refs.get(sha, 0) - 1
+        if count > 0:
+            self._refs[sha] = count
+            return
+        self._refs.pop(sha, None)
+        self._total_bytes -= self._sizes.pop(sha, 0)
+        self._object_path(sha).unlink(missing_ok=True)
+
+    def _evict(self, lru: OrderedDict[str, set[str]]) -> None:
+        while lru and self._total_bytes > self.max_bytes:
+            key, shas = lru.popitem(last=False)
+            self._entry_path(key).unlink(missing_ok=True)
+            for sha in shas:
+                self._unref(sha)
+
+    @staticmethod
+    def _keys(
+        url: str,
+        vary: list[str],
+        request_headers: Mapping[str, str],
+    ) -> tuple[str, str]:
+        normalized = normalize_url(url)
+        key = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        lowered = _lower_headers(request_headers)
+        variant = json.dumps([[name, lowered.get(name, "")] for name in vary])
+        return key, hashlib.sha256(variant.encode("utf-8")).hexdigest()[:16]
+
+    def lookup(
+        self,
+        url: str,
+        request_headers: Mapping[str, str] | None = None,
+    ) -> CachedResponse | None:
+        headers = request_headers or {}
+        key, _ = self._keys(url, [], headers)
+        with self._lock:
+            lru = self._index()
+            data = self._read_entry(key)
+            if data is None:
+                return None
+            vary = [str(name) for name in data.get("vary") or []]
+            _, variant = self._keys(url, vary, headers)
+            stored = (data.get("variants") or {}).get(variant)
+            if not isinstance(stored, dict):
+                return None
+            sha = str(stored.get("sha256") or "")
+            try:
+                body = self._object_path(sha).read_bytes()
+            except OSError:
+                return None
+            if key in lru:
+                lru.move_to_end(key)
+            try:
+                os.utime(self._entry_path(key))
+            except OSError:
+                pass
+        return CachedResponse(
+            url=str(data.get("url") or url),
+            status_code=int(stored.get("status_code") or 200),
+            headers=dict(stored.get("headers") or {}),
+            body=body,
+            stored_at=float(stored.get("stored_at") or 0.0),
+            key=key,
+            variant=variant,
+        )
+
+    def store(
+        self,
+        url: str,
+        request_headers: Mapping[str, str] | None,
+        status_code: int,
+        response_headers: Any,
+        body: bytes,
+    ) -> CachedResponse | None:
+        """Store a 200 response if HTTP caching rules allow it."""
+
+        headers = {
+            name: value
+            for name, value in _lower_headers(response_headers).items()
+            if name not in _HOP_BY_HOP
+        }
+        directives = _cache_control(headers)
+        vary = sorted(
+            {
+                name.strip().lower()
+                for name in headers.get("vary", "").split(",")
+                if name.strip()
+            }
+        )
+        if (
+            int(status_code) != 200
+            or "no-store" in directives
+            or "*" in vary
+            or not isinstance(body, bytes)
+            or len(body) > self.max_bytes
+        ):
+            return None
+        now = self.clock()
+        key, variant = self._keys(url, vary, request_headers or {})
+        cached = CachedResponse(
+            url=normalize_url(url),
+            status_code=200,
+            headers=headers,
+            body=body,
+            stored_at=now,
+            key=key,
+            variant=variant,
+        )
+        if not cached.validators() and not cached.freshness_lifetime():
+            # Nothing to revalidate with and never fresh: no reuse possible.
+            return None
+        self._put(cached, vary)
+        return cached
+
+    def revalidate(
+        self,
+        cached: CachedResponse,
+        response_headers: Any,
+    ) -> CachedResponse:
+        """Fold a 304's headers into `cached` and restart its freshness."""
+
+        merged = dict(cached.headers)
+        for name, value in _lower_headers(response_headers).items():
+            if name not in _HOP_BY_HOP:
+                merged[name] = value
+        refreshed = CachedResponse(
+            url=cached.url,
+            status_code=cached.status_code,
+            headers=merged,
+            body=cached.body,
+            stored_at=self.clock(),
+            key=cached.key,
+            variant=cached.variant,
+        )
+        vary = sorted(
+            {
+                name.strip().lower()
+                for name in merged.get("vary", "").split(",")
+                if name.strip()
+            }
+        )
+        self._put(refreshed, vary)
+        with self._lock:
+            self.revalidated += 1
+        return refreshed
+
+    def _put(self, cached: CachedResponse, vary: list[str]) -> None:
+        sha = hashlib.sha256(cached.body).hexdigest()
+        with self._lock:
+            lru = self._index()
+            obj = self._object_path(sha)
+            if not obj.exists():
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = obj.with_name(obj.name + ".tmp")
+                tmp_path.write_bytes(cached.body)
+                os.replace(tmp_path, obj)
+            data = self._read_entry(cached.key) or {}
+            variants = (
+                data.get("variants") if data.get("vary") == vary else None
+            )
+            if not isinstance(variants, dict):
+                variants = {}
+            variants[cached.variant] = {
+                "status_code": cached.status_code,
+                "headers": cached.headers,
+                "sha256": sha,
+                "stored_at": cached.stored_at,
+            }
+            self._write_entry(
+                cached.key,
+                {"url": cached.url, "vary": vary, "variants": variants},
+            )
+            shas = {
+                str(v.get("sha256"))
+                for v in variants.values()
+                if isinstance(v, dict) and v.get("sha256")
+            }
+            # Take the new references before dropping the old ones so a
+            # body shared by both is never deleted in between.
+            for new in shas:
+                self._ref(new)
+            for old in lru.pop(cached.key, set()):
+                self._unref(old)
+            lru[cached.key] = shas
+            self.stores += 1
+            self._evict(lru)
+
+    def fetch(
+        self,
+        url: str,
+        request_headers: Mapping[str, str],
+        send: Callable[[dict[str, str]], R],
+        build: Callable[[CachedResponse], R],
+    ) -> R:
+        """Run one GET through the cache, whatever the HTTP client.
+
+        `send(extra_headers)` performs the request with `extra_headers`
+        added; `build(cached)` turns an entry into the client's response
+        type. Fresh entries are served without a request; stale ones are
+        revalidated and a 304 is answered from the store. Callers that
+        send their own conditional or Range headers get the raw response.
+        """
+
+        caller_controlled = any(
+            str(name).lower() in _CALLER_CONTROLLED for name in request_headers
+        )
+        cached = self.lookup(url, request_headers)
+        if (
+            cached is not None
+            and not caller_controlled
+            and cached.is_fresh(self.clock())
+        ):
+            with self._lock:
+                self.hits += 1
+            return build(cached)
+        extra = (
+            cached.validators()
+            if cached is not None and not caller_controlled
+            else {}
+        )
+        resp = send(extra)
+        status = getattr(resp, "status_code", None)
+        if cached is not None and extra and status == 304:
+            refreshed = self.revalidate(cached, getattr(resp, "headers", None))
+            close = getattr(resp, "close", None)
+            if callable(close):
+                close()
+            return build(refreshed)
+        if status == 200:
+            content = getattr(resp, "content", None)
+            if isinstance(content, bytes):
+                self.store(
+                    url,
+                    request_headers,
+                    200,
+                    getattr(resp, "headers", None),
+                    content,
+                )
+        return resp
+
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_BYTES",
+    "CachedResponse",
+    "HttpCache",
+    "cache_root_for",
+    "normalize_url",
+]
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import os
+import re
+from collections.abc import Callable
+from typing import Any
+
+JSON_BACKENDS = ("orjson", "msgspec", "stdlib")
+JSON_BACKEND_ENV = "REFERENCE_HARVESTER_JSON"
+
+# Floats the fast encoders spell differently from `repr(float)`: those
+# with an exponent (`1e16` vs `1e+16`) and those with four or more leading
+# fractional zeros (`0.00001` vs `1e-05`). Indented output ends every
+# scalar's line right after it (strings never contain a raw newline), so
+# an exponent is found without tokenizing; a look-alike inside a string
+# only costs a stdlib re-encode.
+_EXPONENT_FLOAT = re.compile(rb"e-?\d+,?(?:\n|\Z)")
+_SMALL_FLOAT = b"0.0000"
+# orjson reads integers beyond 64 bits as floats; input with a run of 19
+# digits is left to the stdlib parser.
+_LONG_DIGITS = re.compile(rb"\d{19}")
+_LONG_DIGITS_TEXT = re.compile(r"\d{19}")
+
+_Encode = Callable[[Any, bool, bool], bytes]
+_Decode = Callable[[str | bytes], Any]
+
+
+def _available_backend() -> str:
+    for name in JSON_BACKENDS[:-1]:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        return name
+    return "stdlib"
+
+
+def _load_backend(
+    name: str,
+) -> tuple[_Encode | None, _Decode | None, tuple[type[Exception], ...]]:
+    if name == "orjson":
+        import orjson  # type: ignore[import-not-found]
+
+        def encode(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(obj, option=option)
+
+        def decode(data: str | bytes) -> Any:
+            if isinstance(data, str):
+                long_ints = _LONG_DIGITS_TEXT.search(data)
+            else:
+                long_ints = _LONG_DIGITS.search(data)
+            if long_ints is not None:
+                return json.loads(data)
+            return orjson.loads(data)
+
+        return encode, decode, (orjson.JSONDecodeError,)
+    if name == "msgspec":
+        import msgspec  # type: ignore[import-not-found]
+
+        def encode(obj: Any, indent: bool, sort_keys: bool) -> bytes:
+            data = msgspec.json.encode(
+                obj, order="sorted" if sort_keys else None
+            )
+            return msgspec.json.format(data, indent=2) if indent else data
+
+        return encode, msgspec.json.decode, (msgspec.DecodeError,)
+    return None, None, ()
+
+
+class JsonCodec:
+    """JSON encoding through orjson or msgspec when installed, else stdlib.
+
+    Output always matches `json.dumps(obj, ensure_ascii=False, ...)` byte
+    for byte, so digests of sidecars and reports do not depend on what is
+    installed: a fast backend handles `indent=2` output (the only indent
+    this repo writes) and anything it would spell differently, such as
+    exponent floats, non-string keys or oversized ints, is re-encoded with
+    the stdlib. Non-finite floats are the exception (fast backends write
+    `null`, stdlib the non-standard `NaN`). Single-line output with the
+    stdlib's `", "` separators has no fast equivalent; `compact=True`
+    drops the spaces instead (and spells floats the backend's way) and is
+    meant for machine-only files such as logs and index rows. `loads`
+    falls back to the stdlib for input the fast parser rejects (e.g.
+    `NaN`), so it accepts what `json.loads` does.
+    """
+
+    def __init__(self, backend: str | None = None) -> None:
+        name = backend or os.environ.get(JSON_BACKEND_ENV) or None
+        name = name or _available_backend()
+        if name not in JSON_BACKENDS:
+            raise ValueError(f"Unsupported JSON backend: {name}")
+        try:
+            loaded = _load_backend(name)
+        except ImportError as exc:
+            raise ValueError(f"JSON backend {name} is not installed") from exc
+        self.backend = name
+        self._encode, self._decode, self._decode_errors = loaded
+
+    def _fast(
+        self, obj: Any, *, indent: int | None, sort_keys: bool, compact: bool
+    ) -> bytes | None:
+        if self._encode is None or not (compact or indent == 2):
+            return None
+        try:
+            data = self._encode(obj, not compact, sort_keys)
+        except (TypeError, ValueError):
+            return None
+        if not compact and (
+            _SMALL_FLOAT in data or _EXPONENT_FLOAT.search(data) is not None
+        ):
+            return None
+        return data
+
+    def _stdlib(
+        self, obj: Any, *, indent: int | None, sort_keys: bool, compact: bool
+    ) -> str:
+        return json.dumps(
+            obj,
+            indent=indent,
+            ensure_ascii=False,
+            sort_keys=sort_keys,
+            separators=(",", ":") if compact else None,
+        )
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        indent: int | None = None,
+        sort_keys: bool = False,
+        compact: bool = False,
+    ) -> str:
+        if compact and indent is not None:
+            raise ValueError("compact JSON cannot be indented")
+        opts = {"indent": indent, "sort_keys": sort_keys, "compact": compact}
+        data = self._fast(obj, **opts)
+        if data is not None:
+            return data.decode("utf-8")
+        return self._stdlib(obj, **opts)
+
+    def dumps_bytes(
+        self,
+        obj: Any,
+        *,
+        indent: int | None = None,
+        sort_keys: bool = False,
+        compact: bool = False,
+    ) -> bytes:
+        if compact and indent is not None:
+            raise ValueError("compact JSON cannot be indented")
+        opts = {"indent": indent, "sort_keys": sort_keys, "compact": compact}
+        data = self._fast(obj, **opts)
+        if data is not None:
+            return data
+        return self._stdlib(obj, **opts).encode("utf-8")
+
+    def loads(self, data: str | bytes) -> Any:
+        if self._decode is not None:
+            try:
+                return self._decode(data)
+            except self._decode_errors:
+                pass
+        return json.loads(data)
+
+
+@functools.cache
+def default_codec() -> JsonCodec:
+    """The process-wide codec (`REFERENCE_HARVESTER_JSON` picks a backend)."""
+
+    return JsonCodec()
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: int | None = None,
+    sort_keys: bool = False,
+    compact: bool = False,
+) -> str:
+    return default_codec().dumps(
+        obj, indent=indent, sort_keys=sort_keys, compact=compact
+    )
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    indent: int | None = None,
+    sort_keys: bool = False,
+    compact: bool = False,
+) -> bytes:
+    return default_codec().dumps_bytes(
+        obj, indent=indent, sort_keys=sort_keys, compact=compact
+    )
+
+
+def loads(data: str | bytes) -> Any:
+    return default_codec().loads(data)
+
+
+__all__ = [
+    "JSON_BACKENDS",
+    "JSON_BACKEND_ENV",
+    "JsonCodec",
+    "default_codec",
+    "dumps",
+    "dumps_bytes",
+    "loads",
+]
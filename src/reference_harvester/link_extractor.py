@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import codecs
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from urllib.parse import urldefrag, urljoin, urlparse
+
+LINK_PAGE = "page"
+LINK_ASSET = "asset"
+LINK_ATTACHMENT = "attachment"
+
+DEFAULT_ATTACHMENT_EXTS = frozenset(
+    {".pdf", ".json", ".yaml", ".yml", ".zip", ".csv", ".xml"}
+)
+ASSET_EXTS = frozenset(
+    {
+        ".js",
+        ".mjs",
+        ".css",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".svg",
+        ".ico",
+        ".webp",
+        ".avif",
+        ".bmp",
+        ".woff",
+        ".woff2",
+        ".ttf",
+        ".otf",
+        ".eot",
+        ".mp3",
+        ".mp4",
+        ".webm",
+        ".ogg",
+        ".wav",
+        ".map",
+    }
+)
+
+# (tag, attribute) pairs that point at something the page embeds rather
+# than somewhere a reader navigates to.
+_ASSET_ATTRS = frozenset(
+    {
+        ("img", "src"),
+        ("script", "src"),
+        ("source", "src"),
+        ("video", "src"),
+        ("video", "poster"),
+        ("audio", "src"),
+        ("track", "src"),
+        ("embed", "src"),
+        ("input", "src"),
+        ("object", "data"),
+    }
+)
+_PAGE_ATTRS = frozenset(
+    {
+        ("a", "href"),
+        ("area", "href"),
+        ("iframe", "src"),
+        ("frame", "src"),
+    }
+)
+_ASSET_RELS = frozenset(
+    {
+        "stylesheet",
+        "icon",
+        "shortcut",
+        "apple-touch-icon",
+        "preload",
+        "prefetch",
+        "modulepreload",
+        "manifest",
+        "mask-icon",
+    }
+)
+_SRCSET_TAGS = frozenset({"img", "source"})
+_RAW_TEXT_TAGS = frozenset({"script", "style"})
+_SKIPPED_SCHEMES = ("javascript:", "mailto:", "tel:", "data:", "about:")
+_TEXT_URL_RE = re.compile(r"https?://[^\s\"'<>]+", re.IGNORECASE)
+_TEXT_URL_TRAILING = ".,;:!?)]}"
+
+
+@dataclass(frozen=True)
+class Link:
+    url: str
+    kind: str
+    tag: str | None = None
+
+
+def _has_attachment_ext(url: str) -> bool:
+    path = urlparse(url).path.lower()
+    return any(path.endswith(ext) for ext in DEFAULT_ATTACHMENT_EXTS)
+
+
+def _has_asset_ext(url: str) -> bool:
+    path = urlparse(url).path.lower()
+    return any(path.endswith(ext) for ext in ASSET_EXTS)
+
+
+class LinkExtractor(HTMLParser):
+    """Collect the links of an HTML (or XML) document in one pass.
+
+    Feed the body in chunks of bytes or text with `feed()` and call
+    `close()` for the links in document order, each URL once. Relative
+    references resolve against `<base href>` when the document has one,
+    `srcset` candidates count as assets, and fragments, `javascript:`,
+    `mailto:` and other non-HTTP references are dropped.
+
+    Every link is typed: `is_attachment(url)` decides attachments (by
+    default a document-like file extension), embedded resources
+    (images, scripts, stylesheets, fonts, media) are assets, and
+    everything else is a page. Absolute URLs in text nodes are picked up
+    too so XML listings and feeds work; the bodies of `<script>` and
+    `<style>` are skipped unless `script_urls=True`. With
+    `collect_text=True` the visible text is kept as well (`text`), so a
+    caller that needs both parses the page only once.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        is_attachment: Callable[[str], bool] | None = None,
+        text_urls: bool = True,
+        script_urls: bool = False,
+        collect_text: bool = False,
+        encoding: str = "utf-8",
+    ) -> None:
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self._base = base_url
+        self._base_seen = False
+        self._is_attachment = is_attachment or _has_attachment_ext
+        self._text_urls = text_urls
+        self._script_urls = script_urls
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="ignore")
+        self._raw_text: str | None = None
+        # Text nodes can arrive in pieces across feeds; they are scanned
+        # whole at the next tag (or at close).
+        self._text: list[str] = []
+        self._collect_text = collect_text
+        self._visible: list[str] = []
+        self._links: dict[str, Link] = {}
+
+    def feed(self, data: bytes | str) -> None:
+        if isinstance(data, (bytes, bytearray)):
+            data = self._decoder.decode(bytes(data))
+        super().feed(data)
+
+    def close(self) -> list[Link]:  # type: ignore[override]
+        tail = self._decoder.decode(b"", final=True)
+        if tail:
+            super().feed(tail)
+        super().close()
+        self._flush_text()
+        return list(self._links.values())
+
+    def _add(self, raw: str, default_kind: str, tag: str | None) -> None:
+        raw = raw.strip()
+        if not raw or raw.startswith("#"):
+            return
+        if raw.lower().startswith(_SKIPPED_SCHEMES):
+            return
+        url, _frag = urldefrag(urljoin(self._base, raw))
+        parsed = urlparse(url)
+        if parsed.scheme not in {"http", "https"} or not parsed.netloc:
+            return
+        if url in self._links:
+            return
+        if self._is_attachment(url):
+            kind = LINK_ATTACHMENT
+        elif default_kind == LINK_ASSET or _has_asset_ext(url):
+            kind = LINK_ASSET
+        else:
+            kind = default_kind
+        self._links[url] = Link(url=url, kind=kind, tag=tag)
+
+    def handle_starttag(
+        self, tag: str, attrs: list[tuple[str, str | None]]
+    ) -> None:
+        self._flush_text()
+        values = {name: value for name, value in attrs if value is not None}
+        if tag == "base":
+            # Only the first <base href> counts, as in browsers.
+            href = values.get("href")
+            if href and not self._base_seen:
+                self._base = urljoin(self.base_url, href.strip())
+                self._base_seen = True
+            return
+        if tag == "link":
+            href = values.get("href")
+            if href:
+                rels = set(values.get("rel", "").lower().split())
+                kind = LINK_ASSET if rels & _ASSET_RELS else LINK_PAGE
+                self._add(href, kind, tag)
+            return
+        for name, value in values.items():
+            if (tag, name) in _PAGE_ATTRS:
+                self._add(value, LINK_PAGE, tag)
+            elif (tag, name) in _ASSET_ATTRS:
+                self._add(value, LINK_ASSET, tag)
+            elif name == "srcset" and tag in _SRCSET_TAGS:
+                for candidate in value.split(","):
+                    parts = candidate.split()
+                    if parts:
+                        self._add(parts[0], LINK_ASSET, tag)
+        if tag in _RAW_TEXT_TAGS:
+            self._raw_text = tag
+
+    def handle_startendtag(
+        self, tag: str, attrs: list[tuple[str, str | None]]
+    ) -> None:
+        self.handle_starttag(tag, attrs)
+        if self._raw_text == tag:
+            self._raw_text = None
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        if tag == self._raw_text:
+            self._raw_text = None
+
+    def handle_data(self, data: str) -> None:
+        if self._collect_text and self._raw_text is None:
+            self._visible.append(data)
+        if not self._text_urls:
+            return
+        if self._raw_text is not None and not self._script_urls:
+            return
+        self._text.append(data)
+
+    @property
+    def text(self) -> str:
+        """Visible text seen so far (requires `collect_text=True`)."""
+
+        return " ".join(" ".join(self._visible).split())
+
+    def _flush_text(self) -> None:
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text.clear()
+        for match in _TEXT_URL_RE.findall(text):
+            self._add(match.rstrip(_TEXT_URL_TRAILING), LINK_PAGE, None)
+
+
+def extract_links(
+    body: bytes | str | Iterable[bytes],
+    base_url: str,
+    *,
+    is_attachment: Callable[[str], bool] | None = None,
+    text_urls: bool = True,
+    script_urls: bool = False,
+) -> list[Link]:
+    """Typed links of `body` (bytes, text or an iterable of byte chunks)."""
+
+    extractor = LinkExtractor(
+        base_url,
+        is_attachment=is_attachment,
+        text_urls=text_urls,
+        script_urls=script_urls,
+    )
+    if isinstance(body, (bytes, bytearray, str)):
+        extractor.feed(body)
+    else:
+        for chunk in body:
+            extractor.feed(chunk)
+    return extractor.close()
+
+
+__all__ = [
+    "ASSET_EXTS",
+    "DEFAULT_ATTACHMENT_EXTS",
+    "LINK_ASSET",
+    "LINK_ATTACHMENT",
+    "LINK_PAGE",
+    "Link",
+    "LinkExtractor",
+    "extract_links",
+]
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Iterable, Mapping
 
+from reference_harvester import json_codec
 from reference_harvester.models import ensure_parent
 
 
-def write_jsonl(path: Path, records: Iterable[Mapping[str, object]]) -> None:
+def write_jsonl(
+    path: Path,
+    records: Iterable[Mapping[str, object]],
+    *,
+    compact: bool = False,
+) -> None:
+    """Write one JSON record per line; `compact` for machine-only logs."""
+
     ensure_parent(path)
     with path.open("w", encoding="utf-8") as handle:
         for record in records:
-            handle.write(json.dumps(record, ensure_ascii=False))
+            handle.write(json_codec.dumps(record, compact=compact))
             handle.write("\n")
 
 
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import IO, Any
+
+from reference_harvester import json_codec
+from reference_harvester.manifest_reader import ManifestReader, manifest_source
+
+DEFAULT_FSYNC_EVERY = 64
+DEFAULT_COMPACT_RATIO = 0.5
+DEFAULT_COMPACT_MIN_BYTES = 1024 * 1024
+
+
+def log_path_for(snapshot: Path) -> Path:
+    """`manifest.json` -> `manifest.log.jsonl`."""
+
+    return snapshot.with_name(f"{snapshot.stem}.log.jsonl")
+
+
+class ManifestLog:
+    """Append-only manifest: a JSON snapshot plus a log of newer records.
+
+    `snapshot` is the familiar `manifest.json` (with its `manifest.jsonl`
+    mirror, which is what gets read). Records produced by a run are
+    appended to `manifest.log.jsonl` beside it, flushed per record and
+    fsynced every `fsync_every` records, so a run writes only what it
+    produced and a crash loses at most a torn last line. `latest()` yields
+    the latest record per `key` (snapshot order, log records replacing or
+    following it), streaming the snapshot so only the log's records are
+    held in memory; the digests of the files it read end up in
+    `digests`. `close()` folds the log into the snapshot once the log
+    reaches `compact_ratio` of the snapshot's size (or when there is no
+    snapshot yet), so the snapshot can lag behind the log and readers go
+    through `latest()`. Compaction streams `latest()` into both files and
+    replaces the snapshot atomically before truncating the log, so
+    replaying a log over a newer snapshot is harmless.
+    """
+
+    def __init__(
+        self,
+        snapshot: Path,
+        *,
+        key: str = "url",
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        compact_min_bytes: int = DEFAULT_COMPACT_MIN_BYTES,
+    ) -> None:
+        self.snapshot = snapshot
+        self.log_path = log_path_for(snapshot)
+        self.key = key
+        self.fsync_every = max(1, int(fsync_every))
+        self.compact_ratio = max(0.0, float(compact_ratio))
+        self.compact_min_bytes = max(0, int(compact_min_bytes))
+        self.appended = 0
+        self._unsynced = 0
+        self._handle: IO[str] | None = None
+        self._lock = threading.Lock()
+        self.digests: dict[Path, str] = {}
+
+    def sources(self) -> list[Path]:
+        """Files `latest()` reads: the snapshot (or mirror) and the log."""
+
+        paths = [manifest_source(self.snapshot), self.log_path]
+        return [path for path in paths if path is not None and path.exists()]
+
+    def latest(self) -> Iterator[dict[str, Any]]:
+        overrides: dict[str, dict[str, Any]] = {}
+        keyless: list[dict[str, Any]] = []
+        if self.log_path.exists():
+            log_reader = ManifestReader(self.log_path)
+            for rec in log_reader:
+                value = rec.get(self.key)
+                if isinstance(value, str) and value:
+                    overrides.pop(value, None)
+                    overrides[value] = rec
+                else:
+                    keyless.append(rec)
+            if log_reader.sha256 is not None:
+                self.digests[self.log_path] = log_reader.sha256
+        source = manifest_source(self.snapshot)
+        if source is not None:
+            reader = ManifestReader(source)
+            for rec in reader:
+                value = rec.get(self.key)
+                if isinstance(value, str) and value in overrides:
+                    yield overrides.pop(value)
+                else:
+                    yield rec
+            if reader.sha256 is not None:
+                self.digests[source] = reader.sha256
+        yield from overrides.values()
+        yield from keyless
+
+    def append(self, record: Mapping[str, Any]) -> None:
+        line = json_codec.dumps(record, compact=True) + "\n"
+        with self._lock:
+            if self._handle is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = self.log_path.open("a", encoding="utf-8")
+            self._handle.write(line)
+            self._handle.flush()
+            self.appended += 1
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                os.fsync(self._handle.fileno())
+                self._unsynced = 0
+
+    def extend(self, records: Iterable[Mapping[str, Any]]) -> None:
+        for record in records:
+            self.append(record)
+
+    def sync(self) -> None:
+        with self._lock:
+            if self._handle is not None and self._unsynced:
+                self._handle.flush()
+                os.fsync(self._handle.fileno())
+                self._unsynced = 0
+
+    def compaction_due(self) -> bool:
+        if not self.snapshot.exists():
+            return True
+        try:
+            log_bytes = self.log_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if log_bytes == 0:
+            return False
+        threshold = self.compact_ratio * self.snapshot.stat().st_size
+        return log_bytes >= max(self.compact_min_bytes, threshold)
+
+    def compact(self) -> int:
+        """Fold the log into the snapshot; returns the record count."""
+
+        self.sync()
+        self.snapshot.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot.with_name(self.snapshot.name + ".tmp")
+        mirror = self.snapshot.with_suffix(".jsonl")
+        tmp_mirror = mirror.with_name(mirror.name + ".tmp")
+        count = 0
+        with (
+            tmp_path.open("w", encoding="utf-8") as snapshot,
+            tmp_mirror.open("w", encoding="utf-8") as lines,
+        ):
+            # The same bytes as `dumps(records, indent=2)`, one record at
+            # a time.
+            snapshot.write("[")
+            for record in self.latest():
+                text = json_codec.dumps(record, indent=2)
+                snapshot.write("," if count else "")
+                snapshot.write("\n  " + text.replace("\n", "\n  "))
+                lines.write(json_codec.dumps(record, compact=True) + "\n")
+                count += 1
+            snapshot.write("\n]\n" if count else "]\n")
+            for handle in (snapshot, lines):
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp_path, self.snapshot)
+        # The mirror is what readers prefer, so it is replaced atomically
+        # too; until then the old mirror plus the log is still complete.
+        os.replace(tmp_mirror, mirror)
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            self.log_path.unlink(missing_ok=True)
+        return count
+
+    def close(self, *, compact: bool | None = None) -> bool:
+        """Sync the log; compact when due (or as forced). True if compacted."""
+
+        self.sync()
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+        if compact is None:
+            compact = self.compaction_due()
+        if compact:
+            self.compact()
+        return compact
+
+
+def iter_manifest(
+    snapshot: Path, *, key: str = "url"
+) -> Iterator[dict[str, Any]]:
+    """Latest record per `key` of the manifest at `snapshot`."""
+
+    return ManifestLog(snapshot, key=key).latest()
+
+
+__all__ = [
+    "DEFAULT_COMPACT_MIN_BYTES",
+    "DEFAULT_COMPACT_RATIO",
+    "DEFAULT_FSYNC_EVERY",
+    "ManifestLog",
+    "iter_manifest",
+    "log_path_for",
+]
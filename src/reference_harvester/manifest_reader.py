@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from reference_harvester import json_codec
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+
+
+def _skip_ws(buf: str, pos: int) -> int:
+    while pos < len(buf) and buf[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def iter_json_array(chunks: Iterable[str]) -> Iterator[Any]:
+    """Yield the elements of a JSON array delivered as text chunks.
+
+    Only the element being parsed is buffered, so a large array is read
+    in constant memory (per element). A value is accepted only once the
+    character after it has arrived, so numbers split across chunks are
+    never cut short. Raises `ValueError` for anything but a JSON array.
+    """
+
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    state = "start"  # start -> first -> (value -> sep)* -> done
+    chunk_iter = iter(chunks)
+    final = False
+    while state != "done":
+        try:
+            buf = buf[pos:] + next(chunk_iter)
+        except StopIteration:
+            final = True
+            buf = buf[pos:]
+        pos = 0
+        while state != "done":
+            pos = _skip_ws(buf, pos)
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+            if state == "start":
+                if char != "[":
+                    raise ValueError("manifest is not a JSON array")
+                pos += 1
+                state = "first"
+                continue
+            if state == "sep":
+                if char == ",":
+                    pos += 1
+                    state = "value"
+                    continue
+                if char == "]":
+                    state = "done"
+                    continue
+                raise ValueError(f"expected ',' or ']' at offset {pos}")
+            if state == "first" and char == "]":
+                state = "done"
+                continue
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                break
+            if end >= len(buf) and not final:
+                break
+            yield value
+            pos = end
+            state = "sep"
+        if final and state != "done":
+            raise ValueError("truncated JSON array")
+
+
+def manifest_source(snapshot: Path) -> Path | None:
+    """The file to read for `snapshot`: its `.jsonl` sibling if present."""
+
+    mirror = snapshot.with_suffix(".jsonl")
+    if mirror.exists():
+        return mirror
+    if snapshot.exists():
+        return snapshot
+    return None
+
+
+class ManifestReader:
+    """Stream the records of one manifest file, hashing it as it is read.
+
+    `.jsonl` files are read line by line (undecodable lines, such as a
+    torn last line, are skipped); anything else is parsed as a JSON array
+    incrementally. Non-object entries are skipped. Once iteration has
+    finished, `sha256` holds the digest of the bytes read; a malformed
+    array stops the iteration early instead of raising.
+    """
+
+    def __init__(self, path: Path, *, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = max(1, int(chunk_size))
+        self.sha256: str | None = None
+        self.error: str | None = None
+
+    def _chunks(self, hasher: Any) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        with self.path.open("rb") as handle:
+            while True:
+                data = handle.read(self.chunk_size)
+                if not data:
+                    break
+                hasher.update(data)
+                yield decoder.decode(data)
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def _lines(self, chunks: Iterable[str]) -> Iterator[str]:
+        pending = ""
+        for chunk in chunks:
+            lines = (pending + chunk).split("\n")
+            pending = lines.pop()
+            for line in lines:
+                if line.strip():
+                    yield line
+        if pending.strip():
+            yield pending
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        hasher = hashlib.sha256()
+        chunks = self._chunks(hasher)
+        try:
+            try:
+                if self.path.suffix == ".jsonl":
+                    for line in self._lines(chunks):
+                        try:
+                            rec = json_codec.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if isinstance(rec, dict):
+                            yield rec
+                else:
+                    for rec in iter_json_array(chunks):
+                        if isinstance(rec, dict):
+                            yield rec
+            except ValueError as exc:
+                self.error = str(exc)
+            # Whatever follows the array (or an error) is still hashed.
+            for _chunk in chunks:
+                pass
+        finally:
+            chunks.close()
+        self.sha256 = hasher.hexdigest()
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "ManifestReader",
+    "iter_json_array",
+    "manifest_source",
+]
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import os
 import re
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable
-from urllib import robotparser
+from urllib.parse import urlparse
 
 import httpx
 
+from reference_harvester import json_codec
 from reference_harvester.canonicalizer import canonicalize_batch
 from reference_harvester.endnote_xml import write_reference_type_table
+from reference_harvester.http_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    CachedResponse,
+    HttpCache,
+    cache_root_for,
+)
 from reference_harvester.log_utils import write_jsonl
 from reference_harvester.providers.base import ProviderContext, ProviderPlugin
 from reference_harvester.providers.registry import (
@@ -21,6 +27,12 @@ from reference_harvester.providers.registry import (
     ProviderInfo,
 )
 from reference_harvester.registry import load_registry
+from reference_harvester.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+)
+from reference_harvester.robots_cache import DEFAULT_ROBOTS_TTL, RobotsCache
 from reference_harvester.sidecars import (
     build_sidecar_envelope,
     sha256_hex,
@@ -47,7 +59,7 @@ def _read_jsonl(path: Path) -> list[dict[str, Any]]:
         line = line.strip()
         if not line:
             continue
-        obj = json.loads(line)
+        obj = json_codec.loads(line)
         if isinstance(obj, dict):
             records.append(obj)
     return records
@@ -72,6 +84,48 @@ def _build_headers(email: str | None, user_agent: str) -> dict[str, str]:
 _http_get: Callable[..., httpx.Response] = httpx.get
 
 
+def _from_cache(cached: CachedResponse, url: str) -> httpx.Response:
+    return httpx.Response(
+        cached.status_code,
+        headers=cached.headers,
+        content=cached.body,
+        request=httpx.Request("GET", url),
+    )
+
+
+def _get_with_retry(
+    retry: RetryPolicy,
+    url: str,
+    *,
+    cache: HttpCache | None = None,
+    **kwargs: Any,
+) -> httpx.Response:
+    host = (urlparse(url).hostname or "").lower()
+
+    def _send(extra: dict[str, str]) -> httpx.Response:
+        call_kwargs = dict(kwargs)
+        if extra:
+            call_kwargs["headers"] = {**(kwargs.get("headers") or {}), **extra}
+        try:
+            return retry.call(
+                lambda: _http_get(url, **call_kwargs),
+                host=host,
+                retry_on=(httpx.TransportError,),
+            )
+        except CircuitOpenError as exc:
+            raise httpx.ConnectError(str(exc)) from exc
+
+    if cache is None:
+        return _send({})
+    key_url = str(httpx.URL(url, params=kwargs.get("params")))
+    return cache.fetch(
+        key_url,
+        dict(kwargs.get("headers") or {}),
+        _send,
+        lambda cached: _from_cache(cached, key_url),
+    )
+
+
 def _safe_slug(value: str) -> str:
     cleaned = re.sub(r"[^a-zA-Z0-9._-]+", "-", value).strip("-")
     return cleaned or "item"
@@ -110,6 +164,47 @@ class OpenAlexProvider(ProviderPlugin):
 
     def __init__(self, options: dict[str, Any] | None = None) -> None:
         self.options = options or {}
+        self.breaker = CircuitBreaker()
+        # Built on first use and shared by the provider's stages.
+        self._shared_cache: HttpCache | None = None
+        self._shared_robots: tuple[tuple[Any, ...], RobotsCache] | None = None
+
+    def _http_cache(
+        self,
+        opts: dict[str, Any],
+        out_dir: Path,
+    ) -> HttpCache | None:
+        """Provider-wide response cache under `out/openalex/cache`."""
+
+        if not opts.get("http_cache", True):
+            return None
+        root = Path(
+            str(
+                opts.get("http_cache_dir") or cache_root_for(out_dir.resolve())
+            )
+        )
+        max_bytes = int(
+            opts.get("http_cache_max_bytes") or DEFAULT_CACHE_MAX_BYTES
+        )
+        cached = self._shared_cache
+        if cached is not None and cached.root == root:
+            cached.max_bytes = max_bytes
+            return cached
+        cache = HttpCache(root, max_bytes=max_bytes)
+        self._shared_cache = cache
+        return cache
+
+    def _retry_policy(self, opts: dict[str, Any]) -> RetryPolicy:
+        raw_retries = opts.get("max_retries")
+        raw_backoff = opts.get("backoff_factor")
+        max_attempts = max(1, 3 if raw_retries is None else int(raw_retries))
+        backoff_factor = 0.5 if raw_backoff is None else float(raw_backoff)
+        return RetryPolicy(
+            max_attempts=max_attempts,
+            base_delay=backoff_factor,
+            max_delay=backoff_factor * max_attempts,
+            breaker=self.breaker,
+        )
 
     def refresh_inventory(self, ctx: ProviderContext) -> None:
         opts = dict(self.options)
@@ -203,6 +298,8 @@ class OpenAlexProvider(ProviderPlugin):
             email=email,
             user_agent=user_agent,
             timeout_s=timeout_s,
+            retry=self._retry_policy(opts),
+            ttl=float(opts.get("robots_ttl_seconds") or DEFAULT_ROBOTS_TTL),
         )
 
         inventory = {
@@ -222,11 +319,11 @@ class OpenAlexProvider(ProviderPlugin):
         }
 
         (artifacts_dir / "inventory.json").write_text(
-            json.dumps(inventory, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(inventory, indent=2) + "\n",
             encoding="utf-8",
         )
         (artifacts_dir / "endpoints.json").write_text(
-            json.dumps(endpoints, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(endpoints, indent=2) + "\n",
             encoding="utf-8",
         )
 
@@ -249,6 +346,35 @@ class OpenAlexProvider(ProviderPlugin):
             encoding="utf-8",
         )
 
+    def _robots_cache(
+        self,
+        *,
+        store_dir: Path,
+        headers: dict[str, str],
+        timeout_s: float,
+        retry: RetryPolicy,
+        ttl: float,
+    ) -> RobotsCache:
+        key = (store_dir, tuple(sorted(headers.items())), timeout_s, ttl)
+        cached = self._shared_robots
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        def _fetch(url: str) -> tuple[int, str]:
+            resp = _get_with_retry(
+                retry, url, headers=headers, timeout=timeout_s
+            )
+            return int(getattr(resp, "status_code", 0) or 0), resp.text
+
+        robots = RobotsCache(
+            _fetch,
+            store_dir=store_dir,
+            ttl=ttl,
+            errors=(httpx.HTTPError,),
+        )
+        self._shared_robots = (key, robots)
+        return robots
+
     def _inventory_robots(
         self,
         *,
@@ -257,47 +383,49 @@ class OpenAlexProvider(ProviderPlugin):
         email: str | None,
         user_agent: str,
         timeout_s: float,
+        retry: RetryPolicy,
+        ttl: float = DEFAULT_ROBOTS_TTL,
     ) -> list[dict[str, Any]]:
         robots_dir = artifacts_dir / "robots"
         robots_dir.mkdir(parents=True, exist_ok=True)
+        robots = self._robots_cache(
+            store_dir=robots_dir,
+            headers=_build_headers(email, user_agent),
+            timeout_s=timeout_s,
+            retry=retry,
+            ttl=ttl,
+        )
 
         records: list[dict[str, Any]] = []
-        for host in hosts:
-            host_val = str(host).strip().lower()
-            if not host_val:
-                continue
-
-            robots_url = f"https://{host_val}/robots.txt"
+        for robots_entry in robots.prefetch(str(host) for host in hosts):
+            host_val = robots_entry.host
             entry: dict[str, Any] = {
                 "host": host_val,
-                "robots_url": robots_url,
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "robots_url": robots_entry.robots_url,
+                "fetched_at": robots_entry.fetched_at_iso,
             }
-            try:
-                resp = _http_get(
-                    robots_url,
-                    headers=_build_headers(email, user_agent),
-                    timeout=timeout_s,
-                )
-                resp.raise_for_status()
-            except httpx.HTTPError as exc:  # pragma: no cover
+            if not robots_entry.ok:  # pragma: no cover
                 entry["status"] = "error"
-                entry["error"] = str(exc)
+                if robots_entry.status_code is not None:
+                    entry["status_code"] = robots_entry.status_code
+                entry["error"] = robots_entry.error or (
+                    f"HTTP {robots_entry.status_code}"
+                    f" for {robots_entry.robots_url}"
+                )
                 records.append(entry)
                 continue
 
             entry["status"] = "ok"
-            entry["status_code"] = int(getattr(resp, "status_code", 0) or 0)
+            entry["status_code"] = robots_entry.status_code
 
-            text = getattr(resp, "text", "")
+            text = robots_entry.text
             stored = robots_dir / f"robots_{host_val}.txt"
             stored.write_text(text, encoding="utf-8")
             stored_path = str(stored.relative_to(artifacts_dir))
             entry["stored_path"] = stored_path.replace("\\", "/")
 
             lines = text.splitlines()
-            rp = robotparser.RobotFileParser()
-            rp.parse(lines)
+            rp = robots_entry.parser
 
             crawl_delay = rp.crawl_delay(user_agent)
             entry["crawl_delay"] = crawl_delay
@@ -329,7 +457,7 @@ class OpenAlexProvider(ProviderPlugin):
 
         robots_inventory_path = artifacts_dir / "robots_inventory.json"
         robots_inventory_path.write_text(
-            json.dumps(records, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(records, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(robots_inventory_path.with_suffix(".jsonl"), records)
@@ -354,7 +482,7 @@ class OpenAlexProvider(ProviderPlugin):
             )
         robots_summary_path = artifacts_dir / "robots_summary.json"
         robots_summary_path.write_text(
-            json.dumps(summary, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(summary, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(robots_summary_path.with_suffix(".jsonl"), summary)
@@ -368,6 +496,8 @@ class OpenAlexProvider(ProviderPlugin):
         max_pages = int(opts.get("max_pages") or 25)
         timeout_s = float(opts.get("timeout_s") or 30.0)
         throttle_seconds = float(opts.get("throttle_seconds") or 0.0)
+        retry = self._retry_policy(opts)
+        cache = self._http_cache(opts, ctx.out_dir)
         seeds = list(opts.get("extra_seeds") or [])
         if not seeds:
             seeds = list(OPENALEX_DEFAULT_SEEDS)
@@ -393,8 +523,10 @@ class OpenAlexProvider(ProviderPlugin):
                 time.sleep(throttle_seconds)
             try:
                 fetched_at = datetime.now(timezone.utc).isoformat()
-                resp = _http_get(
+                resp = _get_with_retry(
+                    retry,
                     url,
+                    cache=cache,
                     headers=_build_headers(email, user_agent),
                     timeout=timeout_s,
                 )
@@ -452,11 +584,11 @@ class OpenAlexProvider(ProviderPlugin):
         }
 
         (provider_root / "manifest.json").write_text(
-            json.dumps(mirror_manifest, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(mirror_manifest, indent=2) + "\n",
             encoding="utf-8",
         )
         (logs_dir / "mirror_manifest.json").write_text(
-            json.dumps(mirror_manifest, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(mirror_manifest, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(logs_dir / "mirror_manifest.jsonl", manifest)
@@ -469,6 +601,8 @@ class OpenAlexProvider(ProviderPlugin):
         per_page = int(opts.get("per_page") or 25)
         max_pages = int(opts.get("max_pages") or 1)
         timeout_s = float(opts.get("timeout_s") or 30.0)
+        retry = self._retry_policy(opts)
+        cache = self._http_cache(opts, ctx.out_dir)
 
         email = (
             str(opts.get("email") or opts.get("mailto") or "").strip()
@@ -496,8 +630,10 @@ class OpenAlexProvider(ProviderPlugin):
                 params["mailto"] = email
 
             url = f"{OPENALEX_API_BASE}/works"
-            resp = _http_get(
+            resp = _get_with_retry(
+                retry,
                 url,
+                cache=cache,
                 params=params,
                 headers=_build_headers(email, user_agent),
                 timeout=timeout_s,
@@ -506,7 +642,7 @@ class OpenAlexProvider(ProviderPlugin):
             payload = resp.json()
 
             (api_samples_dir / f"works_search_page_{page}.json").write_text(
-                json.dumps(payload, indent=2, ensure_ascii=False) + "\n",
+                json_codec.dumps(payload, indent=2) + "\n",
                 encoding="utf-8",
             )
 
@@ -529,9 +665,13 @@ class OpenAlexProvider(ProviderPlugin):
         registry = load_registry(_default_registry_path())
         normalized, diags = canonicalize_batch(all_works, registry)
 
-        write_jsonl(logs_dir / "raw_provider.jsonl", all_works)
-        write_jsonl(logs_dir / "normalized_canonical.jsonl", normalized)
-        write_jsonl(logs_dir / "mapping_diagnostics.jsonl", diags)
+        write_jsonl(logs_dir / "raw_provider.jsonl", all_works, compact=True)
+        write_jsonl(
+            logs_dir / "normalized_canonical.jsonl", normalized, compact=True
+        )
+        write_jsonl(
+            logs_dir / "mapping_diagnostics.jsonl", diags, compact=True
+        )
         write_jsonl(
             logs_dir / "manifest.jsonl",
             [
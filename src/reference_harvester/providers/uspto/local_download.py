@@ -0,0 +1,427 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from reference_harvester import json_codec
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+# How often (in bytes received) the resume journal is refreshed.
+JOURNAL_INTERVAL = 16 * DEFAULT_CHUNK_SIZE
+
+
+class ByteBudgetExceeded(Exception):
+    """The response body grew past the bytes left in the run budget."""
+
+    def __init__(self, received: int, limit: int) -> None:
+        super().__init__(f"received {received} bytes, budget {limit}")
+        self.received = received
+        self.limit = limit
+
+
+class RangeNotSupported(Exception):
+    """A byte-range request came back as something other than that range."""
+
+
+class UnexpectedStatus(Exception):
+    """A download response was not a 2xx, so its body is not the file."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def part_path_for(dest: Path) -> Path:
+    return dest.with_name(dest.name + ".part")
+
+
+def journal_path_for(dest: Path) -> Path:
+    return dest.with_name(dest.name + ".part.json")
+
+
+@dataclass
+class PartialDownload:
+    """A `.part` file left by an interrupted transfer, plus its journal."""
+
+    dest: Path
+    url: str
+    etag: str | None
+    last_modified: str | None
+    bytes_received: int
+
+    @property
+    def if_range(self) -> str | None:
+        """Validator for `If-Range`; weak ETags are not allowed there."""
+
+        if self.etag and not self.etag.startswith("W/"):
+            return self.etag
+        return self.last_modified
+
+    def matches(self, headers: Any) -> bool:
+        """False when HEAD shows the remote file changed since the part."""
+
+        if headers is None:
+            return True
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if self.etag and etag:
+            return bool(self.etag == etag)
+        if self.last_modified and last_modified:
+            return bool(self.last_modified == last_modified)
+        return True
+
+
+def load_partial(dest: Path, url: str) -> PartialDownload | None:
+    """Return the resumable partial for `dest`, if there is a usable one."""
+
+    part_path = part_path_for(dest)
+    journal_path = journal_path_for(dest)
+    if not part_path.exists() or not journal_path.exists():
+        return None
+    try:
+        journal = json.loads(journal_path.read_text(encoding="utf-8"))
+        size = part_path.stat().st_size
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(journal, dict) or journal.get("url") != url:
+        return None
+    try:
+        journaled = int(journal.get("bytes_received") or 0)
+    except (TypeError, ValueError):
+        return None
+    # Only bytes the journal vouches for are trusted after a crash.
+    received = min(journaled, size)
+    if received <= 0:
+        return None
+    return PartialDownload(
+        dest=dest,
+        url=url,
+        etag=journal.get("etag"),
+        last_modified=journal.get("last_modified"),
+        bytes_received=received,
+    )
+
+
+def discard_partial(dest: Path) -> None:
+    part_path_for(dest).unlink(missing_ok=True)
+    journal_path_for(dest).unlink(missing_ok=True)
+
+
+def _write_journal(
+    dest: Path,
+    *,
+    url: str,
+    etag: str | None,
+    last_modified: str | None,
+    bytes_received: int,
+) -> None:
+    journal_path = journal_path_for(dest)
+    tmp_path = journal_path.with_name(journal_path.name + ".tmp")
+    tmp_path.write_text(
+        json_codec.dumps(
+            {
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "bytes_received": bytes_received,
+                "updated_at": datetime.now(UTC).isoformat(),
+            },
+            indent=2,
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, journal_path)
+
+
+@dataclass
+class StreamedFile:
+    """A fully received body parked in `dest`'s `.part` file.
+
+    `commit` atomically renames it into place and drops the journal;
+    `discard` removes both. Either way the destination never holds a
+    partially written file.
+    """
+
+    dest: Path
+    sha256: str
+    size_bytes: int
+    resumed_from: int = 0
+
+    @property
+    def temp_path(self) -> Path:
+        return part_path_for(self.dest)
+
+    def commit(self, dest: Path | None = None) -> Path:
+        target = dest or self.dest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self.temp_path, target)
+        journal_path_for(self.dest).unlink(missing_ok=True)
+        return target
+
+    def discard(self) -> None:
+        discard_partial(self.dest)
+
+
+def resume_offset(resp: Any, partial: PartialDownload | None) -> int:
+    """Bytes of `partial` that `resp` continues, or 0 to start over.
+
+    A 206 whose Content-Range starts exactly at the partial's end extends
+    it; any other 206 is not the range that was asked for and raises
+    `RangeNotSupported`. A 200 (If-Range failed) is the whole file.
+    """
+
+    if partial is None or int(getattr(resp, "status_code", 0)) != 206:
+        return 0
+    content_range = str(resp.headers.get("Content-Range") or "")
+    if content_range.startswith(f"bytes {partial.bytes_received}-"):
+        return partial.bytes_received
+    raise RangeNotSupported(
+        f"asked for bytes {partial.bytes_received}-,"
+        f" got {content_range or 'no Content-Range'}"
+    )
+
+
+def stream_to_part(
+    resp: Any,
+    dest: Path,
+    *,
+    url: str,
+    partial: PartialDownload | None = None,
+    max_bytes: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamedFile:
+    """Write `resp` (opened with `stream=True`) to `dest`'s `.part` file.
+
+    The sha256 and byte count are updated per chunk so memory use stays
+    at one chunk regardless of file size. When `resp` continues `partial`
+    (see `resume_offset`) the existing bytes are hashed from disk first,
+    so the digest always covers the whole file.
+
+    A journal beside the part records the validators and bytes received
+    so an interrupted transfer can be resumed by a later run. When
+    `max_bytes` is set the transfer is aborted with `ByteBudgetExceeded`
+    (and the partial dropped) as soon as the file size passes it.
+
+    Non-2xx responses raise `UnexpectedStatus` before anything is
+    written, so an error page can never be resumed as the artifact. A
+    206 that does not continue `partial` drops the partial and raises
+    `RangeNotSupported`; the caller should refetch without a range.
+    """
+
+    status_code = int(getattr(resp, "status_code", 0) or 0)
+    if not 200 <= status_code < 300:
+        close = getattr(resp, "close", None)
+        if callable(close):
+            close()
+        raise UnexpectedStatus(status_code)
+    try:
+        offset = resume_offset(resp, partial)
+    except RangeNotSupported:
+        discard_partial(dest)
+        close = getattr(resp, "close", None)
+        if callable(close):
+            close()
+        raise
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part_path = part_path_for(dest)
+    headers = resp.headers
+    etag = headers.get("ETag") or (partial.etag if offset else None)
+    last_modified = headers.get("Last-Modified") or (
+        partial.last_modified if offset else None
+    )
+    hasher = hashlib.sha256()
+    received = 0
+    try:
+        if offset:
+            with part_path.open("rb") as existing:
+                remaining = offset
+                while remaining > 0:
+                    block = existing.read(min(chunk_size, remaining))
+                    if not block:
+                        break
+                    hasher.update(block)
+                    remaining -= len(block)
+            received = offset - remaining
+            handle = part_path.open("r+b")
+            handle.seek(received)
+            handle.truncate()
+        else:
+            handle = part_path.open("wb")
+        _write_journal(
+            dest,
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            bytes_received=received,
+        )
+        journaled = received
+        try:
+            with handle:
+                for chunk in resp.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
+                    size = received + len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise ByteBudgetExceeded(size, max_bytes)
+                    hasher.update(chunk)
+                    handle.write(chunk)
+                    received += len(chunk)
+                    if received - journaled >= JOURNAL_INTERVAL:
+                        handle.flush()
+                        _write_journal(
+                            dest,
+                            url=url,
+                            etag=etag,
+                            last_modified=last_modified,
+                            bytes_received=received,
+                        )
+                        journaled = received
+        except ByteBudgetExceeded:
+            discard_partial(dest)
+            raise
+        except BaseException:
+            # Keep the part for the next run; the journal records exactly
+            # the bytes that made it to disk.
+            _write_journal(
+                dest,
+                url=url,
+                etag=etag,
+                last_modified=last_modified,
+                bytes_received=received,
+            )
+            raise
+    finally:
+        close = getattr(resp, "close", None)
+        if callable(close):
+            close()
+    return StreamedFile(
+        dest=dest,
+        sha256=hasher.hexdigest(),
+        size_bytes=received,
+        resumed_from=offset,
+    )
+
+
+def plan_ranges(size: int, parts: int) -> list[tuple[int, int]]:
+    """Split `size` bytes into at most `parts` inclusive ranges."""
+
+    if size <= 0:
+        return []
+    parts = max(1, min(int(parts), size))
+    step, extra = divmod(size, parts)
+    ranges: list[tuple[int, int]] = []
+    start = 0
+    for idx in range(parts):
+        length = step + (1 if idx < extra else 0)
+        ranges.append((start, start + length - 1))
+        start += length
+    return ranges
+
+
+def _hash_file(path: Path, chunk_size: int) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(chunk_size), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def download_ranges(
+    fetch_range: Callable[[int, int], Any],
+    dest: Path,
+    *,
+    size: int,
+    parts: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> StreamedFile:
+    """Fetch `size` bytes as `parts` concurrent byte ranges into `.part`.
+
+    `fetch_range(start, end)` must return a streamed response for the
+    inclusive range; anything but a 206 with a matching Content-Range,
+    or a range that ends early or overruns, raises `RangeNotSupported` so
+    the caller can fall back to a single stream. The part file is
+    preallocated and each range writes at its own offset through a
+    separate handle. The sha256 is computed in a final pass over the
+    finished file. On any error the part is removed (multi-part
+    transfers are not journaled for resume).
+    """
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    part_path = part_path_for(dest)
+    journal_path_for(dest).unlink(missing_ok=True)
+    with part_path.open("wb") as handle:
+        handle.truncate(size)
+
+    def _fetch(span: tuple[int, int]) -> None:
+        start, end = span
+        resp = fetch_range(start, end)
+        try:
+            content_range = str(resp.headers.get("Content-Range") or "")
+            if int(resp.status_code) != 206 or not content_range.startswith(
+                f"bytes {start}-{end}/"
+            ):
+                raise RangeNotSupported(
+                    f"expected bytes {start}-{end}, got "
+                    f"{resp.status_code} {content_range or '-'}"
+                )
+            pos = start
+            with part_path.open("r+b") as handle:
+                handle.seek(start)
+                for chunk in resp.iter_content(chunk_size=chunk_size):
+                    if not chunk:
+                        continue
+                    if pos + len(chunk) > end + 1:
+                        raise RangeNotSupported(f"range {start}-{end} overran")
+                    handle.write(chunk)
+                    pos += len(chunk)
+            if pos != end + 1:
+                raise RangeNotSupported(
+                    f"range {start}-{end} ended at byte {pos}"
+                )
+        finally:
+            close = getattr(resp, "close", None)
+            if callable(close):
+                close()
+
+    spans = plan_ranges(size, parts)
+    try:
+        with ThreadPoolExecutor(max_workers=len(spans) or 1) as pool:
+            futures = [pool.submit(_fetch, span) for span in spans]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        sha = _hash_file(part_path, chunk_size)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    return StreamedFile(dest=dest, sha256=sha, size_bytes=size)
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "ByteBudgetExceeded",
+    "PartialDownload",
+    "RangeNotSupported",
+    "StreamedFile",
+    "UnexpectedStatus",
+    "discard_partial",
+    "download_ranges",
+    "journal_path_for",
+    "load_partial",
+    "part_path_for",
+    "plan_ranges",
+    "resume_offset",
+    "stream_to_part",
+]
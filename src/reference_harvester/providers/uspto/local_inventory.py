@@ -8,6 +8,8 @@ from urllib.parse import urlparse
 
 import yaml
 
+from reference_harvester import json_codec
+
 
 @dataclass
 class Endpoint:
@@ -90,7 +92,7 @@ def write_inventory_json(path: Path, endpoints: Iterable[Endpoint]) -> None:
             }
         )
     path.write_text(
-        json.dumps(payload, indent=2, ensure_ascii=False) + "\n",
+        json_codec.dumps(payload, indent=2) + "\n",
         encoding="utf-8",
     )
 
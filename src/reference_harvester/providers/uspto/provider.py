@@ -1,20 +1,77 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
-from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Callable, Iterable, Mapping, cast
+from typing import Any, Callable, Iterable, Iterator, Mapping, MutableSet, cast
 from urllib.parse import parse_qs, urlencode, urlparse
 
 import reference_harvester.endnote_xml as endnote_xml
-from reference_harvester.canonicalizer import canonicalize_batch
+from reference_harvester import json_codec
+from reference_harvester.blob_store import BlobRef, BlobStore, blob_root_for
+from reference_harvester.browser_pool import (
+    BrowserError,
+    BrowserPool,
+    BrowserUnavailable,
+    RenderedPage,
+)
+from reference_harvester.canonicalizer import (
+    canonicalize_batch,
+    iter_canonicalized,
+)
+from reference_harvester.concurrency import (
+    DEFAULT_INITIAL_WINDOW,
+    DEFAULT_MAX_WINDOW,
+    AdaptiveConcurrency,
+)
+from reference_harvester.crawl_checkpoint import (
+    DEFAULT_CHECKPOINT_EVERY,
+    CrawlCheckpoint,
+)
+from reference_harvester.crawl_engine import (
+    AsyncCrawlEngine,
+    CrawlTask,
+    PatternScorer,
+)
+from reference_harvester.fetch_registry import (
+    DEFAULT_REGISTRY_MAX_BYTES,
+    FetchRegistry,
+)
+from reference_harvester.http_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    HttpCache,
+    cache_root_for,
+)
+from reference_harvester.link_extractor import (
+    LINK_ASSET,
+    LINK_ATTACHMENT,
+    LinkExtractor,
+    extract_links,
+)
 from reference_harvester.log_utils import write_jsonl
+from reference_harvester.manifest_log import ManifestLog
 from reference_harvester.providers.base import ProviderContext, ProviderPlugin
 from reference_harvester.providers.uspto.local_constants import (
     USPTO_PROVIDER_ID,
 )
+from reference_harvester.providers.uspto.local_download import (
+    ByteBudgetExceeded,
+    PartialDownload,
+    RangeNotSupported,
+    StreamedFile,
+    UnexpectedStatus,
+    discard_partial,
+    download_ranges,
+    load_partial,
+    part_path_for,
+    stream_to_part,
+)
 from reference_harvester.providers.uspto.local_export import (
     USPTOExportConfig,
     mirror_docs,
@@ -33,16 +90,35 @@ from reference_harvester.providers.uspto.local_storage import (
 from reference_harvester.providers.uspto.local_storage import (
     path_for_url as _path_for_url,
 )
+from reference_harvester.rate_limit import HostRateLimiter
 from reference_harvester.registry import load_registry
+from reference_harvester.retry import CircuitBreaker, RetryPolicy
+from reference_harvester.robots_cache import DEFAULT_ROBOTS_TTL, RobotsCache
+from reference_harvester.run_index import RunIndex, index_path_for
 from reference_harvester.schema_validation import (
     load_json,
     validate_json_file,
     write_report,
 )
+from reference_harvester.seen_set import CompactUrlSet
 from reference_harvester.sidecars import (
+    SIDECAR_STREAM,
     build_sidecar_envelope,
     write_sidecar_json,
+    write_sidecar_json_streaming,
+)
+from reference_harvester.simhash import (
+    DEFAULT_MAX_DISTANCE,
+    SimHashIndex,
+    text_fingerprint,
 )
+from reference_harvester.sitemaps import (
+    DEFAULT_MAX_SITEMAPS,
+    SitemapError,
+    SitemapWalker,
+    parse_lastmod,
+)
+from reference_harvester.transport import HttpTransport
 
 _DEFAULT_SEEDS: tuple[str, ...] = (
     "https://developer.uspto.gov/api-catalog/",
@@ -224,6 +300,19 @@ _ATTACHMENT_EXTS = {
     ".xml",
 }
 
+# Crawl priority boosts (regex, bonus): documents and API docs first,
+# news-style pages last.
+_CRAWL_BOOSTS: tuple[tuple[str, float], ...] = (
+    (r"/documents?/", 1.5),
+    (r"\.(pdf|json|ya?ml)$", 1.0),
+    (r"/apis?/|api-catalog|api-docs|swagger|openapi", 1.0),
+    (r"/(news|blog|events?|careers|about)(/|$)", -1.0),
+)
+
+# Where the crawl frontier comes from: followed links, sitemap entries,
+# or both.
+_CRAWL_DISCOVERY_MODES = ("links", "sitemaps", "both")
+
 _import_harvester_module: Any | None = None
 _ensure_harvester_on_path: Any | None = None
 
@@ -238,6 +327,162 @@ def _host_allowed(host: str) -> bool:
     return False
 
 
+def _conditional_headers(
+    prev_entry: Mapping[str, Any] | None,
+) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if prev_entry:
+        if prev_entry.get("etag"):
+            headers["If-None-Match"] = str(prev_entry.get("etag"))
+        if prev_entry.get("last_modified"):
+            headers["If-Modified-Since"] = str(prev_entry.get("last_modified"))
+    return headers
+
+
+def _blob_fields(blobs: BlobStore, ref: BlobRef) -> dict[str, Any]:
+    """Manifest fields locating a body in the blob store.
+
+    Compressed blobs get no URL-path view, so their records carry
+    `local_path: null` and `blob_path` (with `blob_compression`) is the
+    only place the body can be read from.
+    """
+
+    fields: dict[str, Any] = {
+        "blob_path": ref.path.relative_to(blobs.root.parent).as_posix(),
+    }
+    if ref.compression:
+        fields["blob_compression"] = ref.compression
+        fields["blob_stored_bytes"] = ref.stored_bytes
+    return fields
+
+
+def _write_body(dest: Path, body: bytes) -> None:
+    """Write `body` to `dest` through a temp file and an atomic rename.
+
+    `dest` may be a hardlink into the blob store left by an earlier run;
+    replacing it, rather than writing through it, keeps that blob intact.
+    """
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest.with_name(dest.name + ".tmp")
+    try:
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, dest)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _open_stage_index(
+    out_root: Path,
+    origin: str,
+    records: Iterable[Mapping[str, Any]],
+) -> RunIndex:
+    """Open the provider root's index, seeding `origin` on first use."""
+
+    index = RunIndex(index_path_for(out_root))
+    _seed_stage_index(index, origin, records)
+    return index
+
+
+def _seed_stage_index(
+    index: RunIndex,
+    origin: str,
+    records: Iterable[Mapping[str, Any]],
+) -> None:
+    """Index `records` unless `origin` already is; consumes them either way.
+
+    Stages pass their one lazy pass over the manifest, so the records are
+    read even when the index needs none of them.
+    """
+
+    if not index.count(origin):
+        # Manifests written before the index existed are indexed once.
+        index.record_fetches(origin, records)
+        return
+    for _record in records:
+        pass
+
+
+class _CrawlHistory:
+    """What a crawl knows of earlier fetches: records by URL, paths by sha.
+
+    `load` takes the records of the manifest the crawl starts from and
+    `stored` every record the crawl writes; both are kept in dicts.
+    """
+
+    def __init__(self) -> None:
+        self.records: dict[str, dict[str, Any]] = {}
+        self.paths: dict[str, str] = {}
+
+    def load(self, record: dict[str, Any]) -> None:
+        self.records[str(record.get("url") or "")] = record
+        self.stored(record)
+
+    def stored(self, record: Mapping[str, Any]) -> None:
+        sha = record.get("sha256")
+        local_path = record.get("local_path")
+        if isinstance(sha, str) and isinstance(local_path, str):
+            self.paths.setdefault(sha, local_path)
+
+    def previous(self, url: str) -> dict[str, Any] | None:
+        return self.records.get(url)
+
+    def known(self, url: str) -> bool:
+        return self.previous(url) is not None
+
+    def local_path(self, sha: str) -> str | None:
+        return self.paths.get(sha)
+
+
+class _IndexedCrawlHistory(_CrawlHistory):
+    """`_CrawlHistory` answered by the run index, for compact crawls.
+
+    The index already holds every manifest record and each record the
+    crawl writes, so nothing is kept in memory.
+    """
+
+    def __init__(self, index: RunIndex, origin: str) -> None:
+        super().__init__()
+        self.index = index
+        self.origin = origin
+
+    def load(self, record: dict[str, Any]) -> None:
+        return
+
+    def stored(self, record: Mapping[str, Any]) -> None:
+        return
+
+    def previous(self, url: str) -> dict[str, Any] | None:
+        return self.index.fetch(self.origin, url)
+
+    def local_path(self, sha: str) -> str | None:
+        return self.index.local_path(sha, origin=self.origin)
+
+
+def _parse_host_intervals(raw: Any) -> tuple[tuple[str, float], ...]:
+    """Normalize `host_rate_limits` ({host: seconds} or "host=seconds")."""
+
+    if not raw:
+        return ()
+    if isinstance(raw, Mapping):
+        pairs = list(raw.items())
+    else:
+        pairs = []
+        for item in raw:
+            host, sep, seconds = str(item).partition("=")
+            if sep:
+                pairs.append((host, seconds))
+    parsed: dict[str, float] = {}
+    for host, seconds in pairs:
+        host_val = str(host).strip().lower()
+        try:
+            parsed[host_val] = max(0.0, float(seconds))
+        except (TypeError, ValueError):
+            continue
+    return tuple(sorted((h, v) for h, v in parsed.items() if h))
+
+
 @dataclass(frozen=True)
 class USPTOSettings:
     user_agent: str = "reference-harvester/0.1"
@@ -245,6 +490,19 @@ class USPTOSettings:
     max_retries: int = 3
     backoff_factor: float = 0.5
     throttle_seconds: float = 0.0
+    pool_connections: int = 16
+    pool_maxsize: int = 8
+    host_intervals: tuple[tuple[str, float], ...] = ()
+    breaker_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+    robots_ttl_seconds: float = DEFAULT_ROBOTS_TTL
+    http_cache_dir: str | None = None
+    http_cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    adaptive_concurrency: bool = True
+    adaptive_initial: int = DEFAULT_INITIAL_WINDOW
+    adaptive_max: int = DEFAULT_MAX_WINDOW
+    blob_dir: str | None = None
+    blob_compression: str | None = None
 
     @classmethod
     def from_options(cls, options: Mapping[str, Any]) -> USPTOSettings:
@@ -256,16 +514,67 @@ class USPTOSettings:
             throttle_seconds=float(
                 options.get("throttle_seconds", cls.throttle_seconds)
             ),
+            pool_connections=int(
+                options.get("pool_connections", cls.pool_connections)
+            ),
+            pool_maxsize=int(options.get("pool_maxsize", cls.pool_maxsize)),
+            host_intervals=_parse_host_intervals(
+                options.get("host_rate_limits")
+            ),
+            breaker_threshold=int(
+                options.get("breaker_threshold", cls.breaker_threshold)
+            ),
+            breaker_reset_seconds=float(
+                options.get("breaker_reset_seconds", cls.breaker_reset_seconds)
+            ),
+            robots_ttl_seconds=float(
+                options.get("robots_ttl_seconds", cls.robots_ttl_seconds)
+            ),
+            http_cache_dir=(
+                str(options["http_cache_dir"])
+                if options.get("http_cache_dir")
+                else None
+            ),
+            http_cache_max_bytes=int(
+                options.get("http_cache_max_bytes", cls.http_cache_max_bytes)
+            ),
+            adaptive_concurrency=bool(
+                options.get("adaptive_concurrency", cls.adaptive_concurrency)
+            ),
+            adaptive_initial=int(
+                options.get("adaptive_initial", cls.adaptive_initial)
+            ),
+            adaptive_max=int(options.get("adaptive_max", cls.adaptive_max)),
+            blob_dir=(
+                str(options["blob_dir"]) if options.get("blob_dir") else None
+            ),
+            blob_compression=(
+                str(options["blob_compression"])
+                if options.get("blob_compression")
+                else None
+            ),
         )
 
 
 class USPTOProvider(ProviderPlugin):
     """USPTO provider using vendored helpers only (no sibling harvester)."""
 
-    def __init__(self) -> None:
+    # Built on first use and shared by the stages of one provider. The
+    # class-level defaults also cover instances created without __init__.
+    _shared_blobs: tuple[tuple[str, str | None], BlobStore] | None = None
+    _shared_transport: tuple[USPTOSettings, HttpTransport] | None = None
+    _shared_robots: (
+        tuple[tuple[USPTOSettings, Path | None], RobotsCache] | None
+    ) = None
+
+    def __init__(self, transport: HttpTransport | None = None) -> None:
         self.export_config_cls = USPTOExportConfig
         self.registry_path = Path(__file__).resolve().parents[2] / "registry"
         self.registry_path /= "uspto_fields.yaml"
+        self.transport = transport
+        self._shared_blobs = None
+        self._shared_transport = None
+        self._shared_robots = None
 
     def _parse_since(self, raw: Any) -> datetime | None:
         if not raw:
@@ -278,8 +587,150 @@ class USPTOProvider(ProviderPlugin):
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed
 
-    def _settings_from_ctx(self, options: Mapping[str, Any]) -> USPTOSettings:
-        return USPTOSettings.from_options(options)
+    def _settings_from_ctx(
+        self,
+        options: Mapping[str, Any],
+        out_dir: Path | None = None,
+    ) -> USPTOSettings:
+        settings = USPTOSettings.from_options(options)
+        if (
+            settings.http_cache_dir is None
+            and out_dir is not None
+            and options.get("http_cache", True)
+        ):
+            # One cache per provider, shared by every run-id under it.
+            cache_dir = cache_root_for(out_dir.resolve())
+            settings = replace(settings, http_cache_dir=str(cache_dir))
+        if (
+            settings.blob_dir is None
+            and out_dir is not None
+            and options.get("blob_store", True)
+        ):
+            # Bodies are stored once per provider, whatever the run-id.
+            blob_dir = blob_root_for(out_dir.resolve())
+            settings = replace(settings, blob_dir=str(blob_dir))
+        return settings
+
+    def _blob_store_for(self, settings: USPTOSettings) -> BlobStore | None:
+        """Return the provider's content-addressed body store, if enabled."""
+
+        if not settings.blob_dir:
+            return None
+        key = (settings.blob_dir, settings.blob_compression)
+        cached = self._shared_blobs
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        store = BlobStore(
+            Path(settings.blob_dir), compression=settings.blob_compression
+        )
+        self._shared_blobs = (key, store)
+        return store
+
+    def _transport_for(self, settings: USPTOSettings) -> HttpTransport:
+        """Return the shared transport, building one from `settings`.
+
+        An injected `self.transport` always wins. Otherwise one pooled
+        transport is kept per provider and rebuilt only when the settings
+        change between calls.
+        """
+
+        injected = getattr(self, "transport", None)
+        if injected is not None:
+            return injected
+        cached = self._shared_transport
+        if cached is not None and cached[0] == settings:
+            return cached[1]
+        if cached is not None:
+            cached[1].close()
+        max_attempts = max(1, settings.max_retries)
+        transport = HttpTransport(
+            user_agent=settings.user_agent,
+            timeout=settings.http_timeout,
+            pool_connections=settings.pool_connections,
+            pool_maxsize=settings.pool_maxsize,
+            rate_limiter=HostRateLimiter(
+                overrides=dict(settings.host_intervals),
+            ),
+            retry=RetryPolicy(
+                max_attempts=max_attempts,
+                base_delay=settings.backoff_factor,
+                max_delay=settings.backoff_factor * max_attempts,
+                breaker=CircuitBreaker(
+                    failure_threshold=settings.breaker_threshold,
+                    reset_after=settings.breaker_reset_seconds,
+                ),
+            ),
+            cache=(
+                HttpCache(
+                    Path(settings.http_cache_dir),
+                    max_bytes=settings.http_cache_max_bytes,
+                )
+                if settings.http_cache_dir
+                else None
+            ),
+            concurrency=(
+                AdaptiveConcurrency(
+                    initial=settings.adaptive_initial,
+                    maximum=settings.adaptive_max,
+                )
+                if settings.adaptive_concurrency
+                else None
+            ),
+        )
+        self._shared_transport = (settings, transport)
+        return transport
+
+    def _robots_cache_for(
+        self,
+        settings: USPTOSettings,
+        *,
+        store_dir: Path | None,
+    ) -> RobotsCache:
+        """Return the provider's robots.txt cache for `store_dir`.
+
+        Inventory and crawl stages share one cache (and its parsed rules)
+        as long as they use the same settings and store.
+        """
+
+        import requests
+
+        cached = self._shared_robots
+        if cached is not None and cached[0] == (settings, store_dir):
+            return cached[1]
+
+        def _fetch(url: str) -> tuple[int, str]:
+            resp = self._transport_for(settings).get(url)
+            return int(resp.status_code), resp.text
+
+        robots = RobotsCache(
+            _fetch,
+            store_dir=store_dir,
+            ttl=settings.robots_ttl_seconds,
+            errors=(requests.RequestException,),
+        )
+        self._shared_robots = ((settings, store_dir), robots)
+        return robots
+
+    def _load_robots_crawl_delays(
+        self,
+        *,
+        artifacts: Path,
+        settings: USPTOSettings,
+    ) -> None:
+        """Seed per-host pacing from a previous `robots_inventory.json`."""
+
+        limiter = getattr(self._transport_for(settings), "rate_limiter", None)
+        inventory_path = artifacts / "robots_inventory.json"
+        if limiter is None or not inventory_path.exists():
+            return
+        try:
+            records = json_codec.loads(
+                inventory_path.read_text(encoding="utf-8")
+            )
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(records, list):
+            limiter.apply_robots_records(records)
 
     def refresh_inventory(self, ctx: ProviderContext) -> None:
         from importlib import resources
@@ -289,7 +740,7 @@ class USPTOProvider(ProviderPlugin):
         provider_home.mkdir(parents=True, exist_ok=True)
         store = StorePaths(out_root=provider_root)
         artifacts = store.artifacts_root(USPTO_PROVIDER_ID)
-        settings = self._settings_from_ctx(ctx.options)
+        settings = self._settings_from_ctx(ctx.options, ctx.out_dir)
         throttle_seconds = float(
             ctx.options.get(
                 "inventory_throttle_seconds",
@@ -335,6 +786,9 @@ class USPTOProvider(ProviderPlugin):
             artifacts=artifacts,
             settings=settings,
             throttle_seconds=throttle_seconds,
+            browser_concurrency=int(
+                ctx.options.get("browser_concurrency") or 4
+            ),
         )
 
         swagger_urls = ctx.options.get("swagger_urls") or list(_DEFAULT_SWAGGER_URLS)
@@ -348,13 +802,15 @@ class USPTOProvider(ProviderPlugin):
             artifacts=artifacts,
             settings=settings,
             throttle_seconds=throttle_seconds,
+            concurrency=int(ctx.options.get("catalog_concurrency") or 8),
         )
 
         discovered_hosts = self._collect_hosts_from_artifacts(artifacts)
-        missing_hosts = sorted(discovered_hosts - processed_robots_hosts)
-        if missing_hosts:
+        if discovered_hosts - processed_robots_hosts:
+            # Hosts seen in the first pass come from the robots cache, so
+            # this only fetches the new ones and rewrites the full inventory.
             self._inventory_robots(
-                hosts=missing_hosts,
+                hosts=sorted(processed_robots_hosts | discovered_hosts),
                 artifacts=artifacts,
                 settings=settings,
             )
@@ -421,7 +877,7 @@ class USPTOProvider(ProviderPlugin):
         max_pages = int(opts.get("max_pages", 200))
         include_assets = bool(opts.get("include_assets", True))
         max_assets = int(opts.get("max_assets", 2000))
-        settings = self._settings_from_ctx(opts)
+        settings = self._settings_from_ctx(opts, ctx.out_dir)
         ctx.out_dir.mkdir(parents=True, exist_ok=True)
         harvester_out = ctx.out_dir
         harvester_out.mkdir(parents=True, exist_ok=True)
@@ -447,16 +903,30 @@ class USPTOProvider(ProviderPlugin):
         max_assets = int(opts.get("max_assets", 2000))
         max_depth = int(opts.get("max_depth", 4))
         max_files = int(opts.get("max_files", 200))
-        settings = self._settings_from_ctx(opts)
+        settings = self._settings_from_ctx(opts, ctx.out_dir)
         api_key = opts.get("api_key")
         api_key_env = str(opts.get("api_key_env", "USPTO_ODP_API"))
         browser_fallback = bool(opts.get("browser_fallback", False))
         browser_timeout_ms = int(opts.get("browser_timeout_ms", 60_000))
+        browser_concurrency = int(opts.get("browser_concurrency") or 4)
         convert_html_to_md = bool(opts.get("convert_html_to_md", True))
         emit_ris = bool(opts.get("emit_ris", True))
         emit_csl_json = bool(opts.get("emit_csl_json", False))
         emit_bibtex = bool(opts.get("emit_bibtex", False))
         max_attachments = int(opts.get("max_attachments", 200))
+        crawl_concurrency = int(opts.get("crawl_concurrency", 8))
+        crawl_per_host = int(opts.get("crawl_per_host", 2))
+        crawl_host_budget = int(opts.get("crawl_host_budget") or 0)
+        crawl_resume = bool(opts.get("resume", False))
+        crawl_compact_seen = bool(opts.get("compact_seen", False))
+        crawl_discovery = str(opts.get("discovery") or "links")
+        max_sitemaps = int(opts.get("max_sitemaps") or DEFAULT_MAX_SITEMAPS)
+        near_duplicate_distance = int(
+            opts.get("near_duplicate_distance", DEFAULT_MAX_DISTANCE)
+        )
+        crawl_checkpoint_every = int(
+            opts.get("crawl_checkpoint_every") or DEFAULT_CHECKPOINT_EVERY
+        )
         extra_seeds = opts.get("extra_seeds")
         allow_hosts = {h.lower() for h in opts.get("allow_host", []) or []}
         deny_hosts = {h.lower() for h in opts.get("deny_host", []) or []}
@@ -464,7 +934,12 @@ class USPTOProvider(ProviderPlugin):
         deny_bulk = {h.lower() for h in opts.get("deny_bulk", []) or []}
         max_bulk = int(opts.get("max_bulk", 50))
         max_bulk_bytes = int(opts.get("max_bulk_bytes", 10_000_000_000))
+        bulk_parallel_parts = int(opts.get("bulk_parallel_parts") or 1)
+        bulk_parallel_min_bytes = int(
+            opts.get("bulk_parallel_min_bytes") or 256 * 1024 * 1024
+        )
         api_sample_limit = int(opts.get("api_sample_limit", 25))
+        api_sample_concurrency = int(opts.get("api_sample_concurrency") or 8)
         validate_schema = bool(opts.get("validate_schema", False))
         default_schema_path = (
             Path("docs")
@@ -506,126 +981,184 @@ class USPTOProvider(ProviderPlugin):
         )
         run_uspto_export(cfg)
 
-        self._harvest_additional_subdomains(
-            out_root=ctx.out_dir,
-            settings=settings,
-            max_pages=max_pages,
-            max_attachments=max_attachments,
-            extra_seeds=extra_seeds,
-            allow_hosts=allow_hosts,
-            deny_hosts=deny_hosts,
-            throttle_seconds=throttle_seconds,
-            max_depth=max_depth,
-            since=since_dt,
+        # Stages overlap (seeds, XHR pages, robots, swagger URLs): one
+        # registry per run fetches each URL once and records who used it.
+        registry = FetchRegistry(
+            max_bytes=int(
+                opts.get("fetch_registry_max_bytes")
+                or DEFAULT_REGISTRY_MAX_BYTES
+            )
         )
+        transport = self._transport_for(settings)
+        transport.registry = registry
+        try:
+            provider_root = ctx.out_dir / "raw" / "harvester"
+            provider_root.mkdir(parents=True, exist_ok=True)
+            provider_home = provider_root / USPTO_PROVIDER_ID
+            provider_home.mkdir(parents=True, exist_ok=True)
+            store = StorePaths(out_root=provider_root)
+            artifacts = store.artifacts_root(USPTO_PROVIDER_ID)
+            self._load_robots_crawl_delays(
+                artifacts=artifacts, settings=settings
+            )
 
-        from importlib import resources
+            registry.begin_stage("crawl")
+            self._harvest_additional_subdomains(
+                out_root=ctx.out_dir,
+                settings=settings,
+                max_pages=max_pages,
+                max_attachments=max_attachments,
+                extra_seeds=extra_seeds,
+                allow_hosts=allow_hosts,
+                deny_hosts=deny_hosts,
+                throttle_seconds=throttle_seconds,
+                max_depth=max_depth,
+                since=since_dt,
+                concurrency=crawl_concurrency,
+                per_host_concurrency=crawl_per_host,
+                host_page_budget=crawl_host_budget,
+                resume=crawl_resume,
+                checkpoint_every=crawl_checkpoint_every,
+                compact_seen=crawl_compact_seen,
+                discovery=crawl_discovery,
+                sitemap_urls=self._merge_unique_urls(
+                    opts.get("sitemap_urls") or [],
+                    self._sitemaps_from_robots_inventory(artifacts),
+                ),
+                max_sitemaps=max_sitemaps,
+                near_duplicate_distance=near_duplicate_distance,
+                robots=self._robots_cache_for(
+                    settings, store_dir=artifacts / "robots"
+                ),
+            )
 
-        importer = globals().get("_import_harvester_module")
-        inventory_mod: Any | None = None
-        if callable(importer):
-            try:
-                inventory_mod = importer("harvester.providers.uspto.inventory")
-            except ImportError:
-                inventory_mod = None
+            from importlib import resources
 
-        extract_fn = getattr(
-            inventory_mod,
-            "extract_endpoints",
-            extract_endpoints,
-        )
-        write_json_fn = getattr(
-            inventory_mod,
-            "write_inventory_json",
-            write_inventory_json,
-        )
-        write_md_fn = getattr(
-            inventory_mod,
-            "write_inventory_md",
-            write_inventory_md,
-        )
-        load_spec_fn = getattr(inventory_mod, "load_openapi", load_openapi)
+            importer = globals().get("_import_harvester_module")
+            inventory_mod: Any | None = None
+            if callable(importer):
+                try:
+                    inventory_mod = importer(
+                        "harvester.providers.uspto.inventory"
+                    )
+                except ImportError:
+                    inventory_mod = None
 
-        provider_root = ctx.out_dir / "raw" / "harvester"
-        provider_root.mkdir(parents=True, exist_ok=True)
-        provider_home = provider_root / USPTO_PROVIDER_ID
-        provider_home.mkdir(parents=True, exist_ok=True)
-        store = StorePaths(out_root=provider_root)
-        artifacts = store.artifacts_root(USPTO_PROVIDER_ID)
-        xhr_pages = opts.get("xhr_pages") or list(_DEFAULT_XHR_PAGES)
-        self._inventory_xhr_endpoints(
-            pages=xhr_pages,
-            artifacts=artifacts,
-            settings=settings,
-            throttle_seconds=throttle_seconds,
-            use_playwright=browser_fallback,
-        )
+            extract_fn = getattr(
+                inventory_mod,
+                "extract_endpoints",
+                extract_endpoints,
+            )
+            write_json_fn = getattr(
+                inventory_mod,
+                "write_inventory_json",
+                write_inventory_json,
+            )
+            write_md_fn = getattr(
+                inventory_mod,
+                "write_inventory_md",
+                write_inventory_md,
+            )
+            load_spec_fn = getattr(inventory_mod, "load_openapi", load_openapi)
 
-        swagger_urls = opts.get("swagger_urls") or list(_DEFAULT_SWAGGER_URLS)
-        swagger_urls = self._merge_unique_urls(
-            swagger_urls,
-            self._discover_swagger_urls_from_xhr(artifacts),
-        )
-        endpoints_md_columns = opts.get("endpoints_md_columns")
-        coverage_md_columns = opts.get("coverage_md_columns")
+            xhr_pages = opts.get("xhr_pages") or list(_DEFAULT_XHR_PAGES)
+            registry.begin_stage("xhr_inventory")
+            self._inventory_xhr_endpoints(
+                pages=xhr_pages,
+                artifacts=artifacts,
+                settings=settings,
+                throttle_seconds=throttle_seconds,
+                use_playwright=browser_fallback,
+                browser_concurrency=browser_concurrency,
+            )
 
-        specs = self._fetch_swagger_specs(
-            swagger_urls=swagger_urls,
-            artifacts_dir=artifacts,
-            settings=settings,
-        )
+            swagger_urls = opts.get("swagger_urls") or list(
+                _DEFAULT_SWAGGER_URLS
+            )
+            swagger_urls = self._merge_unique_urls(
+                swagger_urls,
+                self._discover_swagger_urls_from_xhr(artifacts),
+            )
+            endpoints_md_columns = opts.get("endpoints_md_columns")
+            coverage_md_columns = opts.get("coverage_md_columns")
 
-        if not specs:
-            packaged = resources.files("reference_harvester.providers.uspto")
-            packaged = packaged.joinpath("resources/swagger.yaml")
-            spec_path = Path(str(packaged))
-            spec = cast(dict[str, Any], load_spec_fn(spec_path))
-            specs = [("packaged", spec_path, spec)]
+            registry.begin_stage("swagger")
+            specs = self._fetch_swagger_specs(
+                swagger_urls=swagger_urls,
+                artifacts_dir=artifacts,
+                settings=settings,
+            )
 
-        self._emit_swagger_artifacts(
-            specs=specs,
-            artifacts=artifacts,
-            endpoints_md_columns=endpoints_md_columns,
-            coverage_md_columns=coverage_md_columns,
-            extract_fn=cast(
-                Callable[[Mapping[str, Any]], Iterable[Endpoint]], extract_fn
-            ),
-            write_json_fn=cast(
-                Callable[[Path, Iterable[Endpoint]], None], write_json_fn
-            ),
-            write_md_fn=cast(
-                Callable[[Path, Iterable[Endpoint]], None],
-                write_md_fn,
-            ),
-        )
+            if not specs:
+                packaged = resources.files(
+                    "reference_harvester.providers.uspto"
+                )
+                packaged = packaged.joinpath("resources/swagger.yaml")
+                spec_path = Path(str(packaged))
+                spec = cast(dict[str, Any], load_spec_fn(spec_path))
+                specs = [("packaged", spec_path, spec)]
 
-        self._sample_api_endpoints(
-            out_root=provider_home,
-            settings=settings,
-            sample_limit=api_sample_limit,
-            throttle_seconds=throttle_seconds,
-            since=since_dt,
-        )
+            self._emit_swagger_artifacts(
+                specs=specs,
+                artifacts=artifacts,
+                endpoints_md_columns=endpoints_md_columns,
+                coverage_md_columns=coverage_md_columns,
+                extract_fn=cast(
+                    Callable[[Mapping[str, Any]], Iterable[Endpoint]],
+                    extract_fn,
+                ),
+                write_json_fn=cast(
+                    Callable[[Path, Iterable[Endpoint]], None], write_json_fn
+                ),
+                write_md_fn=cast(
+                    Callable[[Path, Iterable[Endpoint]], None],
+                    write_md_fn,
+                ),
+            )
 
-        if validate_schema:
-            self._validate_api_samples_schema(
-                provider_home=provider_home,
-                schema_path=schema_path,
+            registry.begin_stage("api_samples")
+            self._sample_api_endpoints(
+                out_root=provider_home,
+                settings=settings,
+                sample_limit=api_sample_limit,
+                throttle_seconds=throttle_seconds,
+                since=since_dt,
+                concurrency=api_sample_concurrency,
             )
 
-        self._download_bulk_artifacts(
-            out_root=provider_home,
-            settings=settings,
-            bulk_urls=self._load_discovered_bulk_urls(artifacts) + bulk_urls,
-            allow_hosts=allow_bulk or allow_hosts,
-            deny_hosts=deny_bulk or deny_hosts,
-            max_bulk=max_bulk,
-            max_bulk_bytes=max_bulk_bytes,
-            throttle_seconds=throttle_seconds,
-            since=since_dt,
+            if validate_schema:
+                self._validate_api_samples_schema(
+                    provider_home=provider_home,
+                    schema_path=schema_path,
+                )
+
+            registry.begin_stage("bulk")
+            self._download_bulk_artifacts(
+                out_root=provider_home,
+                settings=settings,
+                bulk_urls=(
+                    self._load_discovered_bulk_urls(artifacts) + bulk_urls
+                ),
+                allow_hosts=allow_bulk or allow_hosts,
+                deny_hosts=deny_bulk or deny_hosts,
+                max_bulk=max_bulk,
+                max_bulk_bytes=max_bulk_bytes,
+                throttle_seconds=throttle_seconds,
+                since=since_dt,
+                parallel_parts=bulk_parallel_parts,
+                parallel_min_bytes=bulk_parallel_min_bytes,
+            )
+        finally:
+            # A failed stage must not leave the run's registry on the
+            # shared transport.
+            transport.registry = None
+        (provider_home / "fetch_registry.json").write_text(
+            json_codec.dumps(registry.report(), indent=2) + "\n",
+            encoding="utf-8",
         )
 
         self._write_run_manifest(out_root=provider_home)
+        self._write_http_metrics(out_root=provider_home, settings=settings)
 
         self._emit_canonical_logs(
             provider_home,
@@ -667,9 +1200,6 @@ class USPTOProvider(ProviderPlugin):
         provider_home = ctx.out_dir / "raw" / "harvester" / USPTO_PROVIDER_ID
         try:
             if provider_home.exists():
-                raw_records = list(self._iter_harvester_manifest_entries(provider_home))
-                normalized, diags = canonicalize_batch(raw_records, registry)
-
                 # Sidecars + RIS are written under endnote/ so relative paths
                 # work.
                 endnote_dir.mkdir(parents=True, exist_ok=True)
@@ -682,22 +1212,9 @@ class USPTOProvider(ProviderPlugin):
 
                 # (Req #5) Bulk manifest reference: model the snapshot as a
                 # Dataset-style RIS record with its own sidecar attachment.
-                manifest_entries = raw_records
-                manifest_paths = sorted(provider_home.glob("**/manifest.json"))
+                # Manifests are streamed (once for the summary and the file
+                # digests, again for the sidecars), never held in memory.
                 manifest_sources: list[dict[str, str]] = []
-                manifest_key_hasher = hashlib.sha256()
-                for mp in manifest_paths:
-                    try:
-                        data = mp.read_bytes()
-                    except OSError:
-                        continue
-                    rel = mp.relative_to(provider_home).as_posix()
-                    file_sha = hashlib.sha256(data).hexdigest()
-                    manifest_sources.append({"path": rel, "sha256": file_sha})
-                    manifest_key_hasher.update(rel.encode("utf-8"))
-                    manifest_key_hasher.update(b"\0")
-                    manifest_key_hasher.update(file_sha.encode("utf-8"))
-                    manifest_key_hasher.update(b"\0")
 
                 # Best-effort date range + endpoint counts for the bulk
                 # manifest record. Upstream harvesters vary in timestamp field
@@ -721,16 +1238,22 @@ class USPTOProvider(ProviderPlugin):
                     "timestamp",
                     "ts",
                 )
-                observed_times: list[datetime] = []
+                observed_min: datetime | None = None
+                observed_max: datetime | None = None
                 endpoint_counts: dict[str, int] = {}
-                for entry in manifest_entries:
-                    if not isinstance(entry, dict):
-                        continue
-
+                records_count = 0
+                for entry in self._iter_harvester_manifest_entries(
+                    provider_home, sources=manifest_sources
+                ):
+                    records_count += 1
                     for k in ts_fields:
                         dt = _parse_iso_dt(entry.get(k))
-                        if dt is not None:
-                            observed_times.append(dt)
+                        if dt is None:
+                            continue
+                        if observed_min is None or dt < observed_min:
+                            observed_min = dt
+                        if observed_max is None or dt > observed_max:
+                            observed_max = dt
 
                     endpoint = entry.get("endpoint") or entry.get("kind")
                     if isinstance(endpoint, str) and endpoint.strip():
@@ -745,8 +1268,15 @@ class USPTOProvider(ProviderPlugin):
                         key = f"{host}/{prefix}" if prefix else host
                     endpoint_counts[key] = endpoint_counts.get(key, 0) + 1
 
-                observed_min = min(observed_times) if observed_times else None
-                observed_max = max(observed_times) if observed_times else None
+                manifest_sources.sort(key=lambda source: source["path"])
+                manifest_key_hasher = hashlib.sha256()
+                for source in manifest_sources:
+                    manifest_key_hasher.update(source["path"].encode("utf-8"))
+                    manifest_key_hasher.update(b"\0")
+                    manifest_key_hasher.update(
+                        source["sha256"].encode("utf-8")
+                    )
+                    manifest_key_hasher.update(b"\0")
 
                 bulk_artifacts: list[dict[str, Any]] = []
                 bulk_dir = provider_home / "bulk"
@@ -772,7 +1302,7 @@ class USPTOProvider(ProviderPlugin):
                 bulk_url = "https://bulkdata.uspto.gov/"
                 bulk_data = {
                     "url": bulk_url,
-                    "records_count": len(manifest_entries),
+                    "records_count": records_count,
                     "observed_date_min": (
                         observed_min.isoformat() if observed_min else None
                     ),
@@ -784,7 +1314,7 @@ class USPTOProvider(ProviderPlugin):
                     ),
                     "manifest_sources": manifest_sources,
                     "bulk_artifacts": bulk_artifacts,
-                    "manifest_entries": manifest_entries,
+                    "manifest_entries": SIDECAR_STREAM,
                 }
                 bulk_sidecar_envelope = build_sidecar_envelope(
                     provider="uspto",
@@ -793,15 +1323,16 @@ class USPTOProvider(ProviderPlugin):
                     exported_at=exported_at,
                     data=bulk_data,
                 )
-                bulk_sha256, bulk_sidecar_path = write_sidecar_json(
+                bulk_sha256, bulk_sidecar_path = write_sidecar_json_streaming(
                     sidecars_dir=sidecars_dir,
                     envelope=bulk_sidecar_envelope,
+                    items=self._iter_harvester_manifest_entries(provider_home),
                 )
                 bulk_sidecar_filename = bulk_sidecar_path.name
 
                 # Use TY=DATA so EndNote imports this as a Dataset.
                 ris_lines.append("TY  - DATA")
-                bulk_title = f"USPTO Bulk Manifest ({len(manifest_entries)} records)"
+                bulk_title = f"USPTO Bulk Manifest ({records_count} records)"
                 ris_lines.append(f"TI  - {bulk_title}")
                 ris_lines.append(f"UR  - {bulk_url}")
                 ris_lines.append(f"AN  - uspto:{bulk_stable_id}")
@@ -815,100 +1346,107 @@ class USPTOProvider(ProviderPlugin):
                 ris_lines.append(f"L1  - sidecars/{bulk_sidecar_filename}")
                 ris_lines.append("ER  -")
 
-                for idx, (raw, norm, diag) in enumerate(
-                    zip(raw_records, normalized, diags)
-                ):
-                    canonical = norm.get("canonical", {})
-                    if not isinstance(canonical, dict):
-                        canonical = {}
-
-                    url_val = (
-                        canonical.get("document_url")
-                        or canonical.get("url")
-                        or raw.get("url")
-                    )
-                    url = str(url_val or "")
-                    stable_id = str(
-                        canonical.get("document_id")
-                        or canonical.get("trial_number")
-                        or canonical.get("owner_patent_number")
-                        or canonical.get("owner_application_number")
-                        or raw.get("id")
-                        or url
-                        or f"record-{idx + 1}"
+                # RIS entries go to disk one record at a time.
+                with ris_path.open("w", encoding="utf-8") as ris_handle:
+                    ris_handle.write("\n".join(ris_lines) + "\n")
+                    ris_lines.clear()
+                    raw_records = self._iter_harvester_manifest_entries(
+                        provider_home
                     )
+                    for idx, raw in enumerate(raw_records):
+                        norm, diag = next(iter_canonicalized([raw], registry))
+                        canonical = norm.get("canonical", {})
+                        if not isinstance(canonical, dict):
+                            canonical = {}
+
+                        url_val = (
+                            canonical.get("document_url")
+                            or canonical.get("url")
+                            or raw.get("url")
+                        )
+                        url = str(url_val or "")
+                        stable_id = str(
+                            canonical.get("document_id")
+                            or canonical.get("trial_number")
+                            or canonical.get("owner_patent_number")
+                            or canonical.get("owner_application_number")
+                            or raw.get("id")
+                            or url
+                            or f"record-{idx + 1}"
+                        )
 
-                    record_data = {
-                        "raw": raw,
-                        "normalized": norm,
-                        "diagnostics": diag,
-                    }
-                    sidecar_envelope = build_sidecar_envelope(
-                        provider="uspto",
-                        kind="record",
-                        stable_id=stable_id,
-                        exported_at=exported_at,
-                        data=record_data,
-                    )
-                    sha256, sidecar_path = write_sidecar_json(
-                        sidecars_dir=sidecars_dir,
-                        envelope=sidecar_envelope,
-                    )
-                    sidecar_filename = sidecar_path.name
-
-                    title = str(
-                        canonical.get("document_id")
-                        or canonical.get("document_type")
-                        or canonical.get("download_url")
-                        or url
-                        or f"record-{idx + 1}"
-                    )
+                        record_data = {
+                            "raw": raw,
+                            "normalized": norm,
+                            "diagnostics": diag,
+                        }
+                        sidecar_envelope = build_sidecar_envelope(
+                            provider="uspto",
+                            kind="record",
+                            stable_id=stable_id,
+                            exported_at=exported_at,
+                            data=record_data,
+                        )
+                        sha256, sidecar_path = write_sidecar_json(
+                            sidecars_dir=sidecars_dir,
+                            envelope=sidecar_envelope,
+                        )
+                        sidecar_filename = sidecar_path.name
+
+                        title = str(
+                            canonical.get("document_id")
+                            or canonical.get("document_type")
+                            or canonical.get("download_url")
+                            or url
+                            or f"record-{idx + 1}"
+                        )
 
-                    # RIS: use custom tags C1..C8 to populate repurposed Custom
-                    # fields. EndNote typically maps AN -> Accession Number and
-                    # L1 -> File Attachments.
-                    ris_lines.append("TY  - DATA")
-                    ris_lines.append(f"TI  - {title}")
-                    if url:
-                        ris_lines.append(f"UR  - {url}")
-                    ris_lines.append(f"AN  - uspto:{stable_id}")
-                    c1 = str(
-                        canonical.get("owner_application_number")
-                        or canonical.get("application_number")
-                        or ""
-                    )
-                    c2 = str(canonical.get("trial_number") or "")
-                    c3 = str(canonical.get("document_id") or "")
-                    c4 = str(
-                        canonical.get("document_type") or canonical.get("type") or ""
-                    )
-                    c5 = str(canonical.get("status") or "")
-                    c6 = str(
-                        canonical.get("filing_date")
-                        or canonical.get("petition_filed_at")
-                        or ""
-                    )
-                    c7 = str(
-                        canonical.get("download_url") or canonical.get("file_url") or ""
-                    )
-                    ris_lines.append(f"C1  - {c1}")
-                    ris_lines.append(f"C2  - {c2}")
-                    ris_lines.append(f"C3  - {c3}")
-                    ris_lines.append(f"C4  - {c4}")
-                    ris_lines.append(f"C5  - {c5}")
-                    ris_lines.append(f"C6  - {c6}")
-                    ris_lines.append(f"C7  - {c7}")
-                    ris_lines.append(f"C8  - {sha256}")
-                    ris_lines.append(f"L1  - sidecars/{sidecar_filename}")
-                    ris_lines.append("ER  -")
-
-                if ris_lines:
-                    ris_path.write_text(
-                        "\n".join(ris_lines) + "\n",
-                        encoding="utf-8",
-                    )
-                    print(f"[uspto] EndNote RIS written to {ris_path}")
-                    print(f"[uspto] EndNote sidecars written to {sidecars_dir}")
+                        # RIS: use custom tags C1..C8 to populate repurposed
+                        # Custom fields. EndNote typically maps AN ->
+                        # Accession Number and L1 -> File Attachments.
+                        ris_lines.append("TY  - DATA")
+                        ris_lines.append(f"TI  - {title}")
+                        if url:
+                            ris_lines.append(f"UR  - {url}")
+                        ris_lines.append(f"AN  - uspto:{stable_id}")
+                        c1 = str(
+                            canonical.get("owner_application_number")
+                            or canonical.get("application_number")
+                            or ""
+                        )
+                        c2 = str(canonical.get("trial_number") or "")
+                        c3 = str(canonical.get("document_id") or "")
+                        c4 = str(
+                            canonical.get("document_type")
+                            or canonical.get("type")
+                            or ""
+                        )
+                        c5 = str(canonical.get("status") or "")
+                        c6 = str(
+                            canonical.get("filing_date")
+                            or canonical.get("petition_filed_at")
+                            or ""
+                        )
+                        c7 = str(
+                            canonical.get("download_url")
+                            or canonical.get("file_url")
+                            or ""
+                        )
+                        ris_lines.append(f"C1  - {c1}")
+                        ris_lines.append(f"C2  - {c2}")
+                        ris_lines.append(f"C3  - {c3}")
+                        ris_lines.append(f"C4  - {c4}")
+                        ris_lines.append(f"C5  - {c5}")
+                        ris_lines.append(f"C6  - {c6}")
+                        ris_lines.append(f"C7  - {c7}")
+                        ris_lines.append(f"C8  - {sha256}")
+                        ris_lines.append(f"L1  - sidecars/{sidecar_filename}")
+                        ris_lines.append("ER  -")
+                        ris_handle.write("\n".join(ris_lines) + "\n")
+                        ris_lines.clear()
+
+                print(f"[uspto] EndNote RIS written to {ris_path}")
+                print(f"[uspto] EndNote sidecars written to {sidecars_dir}")
         except (OSError, RuntimeError, ValueError) as exc:  # pragma: no cover
             print(f"[uspto] EndNote export skipped: {exc}")
 
@@ -917,19 +1455,29 @@ class USPTOProvider(ProviderPlugin):
     def _iter_harvester_manifest_entries(
         self,
         harvester_out: Path,
+        *,
+        sources: list[dict[str, str]] | None = None,
     ) -> Iterable[dict]:
-        manifests = list(harvester_out.glob("**/manifest.json"))
-        for manifest_path in manifests:
-            try:
-                payload = manifest_path.read_text(encoding="utf-8")
-                payload = json.loads(payload)
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(payload, list):
-                continue
-            for entry in payload:
-                if isinstance(entry, dict):
-                    yield entry
+        """Stream the latest records of every manifest under `harvester_out`.
+
+        With `sources`, every file behind the records is appended as
+        `{"path", "sha256"}` once it has been read; each file is hashed by
+        the pass that parses it. Records always come from the manifests,
+        not the run index: stages index their own root, so an index here
+        need not cover every manifest below it.
+        """
+
+        for manifest_path in sorted(harvester_out.glob("**/manifest.json")):
+            log = ManifestLog(manifest_path)
+            yield from log.latest()
+            if sources is not None:
+                for path, digest in log.digests.items():
+                    sources.append(
+                        {
+                            "path": path.relative_to(harvester_out).as_posix(),
+                            "sha256": digest,
+                        }
+                    )
 
     def _emit_canonical_logs(
         self,
@@ -944,12 +1492,16 @@ class USPTOProvider(ProviderPlugin):
         logs_dir.mkdir(parents=True, exist_ok=True)
 
         raw_records = list(self._iter_harvester_manifest_entries(harvester_out))
-        write_jsonl(logs_dir / "raw_provider.jsonl", raw_records)
+        write_jsonl(logs_dir / "raw_provider.jsonl", raw_records, compact=True)
 
         registry = load_registry(self.registry_path)
         normalized, diags = canonicalize_batch(raw_records, registry)
-        write_jsonl(logs_dir / "normalized_canonical.jsonl", normalized)
-        write_jsonl(logs_dir / "mapping_diagnostics.jsonl", diags)
+        write_jsonl(
+            logs_dir / "normalized_canonical.jsonl", normalized, compact=True
+        )
+        write_jsonl(
+            logs_dir / "mapping_diagnostics.jsonl", diags, compact=True
+        )
         self._write_manifest(logs_dir, raw_records, normalized, diags)
 
         self._emit_canonical_citations(
@@ -1112,7 +1664,7 @@ class USPTOProvider(ProviderPlugin):
                     }
                 )
             (citations_dir / "uspto-canonical.csl.json").write_text(
-                json.dumps(csl, indent=2, ensure_ascii=False) + "\n",
+                json_codec.dumps(csl, indent=2) + "\n",
                 encoding="utf-8",
             )
 
@@ -1144,56 +1696,55 @@ class USPTOProvider(ProviderPlugin):
         throttle_seconds: float,
         max_depth: int,
         since: datetime | None,
+        concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        robots: RobotsCache | None = None,
+        host_page_budget: int = 0,
+        resume: bool = False,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+        compact_seen: bool = False,
+        discovery: str = "links",
+        sitemap_urls: Iterable[str] | None = None,
+        max_sitemaps: int = DEFAULT_MAX_SITEMAPS,
+        near_duplicate_distance: int = DEFAULT_MAX_DISTANCE,
     ) -> None:
-        import re
-        import time
-        from collections import deque
-        from urllib import robotparser
-        from urllib.parse import urldefrag, urljoin
+        from urllib.parse import urldefrag
 
         import requests
 
+        if discovery not in _CRAWL_DISCOVERY_MODES:
+            raise ValueError(f"Unsupported crawl discovery mode: {discovery}")
         provider_root = out_root.resolve()
         pages_root = provider_root / "html"
         assets_root = provider_root / "assets"
         manifest_path = provider_root / "manifest.json"
-        manifest_path_jsonl = manifest_path.with_suffix(".jsonl")
 
         pages_root.mkdir(parents=True, exist_ok=True)
         assets_root.mkdir(parents=True, exist_ok=True)
 
+        transport = self._transport_for(settings)
+        blobs = self._blob_store_for(settings)
+        limiter = getattr(transport, "rate_limiter", None)
         allow_hosts = allow_hosts or set()
         deny_hosts = deny_hosts or set()
-        robots_parsers: dict[str, robotparser.RobotFileParser] = {}
+        if robots is None:
+            robots = self._robots_cache_for(settings, store_dir=None)
         disallowed_urls: list[dict[str, Any]] = []
         failed_urls: list[dict[str, Any]] = []
 
         def _robots_allows(url: str) -> bool:
+            # Runs on crawl worker threads; the cache makes the first fetch
+            # of each robots.txt happen exactly once per run.
             parsed = urlparse(url)
             host = (parsed.hostname or parsed.netloc or "").lower()
             if not host:
                 return False
-            rp = robots_parsers.get(host)
-            if rp is None:
-                rp = robotparser.RobotFileParser()
-                robots_url = f"{parsed.scheme}://{host}/robots.txt"
-                resp = _request(robots_url)
-                if resp and resp.ok:
-                    rp.parse(resp.text.splitlines())
-                else:
-                    rp.parse([])
-                robots_parsers[host] = rp
-            allows = rp.can_fetch(settings.user_agent, url)
-            if not allows:
-                disallowed_urls.append(
-                    {
-                        "url": url,
-                        "reason": "robots.txt disallow",
-                        "host": host,
-                        "checked_at": datetime.now(timezone.utc).isoformat(),
-                    }
+            rp = robots.entry(host, parsed.scheme or "https").parser
+            if limiter is not None:
+                limiter.set_crawl_delay(
+                    host, rp.crawl_delay(settings.user_agent)
                 )
-            return allows
+            return rp.can_fetch(settings.user_agent, url)
 
         def _host_in_scope(host: str) -> bool:
             host = host.lower()
@@ -1230,78 +1781,37 @@ class USPTOProvider(ProviderPlugin):
                 lower_path.endswith(ext) for ext in _ATTACHMENT_EXTS
             )
 
-        def _extract_links(text: str, base: str) -> set[str]:
-            links: set[str] = set()
-            hrefs = re.findall(r'(?:href|src)=["\']([^"\']+)["\']', text, re.I)
-            hrefs.extend(re.findall(r"https?://[^\s\"'<>]+", text, re.I))
-            for raw in hrefs:
-                joined = urljoin(base, raw)
-                canon = _canon(joined)
+        def _extract_links(
+            body: bytes, base: str
+        ) -> tuple[dict[str, str], str]:
+            # Canonical in-scope URL -> link kind, plus the visible text;
+            # embedded assets are never crawled so they are dropped here.
+            extractor = LinkExtractor(
+                base, is_attachment=_is_attachment, collect_text=True
+            )
+            extractor.feed(body)
+            links: dict[str, str] = {}
+            for link in extractor.close():
+                if link.kind == LINK_ASSET:
+                    continue
+                canon = _canon(link.url)
                 if canon:
-                    links.add(canon)
-            return links
+                    links.setdefault(canon, link.kind)
+            return links, extractor.text
 
         def _request(
             url: str, prev_entry: dict[str, Any] | None = None
         ) -> requests.Response | None:
-            attempt = 0
-            max_attempts = max(1, settings.max_retries)
-            backoff_cap = settings.backoff_factor * max_attempts
-            last_resp: requests.Response | None = None
-            base_headers = {"User-Agent": settings.user_agent}
-            if prev_entry:
-                prev_etag = prev_entry.get("etag")
-                prev_last_modified = prev_entry.get("last_modified")
-                if prev_etag:
-                    base_headers["If-None-Match"] = str(prev_etag)
-                if prev_last_modified:
-                    base_headers["If-Modified-Since"] = str(prev_last_modified)
-
-            while attempt < max_attempts:
-                try:
-                    resp = requests.get(
-                        url,
-                        headers=base_headers,
-                        timeout=int(settings.http_timeout),
-                    )
-                    last_resp = resp
-                except requests.RequestException:
-                    resp = None
-
-                if resp is None:
-                    attempt += 1
-                    delay = min(
-                        settings.backoff_factor * (2 ** (attempt - 1)),
-                        backoff_cap,
-                    )
-                    time.sleep(delay)
-                    continue
-
-                if throttle_seconds > 0:
-                    time.sleep(throttle_seconds)
-
-                if resp.status_code == 304:
-                    return resp
-
-                status = int(resp.status_code)
-                if status == 429 or status >= 500:
-                    attempt += 1
-                    retry_after = resp.headers.get("Retry-After")
-                    try:
-                        delay = float(retry_after) if retry_after else 0.0
-                    except ValueError:
-                        delay = 0.0
-                    if delay <= 0:
-                        delay = min(
-                            settings.backoff_factor * (2 ** (attempt - 1)),
-                            backoff_cap,
-                        )
-                    time.sleep(delay)
-                    continue
-
-                return resp
-
-            return last_resp
+            # Retries, backoff and the per-host circuit breaker live in the
+            # shared transport.
+            try:
+                return transport.get(
+                    url,
+                    headers=_conditional_headers(prev_entry),
+                    min_interval=throttle_seconds,
+                )
+            except requests.RequestException:
+                return None
 
         seeds = list(_DEFAULT_SEEDS)
         if extra_seeds:
@@ -1310,41 +1820,58 @@ class USPTOProvider(ProviderPlugin):
                 if canon:
                     seeds.append(canon)
 
-        queue: deque[tuple[str, int]] = deque()
-        seen_pages: set[str] = set()
-        seen_attachments: set[str] = set()
-        manifest_records: list[dict[str, Any]] = []
-        existing_shas: set[str] = set()
-        sha_to_local: dict[str, str] = {}
-        existing_by_url: dict[str, dict[str, Any]] = {}
+        # Compact mode keeps URL membership in Bloom filters confirmed
+        # against on-disk indexes instead of in-memory sets of strings.
+        compact_sets: list[CompactUrlSet] = []
+
+        def _url_set(name: str) -> MutableSet[str]:
+            if not compact_seen:
+                return set()
+            compact = CompactUrlSet(
+                provider_root / "crawl_index" / f"{name}.sqlite"
+            )
+            compact_sets.append(compact)
+            return compact
+
+        seen_pages = _url_set("seen_pages")
+        seen_attachments = _url_set("seen_attachments")
+        recorded_urls = _url_set("recorded_urls")
         stale_urls: set[str] = set()
+        # Fingerprints of pages that were not near-duplicates themselves;
+        # a page close to one of them is recorded but not expanded.
+        simhash_index = (
+            SimHashIndex(max_distance=near_duplicate_distance)
+            if near_duplicate_distance >= 0
+            else None
+        )
 
-        if manifest_path.exists():
+        def _index_simhash(record: dict[str, Any]) -> None:
+            value = record.get("simhash")
+            if (
+                simhash_index is None
+                or not isinstance(value, str)
+                or record.get("near_duplicate_of")
+            ):
+                return
             try:
-                payload = json.loads(manifest_path.read_text(encoding="utf-8"))
-                if isinstance(payload, list):
-                    manifest_records = [
-                        entry for entry in payload if isinstance(entry, dict)
-                    ]
-            except json.JSONDecodeError:
-                manifest_records = []
-        elif manifest_path_jsonl.exists():
-            manifest_records = []
-            text = manifest_path_jsonl.read_text(encoding="utf-8")
-            lines = text.splitlines()
-            for line in lines:
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if isinstance(rec, dict):
-                    manifest_records.append(rec)
+                simhash_index.add(int(value, 16), str(record.get("url") or ""))
+            except ValueError:
+                return
 
-        recorded_urls: set[str] = set()
-        for rec in manifest_records:
+        # New and refetched records are appended to the manifest log as
+        # they complete; the snapshot is only rewritten on compaction.
+        manifest_log = ManifestLog(manifest_path)
+        run_index = RunIndex(index_path_for(provider_root))
+        history = (
+            _IndexedCrawlHistory(run_index, "additional")
+            if compact_seen
+            else _CrawlHistory()
+        )
+
+        def _load(rec: dict[str, Any]) -> dict[str, Any]:
             url_val = str(rec.get("url") or "")
             if not url_val:
-                continue
+                return rec
             fetched_at_raw = rec.get("fetched_at")
             fetched_at = None
             if isinstance(fetched_at_raw, str):
@@ -1358,86 +1885,161 @@ class USPTOProvider(ProviderPlugin):
                 stale_urls.add(url_val)
             else:
                 recorded_urls.add(url_val)
-
-            existing_by_url[url_val] = rec
-            sha_val = rec.get("sha256")
-            if isinstance(sha_val, str):
-                existing_shas.add(sha_val)
-                existing_local_path = rec.get("local_path")
-                if isinstance(existing_local_path, str):
-                    sha_to_local[sha_val] = existing_local_path
-
-        for seed in seeds:
-            canon = _canon(seed)
-            if not canon or canon in seen_pages or canon in recorded_urls:
-                continue
-            queue.append((canon, 0))
-            seen_pages.add(canon)
+            history.load(rec)
+            _index_simhash(rec)
+            return rec
+
+        # One streamed pass over the manifest; a manifest written before
+        # the index existed is indexed by the same pass.
+        _seed_stage_index(
+            run_index, "additional", map(_load, manifest_log.latest())
+        )
 
         pages_fetched = 0
         attachments_fetched = 0
+        inflight_pages = 0
+        inflight_attachments = 0
+        # Pages dispatched per host (fetched or in flight) for the
+        # optional per-host budget.
+        host_pages: dict[str, int] = {}
+        # Dispatched tasks not handled yet; a snapshot puts them back on
+        # the frontier.
+        inflight: dict[str, CrawlTask] = {}
+        # Recorded URLs a sitemap lastmod marked stale.
+        refresh_urls: set[str] = set()
+        sitemap_stats: list[dict[str, Any]] = []
+
+        # Every handled fetch is journaled as it completes and the frontier
+        # and seen-sets are snapshotted every `checkpoint_every` fetches, so
+        # a killed crawl can continue with `resume=True`.
+        checkpoint = CrawlCheckpoint(
+            provider_root / "crawl_state", every=checkpoint_every
+        )
+        resumed = checkpoint.load() if resume else None
+        if resumed is None:
+            checkpoint.clear()
 
-        while queue and (
-            pages_fetched < max_pages or attachments_fetched < max_attachments
-        ):
-            url, depth = queue.popleft()
-            prev_entry = existing_by_url.get(url)
+        def _admit(task: CrawlTask) -> bool | None:
+            nonlocal inflight_pages, inflight_attachments
+            url = task.url
             if url in recorded_urls and url not in stale_urls:
-                continue
-            if _is_attachment(url) and attachments_fetched >= max_attachments:
-                continue
-            if not _is_attachment(url) and pages_fetched >= max_pages:
-                continue
-            if not _robots_allows(url):
-                continue
-            resp = _request(url, prev_entry)
+                return False
+            if (
+                host_page_budget > 0
+                and not _is_attachment(url)
+                and host_pages.get(task.host, 0) >= host_page_budget
+            ):
+                return False
+            # Budgets count completed fetches; in-flight fetches hold a
+            # reservation so the concurrent crawl never overshoots them.
+            if _is_attachment(url):
+                if attachments_fetched >= max_attachments:
+                    return False
+                if (
+                    attachments_fetched + inflight_attachments
+                    >= max_attachments
+                ):
+                    return None
+                inflight_attachments += 1
+            else:
+                if pages_fetched >= max_pages:
+                    return False
+                if pages_fetched + inflight_pages >= max_pages:
+                    return None
+                inflight_pages += 1
+                host_pages[task.host] = host_pages.get(task.host, 0) + 1
+            inflight[url] = task
+            return True
+
+        def _fetch(
+            task: CrawlTask,
+        ) -> tuple[bool, requests.Response | None, bytes, str]:
+            if not _robots_allows(task.url):
+                return False, None, b"", ""
+            resp = _request(task.url, history.previous(task.url))
+            if resp is None or resp.status_code == 304:
+                return True, resp, b"", ""
+            body = resp.content
+            return True, resp, body, hashlib.sha256(body).hexdigest()
+
+        def _settle(
+            task: CrawlTask,
+            outcome: tuple[bool, requests.Response | None, bytes, str],
+        ) -> tuple[dict[str, Any], dict[str, str] | None]:
+            # Stores the body and describes the outcome as a journal event;
+            # also returns the links of a page worth expanding.
+            url, depth = task.url, task.depth
+            parsed = urlparse(url)
+            event: dict[str, Any] = {
+                "url": url,
+                "depth": depth,
+                "host": task.host,
+                "kind": "attachment" if _is_attachment(url) else "page",
+            }
+
+            allowed, resp, body, sha = outcome
+            if not allowed:
+                event["outcome"] = "disallowed"
+                event["disallowed"] = {
+                    "url": url,
+                    "reason": "robots.txt disallow",
+                    "host": (parsed.hostname or parsed.netloc or "").lower(),
+                    "checked_at": datetime.now(timezone.utc).isoformat(),
+                }
+                return event, None
             if resp is None:
-                parsed = urlparse(url)
-                failed_urls.append(
-                    {
-                        "url": url,
-                        "host": (parsed.hostname or parsed.netloc or ""),
-                        "reason": "request_failed",
-                        "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    }
-                )
-                continue
+                event["outcome"] = "failed"
+                event["failure"] = {
+                    "url": url,
+                    "host": (parsed.hostname or parsed.netloc or ""),
+                    "reason": "request_failed",
+                    "fetched_at": datetime.now(timezone.utc).isoformat(),
+                }
+                return event, None
 
             if resp.status_code == 304:
-                recorded_urls.add(url)
-                continue
+                event["outcome"] = "not_modified"
+                return event, None
 
             content_type = (resp.headers.get("Content-Type") or "").lower()
-            body = resp.content
-            sha = hashlib.sha256(body).hexdigest()
             is_html = "html" in content_type or body.lstrip().startswith(b"<")
             dest_root = pages_root if is_html else assets_root
             deduped_by_hash = False
             local_path: str | None = None
+            blob_fields: dict[str, Any] = {}
 
-            if sha in existing_shas:
-                cached_path = sha_to_local.get(sha)
+            if blobs is not None:
+                # One blob per body; the URL path is a hardlink view.
+                dest = _path_for_url(dest_root, url)
+                if dest.suffix == "":
+                    dest = dest.with_suffix(".html" if is_html else ".bin")
+                try:
+                    ref = blobs.put(body, sha)
+                    if blobs.materialize(sha, dest):
+                        local_path = dest.relative_to(out_root).as_posix()
+                except OSError:
+                    event["outcome"] = "write_error"
+                    return event, None
+                deduped_by_hash = ref.existed
+                blob_fields = _blob_fields(blobs, ref)
+            else:
+                cached_path = history.local_path(sha)
                 if cached_path:
                     local_path = cached_path
                     deduped_by_hash = True
 
-            if local_path is None:
+            if local_path is None and blobs is None:
                 dest = _path_for_url(dest_root, url)
                 if dest.suffix == "":
                     dest = dest.with_suffix(".html" if is_html else ".bin")
-                dest.parent.mkdir(parents=True, exist_ok=True)
                 try:
-                    dest.write_bytes(body)
+                    _write_body(dest, body)
                 except OSError:
-                    continue
+                    event["outcome"] = "write_error"
+                    return event, None
                 local_path = str(dest.relative_to(out_root)).replace("\\", "/")
-                sha_to_local.setdefault(sha, local_path)
-
-            if local_path is None:
-                continue
 
-            existing_shas.add(sha)
-            host_val = urlparse(url).hostname or ""
+            host_val = parsed.hostname or ""
 
             entry = {
                 "url": url,
@@ -1457,53 +2059,277 @@ class USPTOProvider(ProviderPlugin):
                 "deduped_by_hash": deduped_by_hash,
                 "depth": depth,
             }
+            entry.update(blob_fields)
             if host_val.lower() in _DOC_HOSTS:
                 entry["is_documentation"] = True
-            if url not in recorded_urls:
-                manifest_records.append(entry)
-                recorded_urls.add(url)
+            links: dict[str, str] | None = None
+            if is_html:
+                links, text = _extract_links(body, url)
+                fingerprint = None
+                if simhash_index is not None:
+                    fingerprint = text_fingerprint(text)
+                if simhash_index is not None and fingerprint is not None:
+                    entry["simhash"] = f"{fingerprint:016x}"
+                    match = simhash_index.find(fingerprint)
+                    if match is not None and match[0] != url:
+                        # Template-identical to a page already expanded:
+                        # keep the record but do not fan out again.
+                        entry["near_duplicate_of"] = match[0]
+                        entry["near_duplicate_distance"] = match[1]
+                        links = None
+            event["outcome"] = "record"
+            event["record"] = entry
+            event["counted"] = "page" if is_html else "attachment"
             if resp.status_code >= 400:
-                parsed = urlparse(url)
-                failed_urls.append(
-                    {
-                        "url": url,
-                        "host": (parsed.hostname or parsed.netloc or ""),
-                        "status_code": int(resp.status_code),
-                        "reason": "http_error",
-                        "fetched_at": entry["fetched_at"],
-                    }
-                )
+                event["failure"] = {
+                    "url": url,
+                    "host": (parsed.hostname or parsed.netloc or ""),
+                    "status_code": int(resp.status_code),
+                    "reason": "http_error",
+                    "fetched_at": entry["fetched_at"],
+                }
+            return event, links
+
+        def _apply_result(event: dict[str, Any]) -> None:
+            # What an event adds to the manifest and failure logs; replayed
+            # for every journaled event on resume.
+            url = event["url"]
+            record = event.get("record")
+            if isinstance(record, dict):
+                _index_simhash(record)
+                history.stored(record)
+                if history.known(url) or url not in recorded_urls:
+                    # A refetch of a stale record supersedes the old one.
+                    manifest_log.append(record)
+                    run_index.record_fetch("additional", record)
+                recorded_urls.add(url)
+            elif event.get("outcome") == "not_modified":
+                recorded_urls.add(url)
+            if isinstance(event.get("failure"), dict):
+                failed_urls.append(event["failure"])
+            if isinstance(event.get("disallowed"), dict):
+                disallowed_urls.append(event["disallowed"])
+
+        def _follow(links: dict[str, str], depth: int) -> list[list[Any]]:
+            pushed: list[list[Any]] = []
+            for link, kind in sorted(links.items()):
+                next_depth = depth + 1
+                if next_depth > max_depth:
+                    continue
+                if kind == LINK_ATTACHMENT:
+                    if attachments_fetched >= max_attachments:
+                        continue
+                    if link not in seen_attachments:
+                        seen_attachments.add(link)
+                        engine.push(link, next_depth)
+                        pushed.append([link, next_depth])
+                else:
+                    if link in seen_pages or len(seen_pages) >= max_pages:
+                        continue
+                    seen_pages.add(link)
+                    engine.push(link, next_depth)
+                    pushed.append([link, next_depth])
+            return pushed
+
+        def _snapshot() -> dict[str, Any]:
+            pending = [*engine.queued(), *inflight.values()]
+            # Snapshots count completed pages only; in-flight ones go back
+            # on the frontier and are dispatched (and counted) again.
+            completed = dict(host_pages)
+            for task in inflight.values():
+                if not _is_attachment(task.url):
+                    completed[task.host] -= 1
+            return {
+                "frontier": [[task.url, task.depth] for task in pending],
+                "seen_pages": seen_pages,
+                "seen_attachments": seen_attachments,
+                "pages_fetched": pages_fetched,
+                "attachments_fetched": attachments_fetched,
+                "host_pages": completed,
+                "refresh": sorted(refresh_urls),
+            }
 
-            if is_html:
-                pages_fetched += 1
+        def _handle(
+            task: CrawlTask,
+            outcome: tuple[bool, requests.Response | None, bytes, str],
+        ) -> None:
+            nonlocal pages_fetched, attachments_fetched
+            nonlocal inflight_pages, inflight_attachments
+            inflight.pop(task.url, None)
+            if _is_attachment(task.url):
+                inflight_attachments -= 1
             else:
+                inflight_pages -= 1
+
+            event, links = _settle(task, outcome)
+            _apply_result(event)
+            if event.get("counted") == "page":
+                pages_fetched += 1
+            elif event.get("counted") == "attachment":
                 attachments_fetched += 1
+            if (
+                links is not None
+                and pages_fetched < max_pages
+                and discovery != "sitemaps"
+            ):
+                event["links"] = _follow(links, task.depth)
 
-            if is_html and pages_fetched < max_pages:
-                text = body.decode("utf-8", errors="ignore")
-                for link in sorted(_extract_links(text, url)):
-                    next_depth = depth + 1
-                    if next_depth > max_depth:
+            checkpoint.record(event)
+            if checkpoint.due:
+                checkpoint.save(_snapshot())
+
+        def _sitemap_chunks(url: str) -> Iterator[bytes]:
+            resp = transport.get(
+                url, stream=True, min_interval=throttle_seconds
+            )
+            try:
+                if resp.status_code != 200:
+                    raise SitemapError(f"HTTP {resp.status_code}")
+                yield from resp.iter_content(chunk_size=64 * 1024)
+            finally:
+                resp.close()
+
+        def _sitemap_frontier() -> list[str]:
+            # Sitemap entries join the frontier when they are new, or when
+            # their lastmod is newer than the manifest's fetched_at.
+            starts = list(sitemap_urls or [])
+            if not starts:
+                seed_hosts = {urlparse(seed).hostname or "" for seed in seeds}
+                for host in sorted(seed_hosts):
+                    if host and _host_in_scope(host):
+                        parser = robots.entry(host, "https").parser
+                        starts.extend(parser.site_maps() or [])
+            starts = [
+                url
+                for url in starts
+                if _host_in_scope(urlparse(url).hostname or "")
+            ]
+            walker = SitemapWalker(_sitemap_chunks, max_sitemaps=max_sitemaps)
+            found: list[str] = []
+            for entry in walker.walk(starts):
+                canon = _canon(entry.loc)
+                if not canon:
+                    continue
+                if canon in recorded_urls:
+                    prev = history.previous(canon) or {}
+                    fetched_at = parse_lastmod(prev.get("fetched_at"))
+                    if entry.lastmod is None or (
+                        fetched_at is not None and entry.lastmod <= fetched_at
+                    ):
                         continue
+                    refresh_urls.add(canon)
+                    stale_urls.add(canon)
+                if _is_attachment(canon):
+                    if canon in seen_attachments:
+                        continue
+                    seen_attachments.add(canon)
+                else:
+                    if canon in seen_pages or len(seen_pages) >= max_pages:
+                        continue
+                    seen_pages.add(canon)
+                found.append(canon)
+                if (
+                    len(seen_pages) >= max_pages
+                    and len(seen_attachments) >= max_attachments
+                ):
+                    break
+            sitemap_stats.extend(walker.stats)
+            return found
+
+        engine = AsyncCrawlEngine(
+            fetch=_fetch,
+            handle=_handle,
+            admit=_admit,
+            should_stop=lambda: (
+                pages_fetched >= max_pages
+                and attachments_fetched >= max_attachments
+            ),
+            ready_in=(
+                None
+                if limiter is None
+                else lambda task: limiter.delay(task.host, throttle_seconds)
+            ),
+            host_limit=getattr(
+                getattr(transport, "concurrency", None), "limit", None
+            ),
+            score=PatternScorer(
+                boosts=_CRAWL_BOOSTS,
+                is_known=history.known,
+            ),
+            concurrency=concurrency,
+            per_host_concurrency=per_host_concurrency,
+        )
+
+        # Rebuild the interrupted crawl: every journaled event goes back
+        # into the manifest, and the events after the last snapshot move
+        # the snapshot's frontier, seen-sets and counters forward.
+        frontier: dict[str, int] = {}
+        state = resumed.state if resumed is not None else None
+        if resumed is not None:
+            for event in resumed.events:
+                _apply_result(event)
+        if state is not None:
+            seen_pages.update(state.get("seen_pages") or [])
+            seen_attachments.update(state.get("seen_attachments") or [])
+            pages_fetched = int(state.get("pages_fetched") or 0)
+            attachments_fetched = int(state.get("attachments_fetched") or 0)
+            for host, count in (state.get("host_pages") or {}).items():
+                host_pages[str(host)] = int(count)
+            for url, depth in state.get("frontier") or []:
+                frontier[str(url)] = int(depth)
+            refresh_urls.update(state.get("refresh") or [])
+            stale_urls.update(refresh_urls)
+        else:
+            if discovery != "sitemaps":
+                for seed in seeds:
+                    canon = _canon(seed)
+                    if (
+                        not canon
+                        or canon in seen_pages
+                        or canon in recorded_urls
+                    ):
+                        continue
+                    frontier[canon] = 0
+                    seen_pages.add(canon)
+            if discovery != "links":
+                for url in _sitemap_frontier():
+                    frontier.setdefault(url, 0)
+        if resumed is not None:
+            for event in resumed.events[resumed.replay_from :]:
+                frontier.pop(event["url"], None)
+                if event.get("kind") == "page":
+                    host = event.get("host") or ""
+                    host_pages[host] = host_pages.get(host, 0) + 1
+                if event.get("counted") == "page":
+                    pages_fetched += 1
+                elif event.get("counted") == "attachment":
+                    attachments_fetched += 1
+                for link, depth in event.get("links") or []:
                     if _is_attachment(link):
-                        if attachments_fetched >= max_attachments:
-                            continue
-                        if link not in seen_attachments:
-                            seen_attachments.add(link)
-                            queue.append((link, next_depth))
+                        seen_attachments.add(link)
                     else:
-                        if link in seen_pages or len(seen_pages) >= max_pages:
-                            continue
                         seen_pages.add(link)
-                        queue.append((link, next_depth))
-            elif not is_html and attachments_fetched >= max_attachments:
-                break
+                    frontier[link] = int(depth)
+        for url, depth in frontier.items():
+            engine.push(url, depth)
 
-        manifest_path.write_text(
-            json.dumps(manifest_records, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        write_jsonl(manifest_path.with_suffix(".jsonl"), manifest_records)
+        try:
+            engine.run()
+        finally:
+            checkpoint.close()
+            manifest_log.sync()
+            for compact in compact_sets:
+                compact.close()
+            if compact_sets:
+                shutil.rmtree(
+                    provider_root / "crawl_index", ignore_errors=True
+                )
+
+        manifest_log.close()
+        run_index.replace_failures("additional", failed_urls)
+        run_index.close()
+        if sitemap_stats:
+            write_jsonl(provider_root / "sitemaps.jsonl", sitemap_stats)
         if disallowed_urls:
             write_jsonl(provider_root / "disallowed.jsonl", disallowed_urls)
         if failed_urls:
@@ -1511,6 +2337,7 @@ class USPTOProvider(ProviderPlugin):
                 provider_root / "failures_additional.jsonl",
                 failed_urls,
             )
+        checkpoint.clear()
 
     def _sample_api_endpoints(
         self,
@@ -1520,9 +2347,9 @@ class USPTOProvider(ProviderPlugin):
         sample_limit: int,
         throttle_seconds: float,
         since: datetime | None = None,
+        concurrency: int = 8,
     ) -> None:
         import re
-        import time
 
         import requests
 
@@ -1536,24 +2363,17 @@ class USPTOProvider(ProviderPlugin):
 
         samples_root.mkdir(parents=True, exist_ok=True)
 
-        manifest_records: list[dict[str, Any]] = []
+        transport = self._transport_for(settings)
+        blobs = self._blob_store_for(settings)
         existing_shas: set[str] = set()
         seen_urls: set[str] = set()
         stale_urls: set[str] = set()
         existing_by_url: dict[str, dict[str, Any]] = {}
         failure_records: list[dict[str, Any]] = []
 
-        if manifest_path.exists():
-            try:
-                payload = json.loads(manifest_path.read_text(encoding="utf-8"))
-                if isinstance(payload, list):
-                    manifest_records = [
-                        entry for entry in payload if isinstance(entry, dict)
-                    ]
-            except json.JSONDecodeError:
-                manifest_records = []
+        manifest_log = ManifestLog(manifest_path)
 
-        for rec in manifest_records:
+        def _load(rec: dict[str, Any]) -> dict[str, Any]:
             sha_val = rec.get("sha256")
             if isinstance(sha_val, str):
                 existing_shas.add(sha_val)
@@ -1573,12 +2393,17 @@ class USPTOProvider(ProviderPlugin):
                 else:
                     seen_urls.add(url_val)
                 existing_by_url[url_val] = rec
+            return rec
+
+        run_index = _open_stage_index(
+            out_root, "api_samples", map(_load, manifest_log.latest())
+        )
 
         coverage_files = sorted(artifacts_root.glob("coverage*.json"))
         candidates: list[dict[str, str]] = []
         for path in coverage_files:
             try:
-                entries = json.loads(path.read_text(encoding="utf-8"))
+                entries = json_codec.loads(path.read_text(encoding="utf-8"))
             except json.JSONDecodeError:
                 continue
             if not isinstance(entries, list):
@@ -1694,6 +2519,8 @@ class USPTOProvider(ProviderPlugin):
 
             return params
 
+        jobs: list[tuple[dict[str, str], str]] = []
+        queued: set[str] = set()
         for candidate in picked:
             host = candidate["host"]
             path_val = candidate["path"]
@@ -1706,22 +2533,40 @@ class USPTOProvider(ProviderPlugin):
                 url = f"https://{host}{path_with_query}"
             else:
                 url = f"https://{host}/{path_with_query}"
-            prev_entry = existing_by_url.get(url)
-            if url in seen_urls and url not in stale_urls:
+            if url in queued or (url in seen_urls and url not in stale_urls):
                 continue
-            headers = {"User-Agent": settings.user_agent}
+            queued.add(url)
+            jobs.append((candidate, url))
+
+        def _fetch(job: tuple[dict[str, str], str]) -> Any:
+            url = job[1]
+            prev_entry = existing_by_url.get(url)
+            headers: dict[str, str] = {}
             if prev_entry:
                 if prev_entry.get("etag"):
                     headers["If-None-Match"] = str(prev_entry.get("etag"))
                 if prev_entry.get("last_modified"):
                     headers["If-Modified-Since"] = str(prev_entry.get("last_modified"))
             try:
-                resp = requests.get(
+                return transport.get(
                     url,
                     headers=headers,
-                    timeout=int(settings.http_timeout),
+                    min_interval=throttle_seconds,
                 )
             except requests.RequestException as exc:
+                return exc
+
+        # Requests run concurrently (the transport's adaptive window bounds
+        # each host); results are recorded in candidate order.
+        workers = max(1, min(int(concurrency), len(jobs) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            responses = list(pool.map(_fetch, jobs))
+
+        for (candidate, url), resp in zip(jobs, responses, strict=True):
+            host = candidate["host"]
+            path_val = candidate["path"]
+            prev_entry = existing_by_url.get(url)
+            if isinstance(resp, requests.RequestException):
                 failure_records.append(
                     {
                         "url": url,
@@ -1729,7 +2574,7 @@ class USPTOProvider(ProviderPlugin):
                         "path": path_val,
                         "method": candidate.get("method"),
                         "reason": "request_exception",
-                        "error": str(exc),
+                        "error": str(resp),
                         "fetched_at": datetime.now(timezone.utc).isoformat(),
                     }
                 )
@@ -1737,8 +2582,6 @@ class USPTOProvider(ProviderPlugin):
             if resp.status_code == 304:
                 seen_urls.add(url)
                 continue
-            if throttle_seconds > 0:
-                time.sleep(throttle_seconds)
             body = resp.content
             sha = hashlib.sha256(body).hexdigest()
             unchanged = False
@@ -1768,9 +2611,20 @@ class USPTOProvider(ProviderPlugin):
                     dest = dest.with_suffix(".xml")
                 else:
                     dest = dest.with_suffix(".bin")
-            dest.parent.mkdir(parents=True, exist_ok=True)
+            local_path: str | None = None
+            blob_fields: dict[str, Any] = {}
             try:
-                dest.write_bytes(body)
+                if blobs is not None:
+                    ref = blobs.put(body, sha)
+                    blob_fields = _blob_fields(blobs, ref)
+                    if blobs.materialize(sha, dest):
+                        local_path = dest.relative_to(out_root).as_posix()
+                else:
+                    _write_body(dest, body)
+                    local_path = str(dest.relative_to(out_root)).replace(
+                        "\\",
+                        "/",
+                    )
             except OSError:
                 continue
 
@@ -1780,10 +2634,7 @@ class USPTOProvider(ProviderPlugin):
                 "host": host,
                 "path": path_val,
                 "method": candidate.get("method"),
-                "local_path": str(dest.relative_to(out_root)).replace(
-                    "\\",
-                    "/",
-                ),
+                "local_path": local_path,
                 "status_code": int(resp.status_code),
                 "content_type": resp.headers.get("Content-Type"),
                 "headers": dict(resp.headers),
@@ -1794,8 +2645,10 @@ class USPTOProvider(ProviderPlugin):
                 "is_bulk_artifact": False,
                 "is_html": False,
                 "success": success,
+                **blob_fields,
             }
-            manifest_records.append(record)
+            manifest_log.append(record)
+            run_index.record_fetch("api_samples", record)
             seen_urls.add(url)
             existing_shas.add(sha)
 
@@ -1812,16 +2665,14 @@ class USPTOProvider(ProviderPlugin):
                     }
                 )
 
-        manifest_path.write_text(
-            json.dumps(manifest_records, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        write_jsonl(manifest_path.with_suffix(".jsonl"), manifest_records)
+        manifest_log.close()
+        run_index.replace_failures("api_samples", failure_records)
+        run_index.close()
         if failure_records:
             write_jsonl(samples_root / "failures.jsonl", failure_records)
 
         coverage_rows: list[dict[str, Any]] = []
-        for rec in manifest_records:
+        for rec in manifest_log.latest():
             coverage_rows.append(
                 {
                     "path": rec.get("path"),
@@ -1835,7 +2686,7 @@ class USPTOProvider(ProviderPlugin):
             )
         coverage_path = samples_root / "coverage.json"
         coverage_path.write_text(
-            json.dumps(coverage_rows, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(coverage_rows, indent=2) + "\n",
             encoding="utf-8",
         )
         lines = [
@@ -1875,11 +2726,13 @@ class USPTOProvider(ProviderPlugin):
         max_bulk_bytes: int,
         throttle_seconds: float,
         since: datetime | None,
+        parallel_parts: int = 1,
+        parallel_min_bytes: int = 256 * 1024 * 1024,
     ) -> None:
-        import time
-
         import requests
 
+        transport = self._transport_for(settings)
+        blobs = self._blob_store_for(settings)
         allow_hosts = allow_hosts or set()
         deny_hosts = deny_hosts or set()
 
@@ -1897,64 +2750,14 @@ class USPTOProvider(ProviderPlugin):
         def _head_with_backoff(
             url: str, prev_entry: dict[str, Any] | None = None
         ) -> requests.Response | None:
-            attempt = 0
-            max_attempts = max(1, settings.max_retries)
-            backoff_cap = settings.backoff_factor * max_attempts
-            last_resp: requests.Response | None = None
-            while attempt < max_attempts:
-                headers = {"User-Agent": settings.user_agent}
-                if prev_entry:
-                    if prev_entry.get("etag"):
-                        headers["If-None-Match"] = str(prev_entry.get("etag"))
-                    if prev_entry.get("last_modified"):
-                        headers["If-Modified-Since"] = str(
-                            prev_entry.get("last_modified")
-                        )
-                try:
-                    resp = requests.head(
-                        url,
-                        headers=headers,
-                        timeout=int(settings.http_timeout),
-                        allow_redirects=True,
-                    )
-                    last_resp = resp
-                except requests.RequestException:
-                    resp = None
-
-                if resp is None:
-                    attempt += 1
-                    delay = min(
-                        settings.backoff_factor * (2 ** (attempt - 1)),
-                        backoff_cap,
-                    )
-                    time.sleep(delay)
-                    continue
-
-                if throttle_seconds > 0:
-                    time.sleep(throttle_seconds)
-
-                if resp.status_code == 304:
-                    return resp
-
-                status = int(resp.status_code)
-                if status == 429 or status >= 500:
-                    attempt += 1
-                    retry_after = resp.headers.get("Retry-After")
-                    try:
-                        delay = float(retry_after) if retry_after else 0.0
-                    except ValueError:
-                        delay = 0.0
-                    if delay <= 0:
-                        delay = min(
-                            settings.backoff_factor * (2 ** (attempt - 1)),
-                            backoff_cap,
-                        )
-                    time.sleep(delay)
-                    continue
-
-                return resp
-
-            return last_resp
+            try:
+                return transport.head(
+                    url,
+                    headers=_conditional_headers(prev_entry),
+                    min_interval=throttle_seconds,
+                )
+            except requests.RequestException:
+                return None
 
         def _content_length(resp: requests.Response | None) -> int | None:
             if resp is None:
@@ -1968,65 +2771,67 @@ class USPTOProvider(ProviderPlugin):
                 return None
 
         def _get_with_backoff(
-            url: str, prev_entry: dict[str, Any] | None = None
+            url: str,
+            prev_entry: dict[str, Any] | None = None,
+            partial: PartialDownload | None = None,
         ) -> requests.Response | None:
-            attempt = 0
-            max_attempts = max(1, settings.max_retries)
-            backoff_cap = settings.backoff_factor * max_attempts
-            last_resp: requests.Response | None = None
-            while attempt < max_attempts:
-                headers = {"User-Agent": settings.user_agent}
-                if prev_entry:
-                    if prev_entry.get("etag"):
-                        headers["If-None-Match"] = str(prev_entry.get("etag"))
-                    if prev_entry.get("last_modified"):
-                        headers["If-Modified-Since"] = str(
-                            prev_entry.get("last_modified")
-                        )
-                try:
-                    resp = requests.get(
-                        url,
-                        headers=headers,
-                        timeout=int(settings.http_timeout),
-                    )
-                    last_resp = resp
-                except requests.RequestException:
-                    resp = None
-
-                if resp is None:
-                    attempt += 1
-                    delay = min(
-                        settings.backoff_factor * (2 ** (attempt - 1)),
-                        backoff_cap,
-                    )
-                    time.sleep(delay)
-                    continue
-
-                if throttle_seconds > 0:
-                    time.sleep(throttle_seconds)
-
-                if resp.status_code == 304:
-                    return resp
+            if partial is not None and partial.if_range:
+                headers = {
+                    "Range": f"bytes={partial.bytes_received}-",
+                    "If-Range": partial.if_range,
+                }
+            else:
+                headers = _conditional_headers(prev_entry)
+            try:
+                return transport.get(
+                    url,
+                    headers=headers,
+                    min_interval=throttle_seconds,
+                    stream=True,
+                )
+            except requests.RequestException:
+                return None
 
-                status = int(resp.status_code)
-                if status == 429 or status >= 500:
-                    attempt += 1
-                    retry_after = resp.headers.get("Retry-After")
-                    try:
-                        delay = float(retry_after) if retry_after else 0.0
-                    except ValueError:
-                        delay = 0.0
-                    if delay <= 0:
-                        delay = min(
-                            settings.backoff_factor * (2 ** (attempt - 1)),
-                            backoff_cap,
-                        )
-                    time.sleep(delay)
-                    continue
+        def _get_range(
+            url: str,
+            validator: str | None,
+            start: int,
+            end: int,
+        ) -> requests.Response:
+            headers = {"Range": f"bytes={start}-{end}"}
+            if validator:
+                headers["If-Range"] = validator
+            return transport.get(
+                url,
+                headers=headers,
+                min_interval=throttle_seconds,
+                stream=True,
+            )
 
-                return resp
+        def _parallel_eligible(
+            head_resp: requests.Response,
+            declared_size: int,
+        ) -> bool:
+            if parallel_parts <= 1 or not head_resp.ok:
+                return False
+            if declared_size < parallel_min_bytes:
+                return False
+            accept = str(head_resp.headers.get("Accept-Ranges") or "")
+            return "bytes" in accept.lower()
 
-            return last_resp
+        def _bulk_dest(url: str, content_type: str | None) -> Path:
+            dest = _path_for_url(bulk_root, url)
+            if dest.suffix == "":
+                guessed = (content_type or "").lower()
+                if "zip" in guessed:
+                    dest = dest.with_suffix(".zip")
+                elif "json" in guessed:
+                    dest = dest.with_suffix(".json")
+                elif "xml" in guessed:
+                    dest = dest.with_suffix(".xml")
+                else:
+                    dest = dest.with_suffix(".bin")
+            return dest
 
         provider_root = out_root
         bulk_root = provider_root / "bulk"
@@ -2034,22 +2839,16 @@ class USPTOProvider(ProviderPlugin):
 
         bulk_root.mkdir(parents=True, exist_ok=True)
 
-        manifest_records: list[dict[str, Any]] = []
         existing_shas: set[str] = set()
         recorded_urls: set[str] = set()
         existing_by_url: dict[str, dict[str, Any]] = {}
         stale_urls: set[str] = set()
 
-        if manifest_path.exists():
-            try:
-                payload = json.loads(manifest_path.read_text(encoding="utf-8"))
-                if isinstance(payload, list):
-                    manifest_records = [
-                        entry for entry in payload if isinstance(entry, dict)
-                    ]
-            except json.JSONDecodeError:
-                manifest_records = []
-        for rec in manifest_records:
+        manifest_log = ManifestLog(manifest_path)
+        total_bytes = 0
+
+        def _load(rec: dict[str, Any]) -> dict[str, Any]:
+            nonlocal total_bytes
             url_val = rec.get("url")
             if isinstance(url_val, str):
                 fetched_at_raw = rec.get("fetched_at")
@@ -2069,13 +2868,15 @@ class USPTOProvider(ProviderPlugin):
             sha_val = rec.get("sha256")
             if isinstance(sha_val, str):
                 existing_shas.add(sha_val)
-
-        total_bytes = 0
-        for rec in manifest_records:
             try:
                 total_bytes += int(rec.get("size_bytes") or 0)
             except (TypeError, ValueError):
-                continue
+                pass
+            return rec
+
+        run_index = _open_stage_index(
+            out_root, "bulk", map(_load, manifest_log.latest())
+        )
 
         downloaded = 0
         failure_records: list[dict[str, Any]] = []
@@ -2127,82 +2928,205 @@ class USPTOProvider(ProviderPlugin):
                 )
                 continue
 
-            resp = _get_with_backoff(url, prev_entry)
-            if resp is None:
-                failure_records.append(
-                    {
-                        "url": url,
-                        "reason": "request_failed",
-                        "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    }
-                )
-                continue
-            if resp.status_code == 304:
-                recorded_urls.add(url)
-                continue
-            body = resp.content
-            sha = hashlib.sha256(body).hexdigest()
+            head_type = None
+            if head_resp is not None:
+                head_type = head_resp.headers.get("Content-Type")
+            partial = load_partial(_bulk_dest(url, head_type), url)
+            remote_changed = (
+                partial is not None
+                and head_resp is not None
+                and not partial.matches(head_resp.headers)
+            )
+            if partial is not None and (
+                remote_changed or not partial.if_range
+            ):
+                # The remote file changed (or can't be validated): start over.
+                discard_partial(partial.dest)
+                partial = None
+
+            streamed: StreamedFile | None = None
+            source: Any = None
+            if (
+                partial is None
+                and head_resp is not None
+                and declared_size is not None
+                and _parallel_eligible(head_resp, declared_size)
+            ):
+                dest = _bulk_dest(url, head_type)
+                validator = head_resp.headers.get("ETag")
+                if not validator or validator.startswith("W/"):
+                    validator = head_resp.headers.get("Last-Modified")
+                try:
+                    streamed = download_ranges(
+                        functools.partial(_get_range, url, validator),
+                        dest,
+                        size=declared_size,
+                        parts=parallel_parts,
+                    )
+                    source = head_resp
+                except RangeNotSupported:
+                    # Server ignored the ranges, cut one short, or the file
+                    # changed mid-transfer: fall back to a single stream.
+                    streamed = None
+                except requests.RequestException as exc:
+                    failure_records.append(
+                        {
+                            "url": url,
+                            "reason": "request_failed",
+                            "error": str(exc),
+                            "fetched_at": datetime.now(UTC).isoformat(),
+                        }
+                    )
+                    continue
+                except OSError as exc:
+                    failure_records.append(
+                        {
+                            "url": url,
+                            "reason": "range_download_failed",
+                            "error": str(exc),
+                            "fetched_at": datetime.now(UTC).isoformat(),
+                        }
+                    )
+                    continue
+
+            if streamed is None:
+                resp = _get_with_backoff(url, prev_entry, partial)
+                if resp is not None and resp.status_code == 416 and partial:
+                    resp.close()
+                    discard_partial(partial.dest)
+                    partial = None
+                    resp = _get_with_backoff(url, prev_entry)
+                if resp is None:
+                    failure_records.append(
+                        {
+                            "url": url,
+                            "reason": "request_failed",
+                            "fetched_at": datetime.now(UTC).isoformat(),
+                        }
+                    )
+                    continue
+                if resp.status_code == 304:
+                    resp.close()
+                    recorded_urls.add(url)
+                    continue
+                dest = _bulk_dest(url, resp.headers.get("Content-Type"))
+                if partial is not None and partial.dest != dest:
+                    partial = None
+                try:
+                    try:
+                        streamed = stream_to_part(
+                            resp,
+                            dest,
+                            url=url,
+                            partial=partial,
+                            max_bytes=remaining_bytes,
+                        )
+                    except RangeNotSupported:
+                        # The 206 did not continue the part (now dropped):
+                        # fetch the whole file without Range/If-Range.
+                        resp = transport.get(
+                            url,
+                            headers={},
+                            min_interval=throttle_seconds,
+                            stream=True,
+                        )
+                        streamed = stream_to_part(
+                            resp, dest, url=url, max_bytes=remaining_bytes
+                        )
+                except ByteBudgetExceeded as exc:
+                    failure_records.append(
+                        {
+                            "url": url,
+                            "reason": "size_limit",
+                            "size_bytes": exc.received,
+                            "remaining_bytes": remaining_bytes,
+                            "fetched_at": datetime.now(UTC).isoformat(),
+                        }
+                    )
+                    break
+                except UnexpectedStatus as exc:
+                    failure_records.append(
+                        {
+                            "url": url,
+                            "reason": "http_error",
+                            "status_code": exc.status_code,
+                            "fetched_at": datetime.now(UTC).isoformat(),
+                        }
+                    )
+                    continue
+                except requests.RequestException as exc:
+                    failure_records.append(
+                        {
+                            "url": url,
+                            "reason": "request_failed",
+                            "error": str(exc),
+                            "resumable": part_path_for(dest).exists(),
+                            "fetched_at": datetime.now(UTC).isoformat(),
+                        }
+                    )
+                    continue
+                except OSError:
+                    continue
+                source = resp
+            sha = streamed.sha256
+            size_bytes = streamed.size_bytes
             if sha in existing_shas:
+                streamed.discard()
                 continue
-            if max_bulk_bytes > 0 and total_bytes + len(body) > max_bulk_bytes:
-                failure_records.append(
-                    {
-                        "url": url,
-                        "reason": "size_limit",
-                        "size_bytes": len(body),
-                        "remaining_bytes": remaining_bytes,
-                        "fetched_at": datetime.now(timezone.utc).isoformat(),
-                    }
-                )
-                break
-            dest = _path_for_url(bulk_root, url)
-            if dest.suffix == "":
-                guessed = resp.headers.get("Content-Type", "").lower()
-                if "zip" in guessed:
-                    dest = dest.with_suffix(".zip")
-                elif "json" in guessed:
-                    dest = dest.with_suffix(".json")
-                elif "xml" in guessed:
-                    dest = dest.with_suffix(".xml")
-                else:
-                    dest = dest.with_suffix(".bin")
-            dest.parent.mkdir(parents=True, exist_ok=True)
             try:
-                dest.write_bytes(body)
+                streamed.commit(dest)
             except OSError:
+                streamed.discard()
                 continue
+            local_path: str | None = str(dest.relative_to(out_root)).replace(
+                "\\",
+                "/",
+            )
+            blob_fields: dict[str, Any] = {}
+            if blobs is not None:
+                # Move the finished file into the store (another run may
+                # already hold it) and leave a view at the URL path.
+                try:
+                    ref = blobs.adopt(dest, sha)
+                    if not blobs.materialize(sha, dest):
+                        local_path = None
+                except OSError:
+                    continue
+                blob_fields = _blob_fields(blobs, ref)
 
             record = {
                 "url": url,
                 "host": (urlparse(url).hostname or ""),
-                "local_path": str(dest.relative_to(out_root)).replace(
-                    "\\",
-                    "/",
+                "local_path": local_path,
+                "status_code": int(source.status_code),
+                "content_type": source.headers.get("Content-Type"),
+                "etag": source.headers.get("ETag"),
+                "last_modified": source.headers.get("Last-Modified"),
+                "content_length": (
+                    str(size_bytes)
+                    if streamed.resumed_from
+                    else source.headers.get("Content-Length")
                 ),
-                "status_code": int(resp.status_code),
-                "content_type": resp.headers.get("Content-Type"),
-                "etag": resp.headers.get("ETag"),
-                "last_modified": resp.headers.get("Last-Modified"),
-                "content_length": resp.headers.get("Content-Length"),
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
                 "sha256": sha,
-                "size_bytes": len(body),
+                "size_bytes": size_bytes,
+                "resumed_from": streamed.resumed_from,
                 "is_bulk_artifact": True,
                 "is_html": False,
                 "is_api_sample": False,
-                "headers": dict(resp.headers),
+                "headers": dict(source.headers),
+                **blob_fields,
             }
-            manifest_records.append(record)
+            manifest_log.append(record)
+            run_index.record_fetch("bulk", record)
             existing_shas.add(sha)
             recorded_urls.add(url)
-            total_bytes += len(body)
+            total_bytes += size_bytes
             downloaded += 1
 
-        manifest_path.write_text(
-            json.dumps(manifest_records, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        write_jsonl(manifest_path.with_suffix(".jsonl"), manifest_records)
+        manifest_log.close()
+        run_index.replace_failures("bulk", failure_records)
+        run_index.close()
 
         if failure_records:
             write_jsonl(bulk_root / "failures.jsonl", failure_records)
@@ -2212,7 +3136,7 @@ class USPTOProvider(ProviderPlugin):
         if not path.exists():
             return []
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = json_codec.loads(path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
             return []
         if not isinstance(payload, list):
@@ -2242,20 +3166,13 @@ class USPTOProvider(ProviderPlugin):
             "bulk": provider_root / "bulk" / "manifest.json",
         }
 
+        index = RunIndex(index_path_for(provider_root))
         entries: list[dict[str, Any]] = []
         for origin, path in manifest_paths.items():
-            if not path.exists():
-                continue
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                continue
-            if not isinstance(payload, list):
-                continue
-            for rec in payload:
-                if not isinstance(rec, dict):
-                    continue
-                rec = dict(rec)
+            if not index.count(origin):
+                # Manifests written before the index existed.
+                index.record_fetches(origin, ManifestLog(path).latest())
+            for rec in index.fetches(origin):
                 rec["origin"] = origin
                 entries.append(rec)
 
@@ -2275,18 +3192,45 @@ class USPTOProvider(ProviderPlugin):
         }
 
         (provider_root / "run_manifest_summary.json").write_text(
-            json.dumps(summary, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(summary, indent=2) + "\n",
             encoding="utf-8",
         )
 
         self._write_source_coverage(
             provider_root=provider_root,
             entries=entries,
+            index=index,
         )
 
         self._write_failures_summary(
             provider_root=provider_root,
             entries=entries,
+            index=index,
+        )
+        index.close()
+
+    def _write_http_metrics(
+        self,
+        *,
+        out_root: Path,
+        settings: USPTOSettings,
+    ) -> None:
+        """Record per-host concurrency windows and pacing for this run."""
+
+        transport = self._transport_for(settings)
+        concurrency = getattr(transport, "concurrency", None)
+        limiter = getattr(transport, "rate_limiter", None)
+        metrics = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "adaptive_concurrency": concurrency is not None,
+            "concurrency": (
+                {} if concurrency is None else concurrency.snapshot()
+            ),
+            "host_intervals": {} if limiter is None else limiter.snapshot(),
+        }
+        (out_root / "http_metrics.json").write_text(
+            json_codec.dumps(metrics, indent=2) + "\n",
+            encoding="utf-8",
         )
 
     def _write_source_coverage(
@@ -2294,6 +3238,7 @@ class USPTOProvider(ProviderPlugin):
         *,
         provider_root: Path,
         entries: Iterable[dict[str, Any]],
+        index: RunIndex | None = None,
     ) -> None:
         coverage_rows: list[dict[str, Any]] = []
         host_summary: dict[str, dict[str, int]] = {}
@@ -2344,9 +3289,11 @@ class USPTOProvider(ProviderPlugin):
             else:
                 summary["error"] += 1
 
+        if index is not None:
+            index.replace_coverage(coverage_rows)
         coverage_path = provider_root / "coverage_sources.json"
         coverage_path.write_text(
-            json.dumps(coverage_rows, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(coverage_rows, indent=2) + "\n",
             encoding="utf-8",
         )
 
@@ -2397,7 +3344,7 @@ class USPTOProvider(ProviderPlugin):
 
         summary_path = provider_root / "coverage_sources_summary.json"
         summary_path.write_text(
-            json.dumps(summary_rows, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(summary_rows, indent=2) + "\n",
             encoding="utf-8",
         )
 
@@ -2406,12 +3353,18 @@ class USPTOProvider(ProviderPlugin):
         *,
         provider_root: Path,
         entries: Iterable[dict[str, Any]],
+        index: RunIndex | None = None,
     ) -> None:
         sources = {
             "html": provider_root / "failures_additional.jsonl",
             "api_samples": provider_root / "api_samples" / "failures.jsonl",
             "bulk": provider_root / "bulk" / "failures.jsonl",
         }
+        index_origins = {
+            "html": "additional",
+            "api_samples": "api_samples",
+            "bulk": "bulk",
+        }
 
         rows: list[dict[str, Any]] = []
 
@@ -2424,7 +3377,7 @@ class USPTOProvider(ProviderPlugin):
                 return
             for line in lines:
                 try:
-                    rec = json.loads(line)
+                    rec = json_codec.loads(line)
                 except json.JSONDecodeError:
                     continue
                 if isinstance(rec, dict):
@@ -2433,7 +3386,17 @@ class USPTOProvider(ProviderPlugin):
                     rows.append(rec)
 
         for source, path in sources.items():
-            _load_jsonl(path, source)
+            indexed = (
+                index.failures(index_origins[source])
+                if index is not None
+                else []
+            )
+            if not indexed:
+                _load_jsonl(path, source)
+            for rec in indexed:
+                rec.pop("origin", None)
+                rec.setdefault("source", source)
+                rows.append(rec)
 
         for entry in entries:
             url_val = entry.get("url")
@@ -2462,7 +3425,7 @@ class USPTOProvider(ProviderPlugin):
 
         summary_path = provider_root / "failures_summary.json"
         summary_path.write_text(
-            json.dumps(rows, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(rows, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(summary_path.with_suffix(".jsonl"), rows)
@@ -2498,7 +3461,7 @@ class USPTOProvider(ProviderPlugin):
             if not path.exists():
                 continue
             try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
+                payload = json_codec.loads(path.read_text(encoding="utf-8"))
             except json.JSONDecodeError:
                 continue
             if not isinstance(payload, list):
@@ -2535,13 +3498,33 @@ class USPTOProvider(ProviderPlugin):
                 merged.append(cleaned)
         return merged
 
+    def _sitemaps_from_robots_inventory(self, artifacts: Path) -> list[str]:
+        inventory_path = artifacts / "robots_inventory.json"
+        if not inventory_path.exists():
+            return []
+        try:
+            payload = json_codec.loads(
+                inventory_path.read_text(encoding="utf-8")
+            )
+        except json.JSONDecodeError:
+            return []
+        if not isinstance(payload, list):
+            return []
+        sitemaps: list[str] = []
+        for record in payload:
+            if isinstance(record, dict):
+                sitemaps.extend(
+                    str(url) for url in record.get("sitemaps") or []
+                )
+        return sitemaps
+
     def _discover_swagger_urls_from_xhr(self, artifacts: Path) -> list[str]:
         xhr_path = artifacts / "xhr_inventory.json"
         if not xhr_path.exists():
             return []
 
         try:
-            payload = json.loads(xhr_path.read_text(encoding="utf-8"))
+            payload = json_codec.loads(xhr_path.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
             return []
 
@@ -2642,7 +3625,52 @@ class USPTOProvider(ProviderPlugin):
         write_json_fn: Callable[[Path, Iterable[Endpoint]], None],
         write_md_fn: Callable[[Path, Iterable[Endpoint]], None],
     ) -> None:
+        # Fingerprint of what each output slot was last generated from, so
+        # an unchanged spec (304 or same sha) skips regeneration.
+        state_path = artifacts / "swagger_emit_state.json"
+        state: dict[str, str] = {}
+        if state_path.exists():
+            try:
+                loaded = json_codec.loads(
+                    state_path.read_text(encoding="utf-8")
+                )
+            except (OSError, json.JSONDecodeError):
+                loaded = {}
+            if isinstance(loaded, dict):
+                state = {str(k): str(v) for k, v in loaded.items()}
+
         for idx, (name, spec_path, spec) in enumerate(specs):
+            suffix = "" if idx == 0 else f"_{name}"
+            swagger_copy = artifacts / (f"swagger{suffix}{spec_path.suffix or '.json'}")
+            # Fingerprint inputs stay stdlib JSON so stored states match.
+            if spec_path.exists():
+                source_bytes = spec_path.read_bytes()
+            else:
+                source_bytes = json.dumps(
+                    spec, sort_keys=True, default=str
+                ).encode("utf-8")
+            fingerprint = hashlib.sha256(
+                json.dumps(
+                    [
+                        name,
+                        hashlib.sha256(source_bytes).hexdigest(),
+                        list(endpoints_md_columns or []),
+                        list(coverage_md_columns or []),
+                    ]
+                ).encode("utf-8")
+            ).hexdigest()
+            outputs = (
+                artifacts / f"swagger_endpoints{suffix}.json",
+                artifacts / f"swagger_endpoints{suffix}.md",
+                artifacts / f"coverage{suffix}.json",
+                artifacts / f"coverage{suffix}.md",
+                swagger_copy,
+            )
+            if state.get(suffix) == fingerprint and all(
+                path.exists() for path in outputs
+            ):
+                continue
+
             endpoints = list(extract_fn(spec))
             if not endpoints and isinstance(spec.get("paths"), dict):
                 for raw_path, methods in spec["paths"].items():
@@ -2684,7 +3712,6 @@ class USPTOProvider(ProviderPlugin):
                     getattr(ep, "method", ""),
                 ),
             )
-            suffix = "" if idx == 0 else f"_{name}"
 
             write_json_fn(
                 artifacts / f"swagger_endpoints{suffix}.json",
@@ -2712,15 +3739,19 @@ class USPTOProvider(ProviderPlugin):
                 columns=(list(coverage_md_columns) if coverage_md_columns else None),
             )
 
-            swagger_copy = artifacts / (f"swagger{suffix}{spec_path.suffix or '.json'}")
             if spec_path.exists():
-                swagger_copy.write_bytes(spec_path.read_bytes())
+                swagger_copy.write_bytes(source_bytes)
             else:
                 swagger_copy.write_text(
-                    json.dumps(spec, indent=2, ensure_ascii=False) + "\n",
+                    json_codec.dumps(spec, indent=2) + "\n",
                     encoding="utf-8",
                 )
+            state[suffix] = fingerprint
 
+        state_path.write_text(
+            json_codec.dumps(state, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
         provider_root = artifacts.parent
         self._write_coverage_summary(provider_root=provider_root)
 
@@ -2835,7 +3866,7 @@ class USPTOProvider(ProviderPlugin):
                 }
             )
         json_path.write_text(
-            json.dumps(coverage, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(coverage, indent=2) + "\n",
             encoding="utf-8",
         )
 
@@ -2887,7 +3918,9 @@ class USPTOProvider(ProviderPlugin):
         summary: dict[str, dict[str, Any]] = {}
         for cov_path in coverage_files:
             try:
-                entries = json.loads(cov_path.read_text(encoding="utf-8"))
+                entries = json_codec.loads(
+                    cov_path.read_text(encoding="utf-8")
+                )
             except json.JSONDecodeError:
                 continue
             if not isinstance(entries, list):
@@ -2925,7 +3958,7 @@ class USPTOProvider(ProviderPlugin):
 
         coverage_summary = provider_root / "coverage_summary.json"
         coverage_summary.write_text(
-            json.dumps(output, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(output, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(coverage_summary.with_suffix(".jsonl"), output)
@@ -2941,7 +3974,7 @@ class USPTOProvider(ProviderPlugin):
         import re
 
         opts = ctx.options
-        settings = self._settings_from_ctx(opts)
+        settings = self._settings_from_ctx(opts, ctx.out_dir)
         provider_root = ctx.out_dir
         if provider_root.name.lower() != USPTO_PROVIDER_ID.lower():
             provider_root = ctx.out_dir / "raw" / "harvester" / USPTO_PROVIDER_ID
@@ -2970,7 +4003,9 @@ class USPTOProvider(ProviderPlugin):
             entries: list[dict[str, Any]] = []
             for cov_path in coverage_files:
                 try:
-                    payload = json.loads(cov_path.read_text(encoding="utf-8"))
+                    payload = json_codec.loads(
+                        cov_path.read_text(encoding="utf-8")
+                    )
                 except json.JSONDecodeError:
                     continue
                 if isinstance(payload, list):
@@ -3127,7 +4162,7 @@ class USPTOProvider(ProviderPlugin):
 
         json_path = samples_root / "curl_templates.json"
         json_path.write_text(
-            json.dumps(templates, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(templates, indent=2) + "\n",
             encoding="utf-8",
         )
 
@@ -3171,51 +4206,126 @@ class USPTOProvider(ProviderPlugin):
     ) -> list[tuple[str, Path, dict[str, Any]]]:
         import requests
 
-        if not swagger_urls:
+        urls = [str(url) for url in swagger_urls or []]
+        if not urls:
             return []
 
         artifacts_dir.mkdir(parents=True, exist_ok=True)
-        results: list[tuple[str, Path, dict[str, Any]]] = []
-        for idx, url in enumerate(swagger_urls):
+        transport = self._transport_for(settings)
+        cache_path = artifacts_dir / "swagger_fetch_cache.json"
+        cache: dict[str, dict[str, Any]] = {}
+        if cache_path.exists():
             try:
-                resp = requests.get(
-                    url,
-                    headers={"User-Agent": settings.user_agent},
-                    timeout=int(settings.http_timeout),
+                loaded = json_codec.loads(
+                    cache_path.read_text(encoding="utf-8")
                 )
+            except (OSError, json.JSONDecodeError):
+                loaded = {}
+            if isinstance(loaded, dict):
+                cache = {
+                    str(key): val
+                    for key, val in loaded.items()
+                    if isinstance(val, dict)
+                }
+        parsed_specs: dict[tuple[str, str], dict[str, Any]] = getattr(
+            self, "_swagger_spec_memo", {}
+        )
+        self._swagger_spec_memo = parsed_specs
+
+        def _cached_body(url: str, name: str) -> bytes | None:
+            # Only revalidate against a body still on disk under the same
+            # name; otherwise a 304 would leave nothing to parse.
+            prev = cache.get(url)
+            if not prev or prev.get("name") != name:
+                return None
+            try:
+                body = (artifacts_dir / f"swagger_{name}.json").read_bytes()
+            except OSError:
+                return None
+            if hashlib.sha256(body).hexdigest() != prev.get("sha256"):
+                return None
+            return body
+
+        def _fetch(idx: int) -> tuple[Any, bytes | None]:
+            url = urls[idx]
+            cached = _cached_body(url, f"live{idx}")
+            headers = _conditional_headers(cache.get(url) if cached else None)
+            try:
+                resp = transport.get(url, headers=headers or None)
             except requests.RequestException:
+                return None, cached
+            return resp, cached
+
+        workers = max(1, min(8, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(_fetch, range(len(urls))))
+
+        results: list[tuple[str, Path, dict[str, Any]]] = []
+        for idx, (url, (resp, cached)) in enumerate(zip(urls, fetched)):
+            if resp is None:
                 continue
 
             name = f"live{idx}"
-            content = resp.content
-            meta = {
+            out_path = artifacts_dir / f"swagger_{name}.json"
+            not_modified = False
+            if cached is not None and int(resp.status_code) == 304:
+                not_modified = True
+                content = cached
+            else:
+                content = resp.content
+            sha = hashlib.sha256(content).hexdigest()
+            meta: dict[str, Any] = {
                 "url": url,
                 "status_code": resp.status_code,
-                "sha256": hashlib.sha256(content).hexdigest(),
+                "sha256": sha,
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
             }
+            if not_modified:
+                meta["not_modified"] = True
             meta_path = artifacts_dir / f"swagger_{name}.meta.json"
             meta_path.write_text(
-                json.dumps(meta, indent=2, ensure_ascii=False) + "\n",
+                json_codec.dumps(meta, indent=2) + "\n",
                 encoding="utf-8",
             )
             resp_ok = getattr(resp, "ok", None)
             if resp_ok is None:
                 resp_ok = int(getattr(resp, "status_code", 0)) < 400
-            if not resp_ok:
+            if not (resp_ok or not_modified):
                 continue
-            try:
-                spec = resp.json()
-            except ValueError:
-                continue
-
-            if isinstance(spec, dict):
-                spec["_source_url"] = url
 
-            out_path = artifacts_dir / f"swagger_{name}.json"
-            out_path.write_bytes(content)
+            spec = parsed_specs.get((url, sha))
+            if spec is None:
+                try:
+                    spec = (
+                        json_codec.loads(content)
+                        if not_modified
+                        else resp.json()
+                    )
+                except ValueError:
+                    continue
+                if isinstance(spec, dict):
+                    spec["_source_url"] = url
+                    parsed_specs[(url, sha)] = spec
+
+            if content != cached:
+                out_path.write_bytes(content)
+            headers = getattr(resp, "headers", None) or {}
+            prev = cache.get(url) or {}
+            cache[url] = {
+                "name": name,
+                "etag": headers.get("ETag") or prev.get("etag"),
+                "last_modified": (
+                    headers.get("Last-Modified") or prev.get("last_modified")
+                ),
+                "sha256": sha,
+            }
             results.append((name, out_path, cast(dict[str, Any], spec)))
 
+        if results:
+            cache_path.write_text(
+                json_codec.dumps(cache, indent=2, sort_keys=True) + "\n",
+                encoding="utf-8",
+            )
         return results
 
     def _inventory_bulk_listings(
@@ -3227,14 +4337,13 @@ class USPTOProvider(ProviderPlugin):
         throttle_seconds: float,
         max_pages: int,
     ) -> set[str]:
-        import re
-        import time
         from collections import deque
 
         import requests
 
         listings_root = artifacts / "bulk_listings"
         listings_root.mkdir(parents=True, exist_ok=True)
+        transport = self._transport_for(settings)
 
         records: list[dict[str, Any]] = []
         discovered_assets: set[str] = set()
@@ -3258,11 +4367,7 @@ class USPTOProvider(ProviderPlugin):
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
             }
             try:
-                resp = requests.get(
-                    url_val,
-                    headers={"User-Agent": settings.user_agent},
-                    timeout=int(settings.http_timeout),
-                )
+                resp = transport.get(url_val, min_interval=throttle_seconds)
             except requests.RequestException as exc:
                 entry["status"] = "error"
                 entry["error"] = str(exc)
@@ -3271,9 +4376,6 @@ class USPTOProvider(ProviderPlugin):
 
             pages_processed += 1
 
-            if throttle_seconds > 0:
-                time.sleep(throttle_seconds)
-
             entry["status_code"] = int(resp.status_code)
             entry["content_type"] = resp.headers.get("Content-Type")
             entry["etag"] = resp.headers.get("ETag")
@@ -3305,11 +4407,10 @@ class USPTOProvider(ProviderPlugin):
             discovered: set[str] = set()
             new_listing_pages: set[str] = set()
             if resp.ok:
-                try:
-                    text = resp.text
-                except UnicodeDecodeError:
-                    text = ""
-                for match in re.findall(r'https?://[^\s"\'<>]+', text):
+                for link in extract_links(body, url_val):
+                    if link.kind == LINK_ASSET:
+                        continue
+                    match = link.url
                     parsed = urlparse(match)
                     host = (parsed.hostname or parsed.netloc or "").lower()
                     if not host or not _host_allowed(host):
@@ -3337,7 +4438,7 @@ class USPTOProvider(ProviderPlugin):
 
         listings_path = artifacts / "bulk_listings.json"
         listings_path.write_text(
-            json.dumps(records, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(records, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(listings_path.with_suffix(".jsonl"), records)
@@ -3356,27 +4457,27 @@ class USPTOProvider(ProviderPlugin):
         settings: USPTOSettings,
         throttle_seconds: float,
         max_bytes_for_hash: int = 10_000_000,
+        concurrency: int = 8,
     ) -> None:
-        import time
-
         import requests
 
         provider_root = artifacts.parent
         bulk_root = provider_root / "bulk"
         catalog_path = bulk_root / "index.jsonl"
         bulk_root.mkdir(parents=True, exist_ok=True)
+        transport = self._transport_for(settings)
 
         existing: set[str] = set()
         if catalog_path.exists():
             for line in catalog_path.read_text(encoding="utf-8").splitlines():
                 try:
-                    rec = json.loads(line)
+                    rec = json_codec.loads(line)
                 except json.JSONDecodeError:
                     continue
                 if isinstance(rec, dict) and isinstance(rec.get("url"), str):
                     existing.add(rec["url"])
 
-        records: list[dict[str, Any]] = []
+        candidates: list[tuple[str, str]] = []
         for raw_url in assets:
             url = str(raw_url).strip()
             if not url or url in existing:
@@ -3385,7 +4486,11 @@ class USPTOProvider(ProviderPlugin):
             host = (parsed.hostname or parsed.netloc or "").lower()
             if not host or not _host_allowed(host):
                 continue
+            candidates.append((url, host))
+            existing.add(url)
 
+        def _catalog_one(candidate: tuple[str, str]) -> dict[str, Any]:
+            url, host = candidate
             entry: dict[str, Any] = {
                 "url": url,
                 "host": host,
@@ -3393,17 +4498,11 @@ class USPTOProvider(ProviderPlugin):
             }
 
             try:
-                head_resp = requests.head(
-                    url,
-                    headers={"User-Agent": settings.user_agent},
-                    timeout=int(settings.http_timeout),
-                    allow_redirects=True,
-                )
+                head_resp = transport.head(url, min_interval=throttle_seconds)
             except requests.RequestException as exc:
                 entry["status"] = "error"
                 entry["error"] = str(exc)
-                records.append(entry)
-                continue
+                return entry
 
             entry["status_code"] = int(head_resp.status_code)
             entry["etag"] = head_resp.headers.get("ETag")
@@ -3411,9 +4510,6 @@ class USPTOProvider(ProviderPlugin):
             entry["content_type"] = head_resp.headers.get("Content-Type")
             entry["content_length"] = head_resp.headers.get("Content-Length")
 
-            if throttle_seconds > 0:
-                time.sleep(throttle_seconds)
-
             size_bytes: int | None = None
             sha_val: str | None = None
             should_hash = False
@@ -3434,43 +4530,53 @@ class USPTOProvider(ProviderPlugin):
 
             if should_hash:
                 try:
-                    get_resp = requests.get(
+                    get_resp = transport.get(
                         url,
-                        headers={"User-Agent": settings.user_agent},
-                        timeout=int(settings.http_timeout),
                         stream=True,
+                        min_interval=throttle_seconds,
                     )
-                    if throttle_seconds > 0:
-                        time.sleep(throttle_seconds)
                 except requests.RequestException as exc:  # pragma: no cover
                     entry["hash_status"] = "error"
                     entry["hash_error"] = str(exc)
                 else:
                     sha = hashlib.sha256()
                     counted = 0
-                    for chunk in get_resp.iter_content(chunk_size=8192):
-                        if not chunk:
-                            continue
-                        sha.update(chunk)
-                        counted += len(chunk)
-                        if 0 < max_bytes_for_hash < counted:
-                            break
-                    sha_val = sha.hexdigest()
-                    entry["hash_status"] = "ok"
-                    size_bytes = counted if size_bytes is None else size_bytes
+                    try:
+                        for chunk in get_resp.iter_content(chunk_size=8192):
+                            if not chunk:
+                                continue
+                            sha.update(chunk)
+                            counted += len(chunk)
+                            if 0 < max_bytes_for_hash < counted:
+                                break
+                    except requests.RequestException as exc:
+                        entry["hash_status"] = "error"
+                        entry["hash_error"] = str(exc)
+                    else:
+                        sha_val = sha.hexdigest()
+                        entry["hash_status"] = "ok"
+                        if size_bytes is None:
+                            size_bytes = counted
+                    finally:
+                        get_resp.close()
 
             if size_bytes is not None:
                 entry["size_bytes"] = size_bytes
             if sha_val:
                 entry["sha256"] = sha_val
+            return entry
 
-            records.append(entry)
-            existing.add(url)
-
-        if records:
-            with catalog_path.open("a", encoding="utf-8") as fh:
-                for rec in records:
-                    fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        if not candidates:
+            return
+        # Results come back in submission order, so index.jsonl stays
+        # deterministic however the worker threads interleave.
+        workers = max(1, min(int(concurrency), len(candidates)))
+        with (
+            ThreadPoolExecutor(max_workers=workers) as pool,
+            catalog_path.open("a", encoding="utf-8") as fh,
+        ):
+            for entry in pool.map(_catalog_one, candidates):
+                fh.write(json_codec.dumps(entry, compact=True) + "\n")
 
     def _inventory_xhr_endpoints(
         self,
@@ -3480,85 +4586,74 @@ class USPTOProvider(ProviderPlugin):
         settings: USPTOSettings,
         throttle_seconds: float,
         use_playwright: bool | None = None,
+        browser_concurrency: int = 4,
     ) -> None:
-        import re
-        import time
-
         import requests
 
         xhr_root = artifacts / "xhr_inventory"
         xhr_root.mkdir(parents=True, exist_ok=True)
+        transport = self._transport_for(settings)
 
         records: list[dict[str, Any]] = []
 
         if use_playwright is None:
             use_playwright = bool(settings.throttle_seconds is not None)
-        sync_playwright: Callable[[], Any] | None = None
 
-        for page in pages:
-            page_url = str(page).strip()
-            if not page_url:
-                continue
+        page_urls = [url for url in (str(p).strip() for p in pages) if url]
+        network_calls_by_page: dict[str, list[dict[str, Any]]] = {
+            url: [] for url in page_urls
+        }
+        rendered: dict[str, RenderedPage | BrowserError] = {}
+        if use_playwright and page_urls:
+            # One browser for the whole stage; pages render concurrently in
+            # isolated contexts instead of paying a launch per URL.
+            injected = getattr(self, "browser_pool", None)
+            pool = injected or BrowserPool(
+                user_agent=settings.user_agent,
+                max_pages=browser_concurrency,
+            )
+            unique_urls = list(dict.fromkeys(page_urls))
+            try:
+                results = pool.render_many(
+                    unique_urls,
+                    timeout_ms=int(settings.http_timeout * 1000),
+                    on_request=lambda page_url, req: (
+                        self._maybe_record_request(
+                            req, network_calls_by_page[page_url]
+                        )
+                    ),
+                )
+                rendered = dict(zip(unique_urls, results, strict=True))
+            except BrowserUnavailable:
+                rendered = {}
+            finally:
+                if injected is None:
+                    pool.close()
+
+        for page_url in page_urls:
             entry: dict[str, Any] = {
                 "page_url": page_url,
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
             }
-            network_calls: list[dict[str, Any]] = []
-            if use_playwright:
-                try:
-                    from playwright.sync_api import (  # type: ignore[import]
-                        sync_playwright as _sync_playwright,
-                    )
-
-                    sync_playwright = _sync_playwright
-                except ImportError:
-                    use_playwright = False
-
-            can_playwright = bool(use_playwright and sync_playwright)
-
-            if can_playwright:
-                try:
-                    assert sync_playwright is not None
-                    with sync_playwright() as pw:
-                        browser = pw.chromium.launch(headless=True)
-                        page_obj = browser.new_page(
-                            user_agent=settings.user_agent,
-                        )
-                        try:
-                            page_obj.on(
-                                "request",
-                                self._make_request_handler(network_calls),
-                            )
-                            response = page_obj.goto(
-                                page_url,
-                                timeout=int(settings.http_timeout * 1000),
-                            )
-                            page_obj.wait_for_load_state("networkidle")
-                            body = page_obj.content().encode("utf-8")
-                            resp_status = response.status if response else 200
-                            content_type = (
-                                response.headers.get("content-type")
-                                if response
-                                else "text/html"
-                            )
-                        finally:
-                            browser.close()
-                    entry["status_code"] = int(resp_status)
-                    entry["content_type"] = content_type
-                    entry["sha256"] = hashlib.sha256(body).hexdigest()
-                    entry["size_bytes"] = len(body)
-                    entry["network_calls"] = network_calls
-                except (RuntimeError, ValueError, TypeError) as exc:
-                    entry["status"] = "error"
-                    entry["error"] = str(exc)
-                    records.append(entry)
-                    continue
+            network_calls = network_calls_by_page[page_url]
+            result = rendered.get(page_url)
+            if isinstance(result, BrowserError):
+                entry["status"] = "error"
+                entry["error"] = str(result)
+                records.append(entry)
+                continue
+            if result is not None:
+                body = result.body
+                entry["status_code"] = result.status_code
+                entry["content_type"] = result.content_type
+                entry["sha256"] = hashlib.sha256(body).hexdigest()
+                entry["size_bytes"] = len(body)
+                entry["network_calls"] = network_calls
             else:
                 try:
-                    resp = requests.get(
+                    resp = transport.get(
                         page_url,
-                        headers={"User-Agent": settings.user_agent},
-                        timeout=int(settings.http_timeout),
+                        min_interval=throttle_seconds,
                     )
                 except requests.RequestException as exc:
                     entry["status"] = "error"
@@ -3566,9 +4661,6 @@ class USPTOProvider(ProviderPlugin):
                     records.append(entry)
                     continue
 
-                if throttle_seconds > 0:
-                    time.sleep(throttle_seconds)
-
                 entry["status_code"] = int(resp.status_code)
                 entry["content_type"] = resp.headers.get("Content-Type")
 
@@ -3578,30 +4670,18 @@ class USPTOProvider(ProviderPlugin):
 
                 if resp.ok:
                     discovered: set[str] = set()
-                    try:
-                        text = resp.text
-                    except UnicodeDecodeError:
-                        text = ""
-                    for match in re.findall(r"https?://[^\s\"'<>]+", text):
-                        parsed = urlparse(match)
+                    # Endpoints are usually named in inline scripts, so
+                    # those are scanned here; assets are not endpoints.
+                    for link in extract_links(
+                        body, page_url, script_urls=True
+                    ):
+                        if link.kind == LINK_ASSET:
+                            continue
+                        parsed = urlparse(link.url)
                         host = (parsed.hostname or parsed.netloc or "").lower()
                         if not host or not _host_allowed(host):
                             continue
-                        lower_path = parsed.path.lower()
-                        if lower_path.endswith(
-                            (
-                                ".js",
-                                ".css",
-                                ".png",
-                                ".jpg",
-                                ".jpeg",
-                                ".gif",
-                                ".svg",
-                                ".ico",
-                            )
-                        ):
-                            continue
-                        discovered.add(match)
+                        discovered.add(link.url)
                     entry["discovered_urls"] = sorted(discovered)
 
             dest = _path_for_url(xhr_root, page_url)
@@ -3620,7 +4700,7 @@ class USPTOProvider(ProviderPlugin):
 
         xhr_inventory = artifacts / "xhr_inventory.json"
         xhr_inventory.write_text(
-            json.dumps(records, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(records, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(xhr_inventory.with_suffix(".jsonl"), records)
@@ -3652,14 +4732,6 @@ class USPTOProvider(ProviderPlugin):
             }
         )
 
-    def _make_request_handler(
-        self, bucket: list[dict[str, Any]]
-    ) -> Callable[[Any], None]:
-        def _handler(req: Any) -> None:
-            self._maybe_record_request(req, bucket)
-
-        return _handler
-
     def _inventory_robots(
         self,
         *,
@@ -3667,51 +4739,39 @@ class USPTOProvider(ProviderPlugin):
         artifacts: Path,
         settings: USPTOSettings,
     ) -> None:
-        from urllib import robotparser
-
-        import requests
-
         robots_dir = artifacts / "robots"
         robots_dir.mkdir(parents=True, exist_ok=True)
+        transport = self._transport_for(settings)
+        robots = self._robots_cache_for(settings, store_dir=robots_dir)
 
         records: list[dict[str, Any]] = []
-        for host in hosts:
-            host_val = str(host).strip().lower()
-            if not host_val:
-                continue
-            robots_url = f"https://{host_val}/robots.txt"
+        for robots_entry in robots.prefetch(str(host) for host in hosts):
+            host_val = robots_entry.host
             entry: dict[str, Any] = {
                 "host": host_val,
-                "robots_url": robots_url,
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "robots_url": robots_entry.robots_url,
+                "fetched_at": robots_entry.fetched_at_iso,
             }
-            try:
-                resp = requests.get(
-                    robots_url,
-                    headers={"User-Agent": settings.user_agent},
-                    timeout=int(settings.http_timeout),
-                )
-            except requests.RequestException as exc:  # pragma: no cover
+            if robots_entry.error is not None:  # pragma: no cover
                 entry["status"] = "error"
-                entry["error"] = str(exc)
+                entry["error"] = robots_entry.error
                 records.append(entry)
                 continue
 
-            entry["status_code"] = int(resp.status_code)
-            if not resp.ok:
+            entry["status_code"] = robots_entry.status_code
+            if not robots_entry.ok:
                 entry["status"] = "error"
                 records.append(entry)
                 continue
             entry["status"] = "ok"
 
-            text = resp.text
+            text = robots_entry.text
             (robots_dir / f"robots_{host_val}.txt").write_text(
                 text,
                 encoding="utf-8",
             )
             lines = text.splitlines()
-            rp = robotparser.RobotFileParser()
-            rp.parse(lines)
+            rp = robots_entry.parser
 
             crawl_delay = rp.crawl_delay(settings.user_agent)
             entry["crawl_delay"] = crawl_delay
@@ -3741,9 +4801,13 @@ class USPTOProvider(ProviderPlugin):
             entry["sitemaps"] = sitemaps
             records.append(entry)
 
+        limiter = getattr(transport, "rate_limiter", None)
+        if limiter is not None:
+            limiter.apply_robots_records(records)
+
         inventory_path = artifacts / "robots_inventory.json"
         inventory_path.write_text(
-            json.dumps(records, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(records, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(inventory_path.with_suffix(".jsonl"), records)
@@ -3773,7 +4837,7 @@ class USPTOProvider(ProviderPlugin):
 
         summary_path = artifacts / "robots_summary.json"
         summary_path.write_text(
-            json.dumps(summary, indent=2, ensure_ascii=False) + "\n",
+            json_codec.dumps(summary, indent=2) + "\n",
             encoding="utf-8",
         )
         write_jsonl(summary_path.with_suffix(".jsonl"), summary)
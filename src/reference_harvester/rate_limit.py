@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+# Statuses that mean "slow down" rather than "this URL is broken".
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(
+    value: str | None,
+    *,
+    now: datetime | None = None,
+) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) to seconds."""
+
+    if value is None:
+        return None
+    raw = str(value).strip()
+    if not raw:
+        return None
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(raw)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    current = now or datetime.now(UTC)
+    return max(0.0, (when - current).total_seconds())
+
+
+class HostRateLimiter:
+    """Per-host request pacing (token bucket in its GCRA form).
+
+    Each host gets its own minimum interval between request starts, so a
+    slow or strict host never delays requests to other hosts. The interval
+    for a host is, in order of precedence:
+
+    1. an explicit override (`overrides`, e.g. from `host_rate_limits`),
+    2. otherwise the larger of `default_interval`, the robots.txt
+       `Crawl-delay`, and any interval learned from 429/503 responses.
+
+    A learned interval doubles on each 429/503 and is multiplied by
+    `recovery` on each 2xx, so a host that stops throttling gets its
+    normal pace back; it is forgotten once it falls below one second.
+
+    Callers may pass a per-call `floor` (a stage's `throttle_seconds`).
+    `burst` lets a host absorb that many back-to-back requests before
+    spacing kicks in. Thread-safe; `reserve` never blocks.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_interval: float = 0.0,
+        overrides: Mapping[str, float] | None = None,
+        burst: int = 1,
+        max_interval: float = 60.0,
+        recovery: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.default_interval = max(0.0, float(default_interval))
+        self.overrides = {
+            str(host).lower(): max(0.0, float(seconds))
+            for host, seconds in (overrides or {}).items()
+        }
+        self.burst = max(1, int(burst))
+        self.max_interval = max_interval
+        self.recovery = min(1.0, max(0.0, float(recovery)))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._crawl_delays: dict[str, float] = {}
+        self._learned: dict[str, float] = {}
+        self._tat: dict[str, float] = {}
+        self._blocked_until: dict[str, float] = {}
+
+    def set_crawl_delay(self, host: str, delay: float | None) -> None:
+        if delay is None:
+            return
+        try:
+            seconds = float(delay)
+        except (TypeError, ValueError):
+            return
+        with self._lock:
+            self._crawl_delays[host.lower()] = max(0.0, seconds)
+
+    def apply_robots_records(
+        self,
+        records: Iterable[Mapping[str, Any]],
+    ) -> None:
+        """Load `crawl_delay` values from `robots_inventory.json` rows."""
+
+        for record in records:
+            if not isinstance(record, Mapping):
+                continue
+            host = str(record.get("host") or "").strip()
+            if host:
+                self.set_crawl_delay(host, record.get("crawl_delay"))
+
+    def interval(self, host: str, floor: float = 0.0) -> float:
+        host = host.lower()
+        with self._lock:
+            return self._interval_locked(host, floor)
+
+    def _interval_locked(self, host: str, floor: float) -> float:
+        if host in self.overrides:
+            return max(self.overrides[host], self._learned.get(host, 0.0))
+        return max(
+            floor,
+            self.default_interval,
+            self._crawl_delays.get(host, 0.0),
+            self._learned.get(host, 0.0),
+        )
+
+    def _wait_locked(self, host: str, interval: float, now: float) -> float:
+        tolerance = interval * (self.burst - 1)
+        tat = self._tat.get(host, now)
+        wait = max(0.0, tat - tolerance - now)
+        return max(wait, self._blocked_until.get(host, now) - now)
+
+    def delay(self, host: str, floor: float = 0.0) -> float:
+        """Seconds until `host` may be hit again, without reserving."""
+
+        host = host.lower()
+        with self._lock:
+            interval = self._interval_locked(host, floor)
+            return self._wait_locked(host, interval, self._clock())
+
+    def reserve(self, host: str, floor: float = 0.0) -> float:
+        """Claim the next slot for `host`; return how long to wait for it."""
+
+        host = host.lower()
+        with self._lock:
+            now = self._clock()
+            interval = self._interval_locked(host, floor)
+            wait = self._wait_locked(host, interval, now)
+            start = now + wait
+            self._tat[host] = max(self._tat.get(host, now), start) + interval
+            return wait
+
+    def acquire(self, host: str, floor: float = 0.0) -> None:
+        wait = self.reserve(host, floor)
+        if wait > 0:
+            self._sleep(wait)
+
+    def observe(
+        self,
+        host: str,
+        status_code: int,
+        retry_after: str | None = None,
+    ) -> None:
+        """Learn from a response: back off a host that says slow down."""
+
+        status = int(status_code)
+        host = host.lower()
+        if 200 <= status < 300:
+            with self._lock:
+                learned = self._learned.get(host)
+                if learned is None:
+                    return
+                learned *= self.recovery
+                if learned < 1.0:
+                    del self._learned[host]
+                else:
+                    self._learned[host] = learned
+            return
+        if status not in THROTTLE_STATUSES:
+            return
+        pause = parse_retry_after(retry_after)
+        with self._lock:
+            now = self._clock()
+            current = self._interval_locked(host, 0.0)
+            learned = min(self.max_interval, max(current * 2, 1.0))
+            self._learned[host] = max(self._learned.get(host, 0.0), learned)
+            if pause is None:
+                pause = learned
+            self._blocked_until[host] = max(
+                self._blocked_until.get(host, now),
+                now + pause,
+            )
+
+    def snapshot(self) -> dict[str, float]:
+        """Current effective interval for every host seen so far."""
+
+        with self._lock:
+            hosts = (
+                set(self.overrides)
+                | set(self._crawl_delays)
+                | set(self._learned)
+                | set(self._tat)
+            )
+            return {
+                host: self._interval_locked(host, 0.0)
+                for host in sorted(hosts)
+            }
+
+
+__all__ = ["THROTTLE_STATUSES", "HostRateLimiter", "parse_retry_after"]
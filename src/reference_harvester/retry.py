@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import random
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from reference_harvester.rate_limit import parse_retry_after
+
+T = TypeVar("T")
+
+# getaddrinfo errors that mean "this name does not exist" (as opposed to
+# EAI_AGAIN, a transient resolver failure that is worth retrying).
+_UNRESOLVABLE_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(socket, "EAI_NONAME", None),
+        getattr(socket, "EAI_NODATA", None),
+    )
+    if code is not None
+)
+
+
+def is_unresolvable_host(exc: BaseException) -> bool:
+    """True if `exc` (or anything it wraps) is a hard DNS lookup failure.
+
+    Walks `__cause__`/`__context__`, exception args, and urllib3's
+    `reason` attribute so it sees through requests and httpx wrappers.
+    """
+
+    stack: list[BaseException] = [exc]
+    seen: set[int] = set()
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, socket.gaierror):
+            return current.errno in _UNRESOLVABLE_ERRNOS
+        linked = [
+            current.__cause__,
+            current.__context__,
+            getattr(current, "reason", None),
+            *current.args,
+        ]
+        stack.extend(
+            item for item in linked if isinstance(item, BaseException)
+        )
+    return False
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"circuit open for {host}; retry in {retry_in:.1f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+@dataclass
+class _HostCircuit:
+    failures: int = 0
+    opened_at: float | None = None
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """Per-host breaker that stops sending to a host after repeated 5xx.
+
+    After `failure_threshold` consecutive failures (5xx or transport
+    errors) a host's circuit opens and every call fails fast for
+    `reset_after` seconds. Then a single probe request is let through:
+    success closes the circuit, failure re-opens it. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_after: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_after = max(0.0, float(reset_after))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._hosts: dict[str, _HostCircuit] = {}
+
+    def allow(self, host: str) -> float:
+        """Return 0.0 if `host` may be called, else seconds until it may."""
+
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None or state.opened_at is None:
+                return 0.0
+            remaining = state.opened_at + self.reset_after - self._clock()
+            if remaining > 0:
+                return remaining
+            if state.probing:
+                return self.reset_after
+            state.probing = True
+            return 0.0
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def trip(self, host: str) -> None:
+        """Open `host`'s circuit now, regardless of the failure count."""
+
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostCircuit())
+            state.failures = max(state.failures, self.failure_threshold)
+            state.opened_at = self._clock()
+            state.probing = False
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts.setdefault(host, _HostCircuit())
+            state.failures += 1
+            if state.probing or state.failures >= self.failure_threshold:
+                state.opened_at = self._clock()
+                state.probing = False
+
+    def is_open(self, host: str) -> bool:
+        with self._lock:
+            state = self._hosts.get(host)
+            return state is not None and state.opened_at is not None
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {
+                host: {
+                    "failures": state.failures,
+                    "open": state.opened_at is not None,
+                }
+                for host, state in sorted(self._hosts.items())
+            }
+
+
+def _is_retryable(status: int) -> bool:
+    return status == 429 or status >= 500
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with decorrelated jitter, shared by all stages.
+
+    `call(send, host=...)` runs `send()` up to `max_attempts` times. It
+    retries on the exception types in `retry_on` and on 429/5xx
+    responses, returning the last response once attempts run out. Each
+    wait is `uniform(base_delay, previous * 3)` capped at `max_delay`, or
+    the server's Retry-After (seconds or HTTP-date) when that is longer.
+    A Retry-After beyond `max_retry_after` is not waited for; the
+    response is returned as-is. With a `breaker`, hosts with an open
+    circuit raise `CircuitOpenError` without sending anything.
+
+    Errors for which `fatal(exc)` is true (by default: the host name does
+    not resolve) are raised immediately and trip the host's breaker, so a
+    dead host costs one lookup rather than a backoff per queued URL.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    max_retry_after: float = 300.0
+    breaker: CircuitBreaker | None = None
+    fatal: Callable[[BaseException], bool] = is_unresolvable_host
+    sleep: Callable[[float], None] = time.sleep
+    rng: random.Random = field(default_factory=random.Random)
+
+    def next_delay(self, previous: float) -> float:
+        base = max(0.0, self.base_delay)
+        upper = max(base, previous * 3)
+        return min(self.max_delay, self.rng.uniform(base, upper))
+
+    def call(
+        self,
+        send: Callable[[], T],
+        *,
+        host: str,
+        retry_on: tuple[type[BaseException], ...] = (OSError,),
+    ) -> T:
+        attempts = max(1, int(self.max_attempts))
+        delay = self.base_delay
+        breaker = self.breaker
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None:
+                retry_in = breaker.allow(host)
+                if retry_in > 0:
+                    raise CircuitOpenError(host, retry_in)
+            try:
+                resp = send()
+            except retry_on as exc:
+                if self.fatal(exc):
+                    if breaker is not None:
+                        breaker.trip(host)
+                    raise
+                if breaker is not None:
+                    breaker.record_failure(host)
+                if attempt == attempts:
+                    raise
+                delay = self.next_delay(delay)
+                self.sleep(delay)
+                continue
+
+            status = getattr(resp, "status_code", None)
+            if not isinstance(status, int) or not _is_retryable(status):
+                if breaker is not None:
+                    breaker.record_success(host)
+                return resp
+            if breaker is not None:
+                if status >= 500:
+                    breaker.record_failure(host)
+                else:
+                    # 429: the host is up, just busy.
+                    breaker.record_success(host)
+            if attempt == attempts:
+                return resp
+            headers = getattr(resp, "headers", None) or {}
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None and retry_after > self.max_retry_after:
+                return resp
+            close = getattr(resp, "close", None)
+            if callable(close):
+                close()
+            delay = self.next_delay(delay)
+            self.sleep(max(delay, retry_after or 0.0))
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "is_unresolvable_host",
+]
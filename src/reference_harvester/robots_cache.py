@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from urllib import robotparser
+from urllib.parse import urlparse
+
+from reference_harvester import json_codec
+
+DEFAULT_ROBOTS_TTL = 24 * 60 * 60.0
+
+
+@dataclass
+class RobotsEntry:
+    """One robots.txt lookup: the raw body plus its parsed rules."""
+
+    host: str
+    robots_url: str
+    fetched_at: float
+    status_code: int | None = None
+    text: str = ""
+    error: str | None = None
+    parser: robotparser.RobotFileParser = field(
+        default_factory=robotparser.RobotFileParser,
+        repr=False,
+        compare=False,
+    )
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code is not None and self.status_code < 400
+
+    @property
+    def fetched_at_iso(self) -> str:
+        return datetime.fromtimestamp(self.fetched_at, UTC).isoformat()
+
+    def parse(self) -> RobotsEntry:
+        # A missing or failing robots.txt places no restrictions.
+        self.parser.parse(self.text.splitlines() if self.ok else [])
+        return self
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "host": self.host,
+            "robots_url": self.robots_url,
+            "fetched_at": self.fetched_at,
+            "status_code": self.status_code,
+            "text": self.text,
+        }
+
+
+class RobotsCache:
+    """robots.txt lookups shared by every stage of a provider run.
+
+    Parsed entries are kept in memory for the life of the cache and, when
+    `store_dir` is given, persisted as JSON so later runs reuse them until
+    `ttl` seconds have passed. `fetch(url)` returns `(status_code, text)`
+    and may raise any of `errors`; failed fetches are cached in memory only
+    so the next run tries again. Thread-safe: concurrent lookups for the
+    same host share one fetch.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], tuple[int, str]],
+        *,
+        store_dir: Path | None = None,
+        ttl: float = DEFAULT_ROBOTS_TTL,
+        errors: tuple[type[BaseException], ...] = (OSError,),
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.fetch = fetch
+        self.store_dir = store_dir
+        self.ttl = max(0.0, float(ttl))
+        self.errors = errors
+        self.max_workers = max(1, int(max_workers))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._host_locks: dict[str, threading.Lock] = {}
+        self._entries: dict[str, RobotsEntry] = {}
+
+    def _store_path(self, scheme: str, host: str) -> Path | None:
+        if self.store_dir is None:
+            return None
+        prefix = "" if scheme == "https" else f"{scheme}_"
+        return self.store_dir / f"robots_{prefix}{host}.json"
+
+    def _load(self, scheme: str, host: str) -> RobotsEntry | None:
+        path = self._store_path(scheme, host)
+        if path is None or not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            fetched_at = float(data["fetched_at"])
+            status = data.get("status_code")
+            entry = RobotsEntry(
+                host=host,
+                robots_url=str(data.get("robots_url") or ""),
+                fetched_at=fetched_at,
+                status_code=None if status is None else int(status),
+                text=str(data.get("text") or ""),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if self._clock() - entry.fetched_at > self.ttl:
+            return None
+        return entry.parse()
+
+    def _save(self, scheme: str, entry: RobotsEntry) -> None:
+        path = self._store_path(scheme, entry.host)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(
+            json_codec.dumps(entry.to_json(), indent=2) + "\n",
+            encoding="utf-8",
+        )
+        tmp_path.replace(path)
+
+    def entry(self, host: str, scheme: str = "https") -> RobotsEntry:
+        host = host.strip().lower()
+        key = f"{scheme}://{host}"
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                return cached
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+        with host_lock:
+            with self._lock:
+                cached = self._entries.get(key)
+            if cached is not None:
+                return cached
+            entry = self._load(scheme, host)
+            if entry is None:
+                robots_url = f"{scheme}://{host}/robots.txt"
+                entry = RobotsEntry(
+                    host=host,
+                    robots_url=robots_url,
+                    fetched_at=self._clock(),
+                )
+                try:
+                    entry.status_code, entry.text = self.fetch(robots_url)
+                except self.errors as exc:
+                    entry.error = str(exc)
+                entry.parse()
+                if entry.error is None:
+                    self._save(scheme, entry)
+            with self._lock:
+                self._entries[key] = entry
+            return entry
+
+    def prefetch(
+        self,
+        hosts: Iterable[str],
+        scheme: str = "https",
+    ) -> list[RobotsEntry]:
+        """Look up every host concurrently; entries come back in order."""
+
+        unique = list(
+            dict.fromkeys(h.strip().lower() for h in hosts if h.strip())
+        )
+        if not unique:
+            return []
+        workers = min(self.max_workers, len(unique))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda h: self.entry(h, scheme), unique))
+
+    def allows(self, url: str, user_agent: str) -> bool:
+        parsed = urlparse(url)
+        host = (parsed.hostname or "").lower()
+        if not host:
+            return False
+        entry = self.entry(host, parsed.scheme or "https")
+        return entry.parser.can_fetch(user_agent, url)
+
+
+__all__ = ["DEFAULT_ROBOTS_TTL", "RobotsCache", "RobotsEntry"]
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Self
+from urllib.parse import urlparse
+
+from reference_harvester import json_codec
+
+INDEX_FILENAME = "index.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetches (
+    origin TEXT NOT NULL,
+    url TEXT NOT NULL,
+    host TEXT,
+    sha256 TEXT,
+    fetched_at TEXT,
+    changed_at TEXT,
+    status_code INTEGER,
+    size_bytes INTEGER,
+    local_path TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (origin, url)
+);
+CREATE INDEX IF NOT EXISTS fetches_url ON fetches (url);
+CREATE INDEX IF NOT EXISTS fetches_sha256 ON fetches (sha256);
+CREATE INDEX IF NOT EXISTS fetches_host ON fetches (host);
+CREATE INDEX IF NOT EXISTS fetches_fetched_at ON fetches (fetched_at);
+CREATE INDEX IF NOT EXISTS fetches_changed_at ON fetches (changed_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    blob_path TEXT NOT NULL,
+    size_bytes INTEGER,
+    compression TEXT,
+    first_seen TEXT
+);
+CREATE TABLE IF NOT EXISTS failures (
+    id INTEGER PRIMARY KEY,
+    origin TEXT NOT NULL,
+    url TEXT,
+    host TEXT,
+    reason TEXT,
+    status_code INTEGER,
+    fetched_at TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS failures_origin ON failures (origin);
+CREATE INDEX IF NOT EXISTS failures_url ON failures (url);
+CREATE INDEX IF NOT EXISTS failures_host ON failures (host);
+CREATE TABLE IF NOT EXISTS coverage (
+    id INTEGER PRIMARY KEY,
+    source TEXT,
+    method TEXT,
+    host TEXT,
+    path TEXT,
+    url TEXT,
+    implemented INTEGER,
+    status_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS coverage_url ON coverage (url);
+CREATE INDEX IF NOT EXISTS coverage_host ON coverage (host);
+"""
+
+
+def index_path_for(provider_root: Path) -> Path:
+    return provider_root / INDEX_FILENAME
+
+
+def _int_or_none(value: Any) -> int | None:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _host_of(record: Mapping[str, Any]) -> str:
+    host = record.get("host")
+    if isinstance(host, str) and host:
+        return host.lower()
+    parsed = urlparse(str(record.get("url") or ""))
+    return (parsed.hostname or parsed.netloc or "").lower()
+
+
+class RunIndex:
+    """SQLite index of a provider root's fetches, blobs, failures, coverage.
+
+    Manifest records are upserted into `fetches` keyed by `(origin, url)`
+    and keep the position of their first insert, so reading an origin
+    back gives the same order as its manifest. The full record is kept as
+    JSON next to the indexed columns (url, sha256, host, fetched_at and
+    changed_at, the fetch time of the latest new digest), which lets the
+    JSON reports be exported from the index and lookups such as "has
+    this URL changed since" run as indexed queries. The database is in
+    WAL mode so stages can write while others read; one connection is
+    shared by the threads of a process.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(path),
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _write(self, sql: str, rows: Iterable[tuple[Any, ...]]) -> None:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(sql, rows)
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def record_fetches(
+        self, origin: str, records: Iterable[Mapping[str, Any]]
+    ) -> None:
+        fetch_rows: list[tuple[Any, ...]] = []
+        blob_rows: list[tuple[Any, ...]] = []
+        now = datetime.now(UTC).isoformat()
+        for record in records:
+            url = record.get("url")
+            if not isinstance(url, str) or not url:
+                continue
+            sha = record.get("sha256")
+            fetch_rows.append(
+                (
+                    origin,
+                    url,
+                    _host_of(record),
+                    sha if isinstance(sha, str) else None,
+                    record.get("fetched_at"),
+                    record.get("fetched_at"),
+                    _int_or_none(record.get("status_code")),
+                    _int_or_none(record.get("size_bytes")),
+                    record.get("local_path"),
+                    json_codec.dumps(record, compact=True),
+                )
+            )
+            if isinstance(sha, str) and record.get("blob_path"):
+                blob_rows.append(
+                    (
+                        sha,
+                        record["blob_path"],
+                        _int_or_none(record.get("size_bytes")),
+                        record.get("blob_compression"),
+                        now,
+                    )
+                )
+        self._write(
+            "INSERT INTO fetches (origin, url, host, sha256, fetched_at,"
+            " changed_at, status_code, size_bytes, local_path, record)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (origin, url) DO UPDATE SET"
+            " changed_at = CASE WHEN fetches.sha256 IS excluded.sha256"
+            " THEN fetches.changed_at ELSE excluded.fetched_at END,"
+            " host = excluded.host, sha256 = excluded.sha256,"
+            " fetched_at = excluded.fetched_at,"
+            " status_code = excluded.status_code,"
+            " size_bytes = excluded.size_bytes,"
+            " local_path = excluded.local_path, record = excluded.record",
+            fetch_rows,
+        )
+        if blob_rows:
+            self._write(
+                "INSERT OR IGNORE INTO blobs"
+                " (sha256, blob_path, size_bytes, compression, first_seen)"
+                " VALUES (?, ?, ?, ?, ?)",
+                blob_rows,
+            )
+
+    def record_fetch(self, origin: str, record: Mapping[str, Any]) -> None:
+        self.record_fetches(origin, [record])
+
+    def replace_failures(
+        self, origin: str, rows: Iterable[Mapping[str, Any]]
+    ) -> None:
+        """Make `rows` the failures of `origin` (each run reports its own)."""
+
+        values = [
+            (
+                origin,
+                row.get("url"),
+                _host_of(row),
+                row.get("reason"),
+                _int_or_none(row.get("status_code")),
+                row.get("fetched_at") or row.get("checked_at"),
+                json_codec.dumps(row, compact=True),
+            )
+            for row in rows
+        ]
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "DELETE FROM failures WHERE origin = ?", (origin,)
+                )
+                self._db.executemany(
+                    "INSERT INTO failures (origin, url, host, reason,"
+                    " status_code, fetched_at, record)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    values,
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def replace_coverage(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        values = [
+            (
+                row.get("source"),
+                row.get("method"),
+                row.get("host"),
+                row.get("path"),
+                row.get("url"),
+                1 if row.get("implemented") else 0,
+                _int_or_none(row.get("status_code")),
+            )
+            for row in rows
+        ]
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("DELETE FROM coverage")
+                self._db.executemany(
+                    "INSERT INTO coverage (source, method, host, path, url,"
+                    " implemented, status_code) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    values,
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple[Any, ...] = ()) -> list[Any]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def count(self, origin: str | None = None) -> int:
+        if origin is None:
+            rows = self._query("SELECT COUNT(*) FROM fetches")
+        else:
+            rows = self._query(
+                "SELECT COUNT(*) FROM fetches WHERE origin = ?", (origin,)
+            )
+        return int(rows[0][0])
+
+    def fetches(self, origin: str | None = None) -> Iterator[dict[str, Any]]:
+        """Records of `origin` (or all origins) in first-insert order."""
+
+        sql = "SELECT rowid, record FROM fetches WHERE rowid > ?"
+        params: tuple[Any, ...] = ()
+        if origin is not None:
+            sql += " AND origin = ?"
+            params = (origin,)
+        last = 0
+        while True:
+            rows = self._query(
+                sql + " ORDER BY rowid LIMIT 1024", (last, *params)
+            )
+            if not rows:
+                return
+            for _rowid, record in rows:
+                yield json_codec.loads(record)
+            last = rows[-1][0]
+
+    def failures(self, origin: str | None = None) -> list[dict[str, Any]]:
+        if origin is None:
+            rows = self._query(
+                "SELECT origin, record FROM failures ORDER BY id"
+            )
+        else:
+            rows = self._query(
+                "SELECT origin, record FROM failures WHERE origin = ?"
+                " ORDER BY id",
+                (origin,),
+            )
+        return [
+            {"origin": row_origin, **json_codec.loads(record)}
+            for row_origin, record in rows
+        ]
+
+    def latest_fetch(self, url: str) -> dict[str, Any] | None:
+        """Most recently fetched record for `url` across origins."""
+
+        rows = self._query(
+            "SELECT record FROM fetches WHERE url = ?"
+            " ORDER BY fetched_at DESC LIMIT 1",
+            (url,),
+        )
+        return json_codec.loads(rows[0][0]) if rows else None
+
+    def fetch(self, origin: str, url: str) -> dict[str, Any] | None:
+        """The record `origin` holds for `url`, if any."""
+
+        rows = self._query(
+            "SELECT record FROM fetches WHERE origin = ? AND url = ?",
+            (origin, url),
+        )
+        return json_codec.loads(rows[0][0]) if rows else None
+
+    def local_path(self, sha: str, *, origin: str | None = None) -> str | None:
+        """Local path of the first record stored with digest `sha`."""
+
+        sql = (
+            "SELECT local_path FROM fetches"
+            " WHERE sha256 = ? AND local_path IS NOT NULL"
+        )
+        params: tuple[Any, ...] = (sha,)
+        if origin is not None:
+            sql += " AND origin = ?"
+            params += (origin,)
+        rows = self._query(sql + " ORDER BY rowid LIMIT 1", params)
+        return rows[0][0] if rows else None
+
+    def changed_since(self, url: str, since: datetime) -> bool | None:
+        """Whether `url` got a new digest after `since` (None: unknown)."""
+
+        rows = self._query(
+            "SELECT MAX(changed_at), COUNT(*) FROM fetches WHERE url = ?",
+            (url,),
+        )
+        changed_at, count = rows[0]
+        if not count:
+            return None
+        return bool(changed_at) and changed_at > since.isoformat()
+
+    def urls_fetched_since(
+        self, since: datetime, *, origin: str | None = None
+    ) -> list[str]:
+        sql = "SELECT DISTINCT url FROM fetches WHERE fetched_at > ?"
+        params: tuple[Any, ...] = (since.isoformat(),)
+        if origin is not None:
+            sql += " AND origin = ?"
+            params += (origin,)
+        return [row[0] for row in self._query(sql + " ORDER BY url", params)]
+
+    def has_sha(self, sha: str) -> bool:
+        return bool(
+            self._query(
+                "SELECT 1 FROM fetches WHERE sha256 = ? LIMIT 1", (sha,)
+            )
+        )
+
+    def blob_path(self, sha: str) -> str | None:
+        rows = self._query(
+            "SELECT blob_path FROM blobs WHERE sha256 = ?", (sha,)
+        )
+        return rows[0][0] if rows else None
+
+
+__all__ = [
+    "INDEX_FILENAME",
+    "RunIndex",
+    "index_path_for",
+]
@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
+from reference_harvester import json_codec
+
 
 @dataclass(frozen=True)
 class SchemaValidationError:
@@ -289,7 +291,7 @@ def validate_json_file(
 
 def write_report(path: Path, report: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    path.write_text(json_codec.dumps(report, indent=2) + "\n")
 
 
 def iter_json_files(paths: Iterable[Path]) -> Iterable[Path]:
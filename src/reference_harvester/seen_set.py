@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, MutableSet
+from pathlib import Path
+
+DEFAULT_INITIAL_CAPACITY = 1 << 16
+DEFAULT_ERROR_RATE = 0.001
+
+
+def _hashes(key: str) -> tuple[int, int]:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+    # Odd second hash so every probe sequence visits distinct bits.
+    return (
+        int.from_bytes(digest[:8], "little"),
+        int.from_bytes(digest[8:], "little") | 1,
+    )
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for `capacity` keys at `error_rate`."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = max(1, int(capacity))
+        self.error_rate = min(0.5, max(1e-9, float(error_rate)))
+        bits = -self.capacity * math.log(self.error_rate) / (math.log(2) ** 2)
+        self.num_bits = max(8, math.ceil(bits))
+        self.num_hashes = max(
+            1, round(self.num_bits / self.capacity * math.log(2))
+        )
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterator[int]:
+        first, second = _hashes(key)
+        for i in range(self.num_hashes):
+            yield (first + i * second) % self.num_bits
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> None:
+        bits = self._bits
+        for p in self._positions(key):
+            bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class ScalableBloomFilter:
+    """Bloom filter that grows by stacking larger, tighter filters.
+
+    Each new stage holds `growth` times the keys of the previous one at
+    half its error rate, so the compound false-positive rate stays under
+    `error_rate` however many keys are added.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE,
+        growth: int = 2,
+    ) -> None:
+        self.growth = max(2, int(growth))
+        self._filters = [BloomFilter(initial_capacity, error_rate / 2)]
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in stage for stage in reversed(self._filters))
+
+    def add(self, key: str) -> None:
+        stage = self._filters[-1]
+        if stage.count >= stage.capacity:
+            stage = BloomFilter(
+                stage.capacity * self.growth, stage.error_rate / 2
+            )
+            self._filters.append(stage)
+        stage.add(key)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(stage.nbytes for stage in self._filters)
+
+
+class CompactUrlSet(MutableSet[str]):
+    """Set of URLs whose memory is the Bloom filter, not the URL count.
+
+    Members live in an SQLite index at `path`; an in-memory scalable
+    Bloom filter answers most lookups for URLs that were never added, and
+    positive answers are confirmed against the index so membership is
+    exact. Iteration yields members in sorted order. The index is scratch
+    space for one crawl (no journal, no fsync); `close()` releases it and
+    deletes the file unless `keep=True`.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+        error_rate: float = DEFAULT_ERROR_RATE,
+    ) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        self._bloom = ScalableBloomFilter(
+            initial_capacity=initial_capacity, error_rate=error_rate
+        )
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(path), isolation_level=None, check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=OFF")
+        self._db.execute("PRAGMA synchronous=OFF")
+        self._db.execute(
+            "CREATE TABLE members (url TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self._len = 0
+        self.false_positives = 0
+
+    def _confirm(self, url: str) -> bool:
+        row = self._db.execute(
+            "SELECT 1 FROM members WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            self.false_positives += 1
+        return row is not None
+
+    def __contains__(self, url: object) -> bool:
+        if not isinstance(url, str):
+            return False
+        with self._lock:
+            return url in self._bloom and self._confirm(url)
+
+    def add(self, url: str) -> None:
+        with self._lock:
+            if url in self._bloom and self._confirm(url):
+                return
+            self._db.execute("INSERT INTO members (url) VALUES (?)", (url,))
+            self._bloom.add(url)
+            self._len += 1
+
+    def discard(self, url: str) -> None:
+        # Bloom filters cannot forget; the bits stay set and the index
+        # turns later lookups into (correct) misses.
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM members WHERE url = ?", (url,)
+            )
+            self._len -= cursor.rowcount
+
+    def update(self, urls: Iterable[str]) -> None:
+        for url in urls:
+            self.add(url)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[str]:
+        # Pages through the index by key so iterating never holds every
+        # member in memory (or a cursor open across mutations).
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT url FROM members WHERE url > ?"
+                    " ORDER BY url LIMIT 1024",
+                    (last,),
+                ).fetchall()
+            if not rows:
+                return
+            for (url,) in rows:
+                yield url
+            last = rows[-1][0]
+
+    @property
+    def filter_bytes(self) -> int:
+        return self._bloom.nbytes
+
+    def close(self, *, keep: bool = False) -> None:
+        with self._lock:
+            self._db.close()
+        if not keep:
+            self.path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "DEFAULT_ERROR_RATE",
+    "DEFAULT_INITIAL_CAPACITY",
+    "BloomFilter",
+    "CompactUrlSet",
+    "ScalableBloomFilter",
+]
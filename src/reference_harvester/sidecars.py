@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Mapping
+import os
+from collections.abc import Iterable, Mapping
 from pathlib import Path
 from typing import Any
 
+from reference_harvester import json_codec
+
 SIDECAR_SCHEMA = "reference-harvester.sidecar.v1"
+# Stands in for the one list `write_sidecar_json_streaming` fills from an
+# iterable.
+SIDECAR_STREAM = "\x00reference-harvester.sidecar.stream\x00"
 
 
 def build_sidecar_envelope(
@@ -40,12 +46,7 @@ def build_sidecar_envelope(
 def dump_sidecar_text(envelope: Mapping[str, Any]) -> str:
     """Deterministic JSON serialization for hashing and on-disk storage."""
 
-    return json.dumps(
-        envelope,
-        indent=2,
-        ensure_ascii=False,
-        sort_keys=True,
-    )
+    return json_codec.dumps(envelope, indent=2, sort_keys=True)
 
 
 def sha256_hex(text: str) -> str:
@@ -69,3 +70,54 @@ def write_sidecar_json(
     if not path.exists():
         path.write_text(text + "\n", encoding="utf-8")
     return sha256, path
+
+
+def write_sidecar_json_streaming(
+    *,
+    sidecars_dir: Path,
+    envelope: Mapping[str, Any],
+    items: Iterable[Any],
+) -> tuple[str, Path]:
+    """Like `write_sidecar_json`, with one list value streamed from `items`.
+
+    The value equal to `SIDECAR_STREAM` in `envelope` is written as the
+    list of `items`, one item at a time, so the list is never held in
+    memory. The bytes (and hence the digest) are exactly those
+    `write_sidecar_json` would produce for the materialized list.
+    """
+
+    sidecars_dir.mkdir(parents=True, exist_ok=True)
+    text = dump_sidecar_text(envelope)
+    marker = json.dumps(SIDECAR_STREAM, ensure_ascii=False)
+    head, sep, tail = text.partition(marker)
+    if not sep:
+        raise ValueError("envelope has no SIDECAR_STREAM value")
+    line_start = head[head.rfind("\n") + 1 :]
+    key_indent = len(line_start) - len(line_start.lstrip(" "))
+    item_indent = "\n" + " " * (key_indent + 2)
+
+    hasher = hashlib.sha256()
+    tmp_path = sidecars_dir / f".stream-{os.getpid()}-{id(hasher)}.tmp"
+
+    def _emit(handle: Any, piece: str) -> None:
+        hasher.update(piece.encode("utf-8"))
+        handle.write(piece)
+
+    with tmp_path.open("w", encoding="utf-8") as handle:
+        _emit(handle, head)
+        first = True
+        for item in items:
+            item_text = json_codec.dumps(item, indent=2, sort_keys=True)
+            _emit(handle, "[" if first else ",")
+            _emit(handle, item_indent + item_text.replace("\n", item_indent))
+            first = False
+        _emit(handle, "[]" if first else "\n" + " " * key_indent + "]")
+        _emit(handle, tail)
+        handle.write("\n")
+    sha256 = hasher.hexdigest()
+    path = sidecars_dir / f"{sha256}.json"
+    if path.exists():
+        tmp_path.unlink()
+    else:
+        os.replace(tmp_path, path)
+    return sha256, path
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Iterable
+
+SIMHASH_BITS = 64
+DEFAULT_MAX_DISTANCE = 3
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _feature_hash(feature: str) -> int:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def shingles(text: str, size: int = 3) -> list[str]:
+    """Overlapping `size`-word shingles of `text` (lowercased)."""
+
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [
+        " ".join(words[i : i + size]) for i in range(len(words) - size + 1)
+    ]
+
+
+def simhash(features: Iterable[str]) -> int | None:
+    """64-bit SimHash of `features`; None when there are none.
+
+    Documents that share most features get fingerprints a small Hamming
+    distance apart, so near-identical pages can be found by comparing
+    fingerprints instead of bodies.
+    """
+
+    counts = [0] * SIMHASH_BITS
+    seen_any = False
+    for feature in features:
+        seen_any = True
+        value = _feature_hash(feature)
+        for bit in range(SIMHASH_BITS):
+            counts[bit] += 1 if value >> bit & 1 else -1
+    if not seen_any:
+        return None
+    fingerprint = 0
+    for bit, count in enumerate(counts):
+        if count > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def text_fingerprint(text: str) -> int | None:
+    return simhash(shingles(text))
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """Find stored fingerprints within `max_distance` bits of a query.
+
+    Fingerprints are split into `max_distance + 1` blocks; two within the
+    distance must agree exactly on at least one block (pigeonhole), so
+    only fingerprints sharing a block with the query are compared.
+    """
+
+    def __init__(self, *, max_distance: int = DEFAULT_MAX_DISTANCE) -> None:
+        self.max_distance = max(0, int(max_distance))
+        blocks = min(SIMHASH_BITS, self.max_distance + 1)
+        width, extra = divmod(SIMHASH_BITS, blocks)
+        self._blocks: list[tuple[int, int]] = []
+        shift = 0
+        for i in range(blocks):
+            size = width + (1 if i < extra else 0)
+            self._blocks.append((shift, (1 << size) - 1))
+            shift += size
+        self._buckets: list[dict[int, list[tuple[int, str]]]] = [
+            {} for _ in self._blocks
+        ]
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def add(self, fingerprint: int, key: str) -> None:
+        for (shift, mask), bucket in zip(self._blocks, self._buckets):
+            bucket.setdefault(fingerprint >> shift & mask, []).append(
+                (fingerprint, key)
+            )
+        self._len += 1
+
+    def find(self, fingerprint: int) -> tuple[str, int] | None:
+        """Closest stored `(key, distance)` within range, or None."""
+
+        best: tuple[str, int] | None = None
+        for (shift, mask), bucket in zip(self._blocks, self._buckets):
+            for other, key in bucket.get(fingerprint >> shift & mask, ()):
+                distance = hamming(fingerprint, other)
+                if distance <= self.max_distance and (
+                    best is None or distance < best[1]
+                ):
+                    best = (key, distance)
+        return best
+
+
+__all__ = [
+    "DEFAULT_MAX_DISTANCE",
+    "SIMHASH_BITS",
+    "SimHashIndex",
+    "hamming",
+    "shingles",
+    "simhash",
+    "text_fingerprint",
+]
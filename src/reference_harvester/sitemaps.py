@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+DEFAULT_MAX_SITEMAPS = 50
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+class SitemapError(ValueError):
+    """A sitemap could not be fetched or is not sitemap XML."""
+
+
+@dataclass(frozen=True)
+class SitemapEntry:
+    loc: str
+    lastmod: datetime | None
+    sitemap: str
+
+
+def parse_lastmod(value: str | None) -> datetime | None:
+    """Parse a W3C datetime (`2024-05-01`, `2024-05-01T10:00:00Z`, ...).
+
+    Dates and naive times are taken as UTC; anything unparseable is None.
+    """
+
+    if not value:
+        return None
+    text = value.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower()
+
+
+class SitemapParser:
+    """Incremental parser for one sitemap or sitemap-index document.
+
+    `feed()` takes raw bytes as they arrive (gzip is detected from the
+    first bytes and inflated on the fly) and returns the `(kind, loc,
+    lastmod)` items completed so far, where `kind` is `"url"` for a page
+    and `"sitemap"` for a child sitemap. Parsed elements are discarded as
+    soon as they are reported, so memory stays flat however large the
+    document is.
+    """
+
+    def __init__(self) -> None:
+        self._pull = ET.XMLPullParser(events=("start", "end"))
+        self._inflate: Any | None = None
+        self._sniffed = False
+        self._root: ET.Element | None = None
+        self._fields: dict[str, str] = {}
+
+    def feed(self, chunk: bytes) -> list[tuple[str, str, datetime | None]]:
+        if not self._sniffed:
+            if not chunk:
+                return []
+            self._sniffed = True
+            if chunk.startswith(_GZIP_MAGIC):
+                self._inflate = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        if self._inflate is not None:
+            chunk = self._inflate.decompress(chunk)
+        self._pull.feed(chunk)
+        return self._drain()
+
+    def close(self) -> list[tuple[str, str, datetime | None]]:
+        if self._inflate is not None:
+            self._pull.feed(self._inflate.flush())
+        items = self._drain()
+        self._pull.close()
+        return items + self._drain()
+
+    def _drain(self) -> list[tuple[str, str, datetime | None]]:
+        items: list[tuple[str, str, datetime | None]] = []
+        for event, elem in self._pull.read_events():
+            name = _local(elem.tag)
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+                    if name not in {"urlset", "sitemapindex"}:
+                        raise SitemapError(f"unexpected root element <{name}>")
+                elif name in {"url", "sitemap"}:
+                    self._fields = {}
+                continue
+            if name in {"loc", "lastmod"}:
+                self._fields[name] = (elem.text or "").strip()
+            elif name in {"url", "sitemap"}:
+                loc = self._fields.get("loc")
+                if loc:
+                    items.append(
+                        (name, loc, parse_lastmod(self._fields.get("lastmod")))
+                    )
+                self._fields = {}
+                if self._root is not None:
+                    self._root.clear()
+        return items
+
+
+class SitemapWalker:
+    """Stream the entries of sitemaps and, recursively, sitemap indexes.
+
+    `fetch(url)` returns the body of a sitemap as an iterable of byte
+    chunks and may raise `OSError` or `ValueError` (including
+    `SitemapError`) on failure; a failing sitemap is recorded in `stats`
+    and skipped. At most `max_sitemaps` documents are fetched and each
+    one only once. Entries are yielded as they are parsed.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Iterable[bytes]],
+        *,
+        max_sitemaps: int = DEFAULT_MAX_SITEMAPS,
+    ) -> None:
+        self._fetch = fetch
+        self.max_sitemaps = max(1, int(max_sitemaps))
+        self.stats: list[dict[str, Any]] = []
+
+    def _items(self, url: str) -> Iterator[tuple[str, str, datetime | None]]:
+        parser = SitemapParser()
+        for chunk in self._fetch(url):
+            yield from parser.feed(chunk)
+        yield from parser.close()
+
+    def walk(self, urls: Iterable[str]) -> Iterator[SitemapEntry]:
+        queue: deque[str] = deque()
+        seen: set[str] = set()
+        for url in urls:
+            if url and url not in seen:
+                seen.add(url)
+                queue.append(url)
+        while queue and len(self.stats) < self.max_sitemaps:
+            url = queue.popleft()
+            stat: dict[str, Any] = {
+                "url": url,
+                "status": "ok",
+                "entries": 0,
+                "sitemaps": 0,
+            }
+            self.stats.append(stat)
+            try:
+                for kind, loc, lastmod in self._items(url):
+                    if kind == "sitemap":
+                        stat["sitemaps"] += 1
+                        if loc not in seen:
+                            seen.add(loc)
+                            queue.append(loc)
+                    else:
+                        stat["entries"] += 1
+                        yield SitemapEntry(loc, lastmod, url)
+            except (OSError, ValueError, ET.ParseError, zlib.error) as exc:
+                stat["status"] = "error"
+                stat["error"] = str(exc)
+
+
+__all__ = [
+    "DEFAULT_MAX_SITEMAPS",
+    "SitemapEntry",
+    "SitemapError",
+    "SitemapParser",
+    "SitemapWalker",
+    "parse_lastmod",
+]
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import copy
+import time
+from collections.abc import Mapping
+from typing import Any, Self
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from reference_harvester.concurrency import AdaptiveConcurrency
+from reference_harvester.fetch_registry import FetchRegistry
+from reference_harvester.http_cache import CachedResponse, HttpCache
+from reference_harvester.rate_limit import HostRateLimiter
+from reference_harvester.retry import CircuitOpenError, RetryPolicy
+
+DEFAULT_USER_AGENT = "reference-harvester/0.1"
+
+
+class HttpTransport:
+    """Provider-scoped HTTP client with keep-alive connection pools.
+
+    A single `requests.Session` is shared by every stage so repeated calls
+    to the same host reuse pooled TCP/TLS connections instead of paying a
+    fresh handshake per request. `pool_connections` bounds how many host
+    pools are cached; `pool_maxsize` bounds connections kept per host.
+
+    When `rate_limiter` is set, every request waits for its host's next
+    slot and throttling responses (429/503 + Retry-After) feed back into
+    that host's pacing. `min_interval` on `get`/`head` is a per-call floor
+    for the host interval (a stage's `throttle_seconds`).
+
+    When `retry` is set, connection errors and 429/5xx responses are
+    retried per that policy; a host whose circuit breaker is open fails
+    fast with `requests.ConnectionError`.
+
+    When `cache` is set, plain (non-streamed) GETs go through it: fresh
+    entries are served locally and stale ones revalidated, so a 304 comes
+    back as the cached 200 with `from_cache = True`.
+
+    When `concurrency` is set, each attempt holds one of its host's
+    adaptive in-flight slots until the response headers arrive (streamed
+    bodies are read outside the slot); the status and time to headers
+    feed the host's window.
+
+    While `registry` is set (one run), plain GETs are de-duplicated
+    through it: repeats get a copy of the first response with
+    `from_registry = True`, or a 304 when their validators match it.
+
+    Pass `session` to inject a stand-in (tests) that implements `get`,
+    `head`, and `close` with `requests`-compatible keyword arguments.
+    """
+
+    def __init__(
+        self,
+        *,
+        user_agent: str = DEFAULT_USER_AGENT,
+        timeout: float = 30.0,
+        pool_connections: int = 16,
+        pool_maxsize: int = 8,
+        session: Any | None = None,
+        rate_limiter: HostRateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        cache: HttpCache | None = None,
+        concurrency: AdaptiveConcurrency | None = None,
+        registry: FetchRegistry | None = None,
+    ) -> None:
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.pool_connections = max(1, int(pool_connections))
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = user_agent
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.cache = cache
+        self.concurrency = concurrency
+        self.registry = registry
+
+    def _headers(self, headers: Mapping[str, str] | None) -> dict[str, str]:
+        merged = {"User-Agent": self.user_agent}
+        if headers:
+            merged.update(headers)
+        return merged
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+        min_interval: float,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        limiter = self.rate_limiter
+        host = (urlparse(url).hostname or "").lower()
+        gate = self.concurrency if host else None
+
+        def _attempt() -> requests.Response:
+            if gate is not None:
+                gate.acquire(host)
+            status: int | None = None
+            started = time.monotonic()
+            try:
+                if limiter is not None and host:
+                    limiter.acquire(host, min_interval)
+                    started = time.monotonic()
+                resp = getattr(self.session, method)(
+                    url,
+                    headers=self._headers(headers),
+                    timeout=self.timeout if timeout is None else timeout,
+                    **kwargs,
+                )
+                code = getattr(resp, "status_code", None)
+                status = code if isinstance(code, int) else 0
+            finally:
+                # No status means the attempt raised: a congestion signal.
+                if gate is not None:
+                    gate.release(host, status, time.monotonic() - started)
+            if limiter is not None and host and isinstance(code, int):
+                resp_headers = getattr(resp, "headers", None) or {}
+                limiter.observe(host, code, resp_headers.get("Retry-After"))
+            return resp
+
+        if self.retry is None:
+            return _attempt()
+        try:
+            return self.retry.call(
+                _attempt,
+                host=host,
+                retry_on=(requests.RequestException,),
+            )
+        except CircuitOpenError as exc:
+            raise requests.ConnectionError(str(exc)) from exc
+
+    def get(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        min_interval: float = 0.0,
+        **kwargs: Any,
+    ) -> requests.Response:
+        if kwargs.get("stream"):
+            return self._send(
+                "get", url, headers, timeout, min_interval, kwargs
+            )
+        params = kwargs.get("params")
+        key_url = url
+        if params:
+            key_url = str(
+                requests.Request("GET", url, params=params).prepare().url
+            )
+
+        def _load() -> requests.Response:
+            return self._get(
+                key_url, url, headers, timeout, min_interval, kwargs
+            )
+
+        registry = self.registry
+        merged = self._headers(headers)
+        key = None if registry is None else registry.key_for(key_url, merged)
+        if registry is None or key is None:
+            return _load()
+        resp, shared = registry.get(
+            key,
+            key_url,
+            _load,
+            conditional=any(
+                name.lower() in ("if-none-match", "if-modified-since")
+                for name in merged
+            ),
+        )
+        return _replay(resp, merged) if shared else resp
+
+    def _get(
+        self,
+        key_url: str,
+        url: str,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+        min_interval: float,
+        kwargs: dict[str, Any],
+    ) -> requests.Response:
+        cache = self.cache
+        if cache is None:
+            return self._send(
+                "get", url, headers, timeout, min_interval, kwargs
+            )
+
+        def _send(extra: dict[str, str]) -> requests.Response:
+            merged = dict(headers or {})
+            merged.update(extra)
+            return self._send(
+                "get", url, merged, timeout, min_interval, kwargs
+            )
+
+        return cache.fetch(
+            key_url,
+            self._headers(headers),
+            _send,
+            lambda cached: _from_cache(cached, key_url),
+        )
+
+    def head(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        min_interval: float = 0.0,
+        **kwargs: Any,
+    ) -> requests.Response:
+        kwargs.setdefault("allow_redirects", True)
+        return self._send("head", url, headers, timeout, min_interval, kwargs)
+
+    def close(self) -> None:
+        close = getattr(self.session, "close", None)
+        if callable(close):
+            close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+def _from_cache(cached: CachedResponse, url: str) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = cached.status_code
+    resp.headers.update(cached.headers)
+    resp.url = url
+    resp.reason = "OK"
+    resp._content = cached.body
+    resp._content_consumed = True
+    resp.from_cache = True  # type: ignore[attr-defined]
+    return resp
+
+
+def _replay(resp: Any, request_headers: Mapping[str, str]) -> Any:
+    """Copy a shared response for another caller, honoring its validators."""
+
+    replay = copy.copy(resp)
+    resp_headers = getattr(resp, "headers", None) or {}
+    replay.headers = copy.copy(resp_headers)
+    lowered = {k.lower(): v for k, v in request_headers.items()}
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if (etag and lowered.get("if-none-match") == etag) or (
+        last_modified and lowered.get("if-modified-since") == last_modified
+    ):
+        replay.status_code = 304
+        if isinstance(replay, requests.Response):
+            replay._content = b""
+        else:
+            replay.content = b""
+    replay.from_registry = True
+    return replay
+
+
+__all__ = ["DEFAULT_USER_AGENT", "HttpTransport"]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from reference_harvester.blob_store import BlobStore, blob_root_for
+
+
+def test_blob_store_dedupes_and_links_views(tmp_path: Path) -> None:
+    assert blob_root_for(tmp_path / "uspto" / "runs" / "r1") == (
+        tmp_path / "uspto" / "blobs"
+    )
+    assert blob_root_for(tmp_path / "uspto") == tmp_path / "uspto" / "blobs"
+
+    store = BlobStore(tmp_path / "blobs")
+    body = b"same body"
+    sha = hashlib.sha256(body).hexdigest()
+    first = store.put(body)
+    assert first.sha256 == sha and not first.existed
+    assert first.path == tmp_path / "blobs" / sha[:2] / sha
+    assert store.put(body, sha).existed
+
+    download = tmp_path / "download.bin"
+    download.write_bytes(body)
+    adopted = store.adopt(download, sha)
+    assert adopted.existed and not download.exists()
+
+    view_a = tmp_path / "html" / "a.html"
+    view_b = tmp_path / "html" / "b" / "index.html"
+    assert store.materialize(sha, view_a)
+    assert store.materialize(sha, view_b)
+    assert view_a.read_bytes() == body
+    inode = first.path.stat().st_ino
+    assert view_a.stat().st_ino == view_b.stat().st_ino == inode
+    # One fan-out directory holding one blob.
+    assert len(list((tmp_path / "blobs").rglob("*"))) == 2
+
+
+def test_compressed_blobs_round_trip_without_views(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path / "blobs", compression="gzip")
+    body = b"x" * 10_000
+    sha = hashlib.sha256(body).hexdigest()
+    source = tmp_path / "bulk.zip"
+    source.write_bytes(body)
+    ref = store.adopt(source, sha)
+    assert ref.path.name == f"{sha}.gz"
+    assert ref.compression == "gzip" and ref.stored_bytes < ref.size_bytes
+    assert store.read_bytes(sha) == body
+    assert not store.materialize(sha, tmp_path / "view.zip")
+    # A raw store still finds blobs written compressed, and vice versa.
+    assert BlobStore(tmp_path / "blobs").find(sha) == ref.path
+
+    with pytest.raises(ValueError):
+        BlobStore(tmp_path / "blobs", compression="zstd")
+    with pytest.raises(FileNotFoundError):
+        store.read_bytes("0" * 64)
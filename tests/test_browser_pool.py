@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from reference_harvester.browser_pool import (
+    BrowserError,
+    BrowserPool,
+    BrowserUnavailable,
+    RenderedPage,
+)
+
+
+class _FakePlaywright:
+    """Just enough of Playwright's async API to drive the pool."""
+
+    def __init__(self) -> None:
+        self.launches = 0
+        self.stopped = False
+        self.contexts: list[dict[str, Any]] = []
+        self.open_pages = 0
+        self.peak_pages = 0
+        self.chromium = self
+
+    async def start(self) -> _FakePlaywright:
+        return self
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+    async def launch(self, headless: bool = True) -> Any:
+        self.launches += 1
+        return SimpleNamespace(
+            new_context=self._new_context,
+            close=self._noop,
+        )
+
+    async def _noop(self) -> None:
+        return None
+
+    async def _new_context(self, **kwargs: Any) -> Any:
+        state: dict[str, Any] = {
+            "kwargs": kwargs,
+            "routed": [],
+            "closed": False,
+        }
+        self.contexts.append(state)
+
+        async def route(_pattern: str, handler: Any) -> None:
+            state["route"] = handler
+
+        async def close() -> None:
+            state["closed"] = True
+
+        async def new_page() -> Any:
+            return self._page(state)
+
+        return SimpleNamespace(route=route, new_page=new_page, close=close)
+
+    def _page(self, state: dict[str, Any]) -> Any:
+        listeners: list[Any] = []
+        fake = self
+
+        async def goto(url: str, timeout: int) -> Any:
+            fake.open_pages += 1
+            fake.peak_pages = max(fake.peak_pages, fake.open_pages)
+            try:
+                await asyncio.sleep(0.02)
+                if "broken" in url:
+                    raise ConnectionError("net::ERR_NAME_NOT_RESOLVED")
+                for kind in ("image", "font", "xhr"):
+                    request = SimpleNamespace(
+                        url=f"{url}/{kind}", resource_type=kind
+                    )
+                    for listener in listeners:
+                        listener(request)
+
+                    async def abort(kind: str = kind) -> None:
+                        state["routed"].append(("abort", kind))
+
+                    async def continue_(kind: str = kind) -> None:
+                        state["routed"].append(("continue", kind))
+
+                    await state["route"](
+                        SimpleNamespace(
+                            request=request, abort=abort, continue_=continue_
+                        )
+                    )
+            finally:
+                fake.open_pages -= 1
+            return SimpleNamespace(
+                status=200, headers={"content-type": "text/html"}
+            )
+
+        async def wait_for_load_state(_state: str, timeout: int) -> None:
+            return None
+
+        async def content() -> str:
+            return "<html>ok</html>"
+
+        return SimpleNamespace(
+            on=lambda _event, cb: listeners.append(cb),
+            goto=goto,
+            wait_for_load_state=wait_for_load_state,
+            content=content,
+        )
+
+
+def test_pool_launches_once_and_isolates_pages() -> None:
+    fake = _FakePlaywright()
+    seen: list[tuple[str, str]] = []
+    urls = [f"https://a.test/{idx}" for idx in range(5)] + [
+        "https://broken.test/"
+    ]
+
+    with BrowserPool(
+        user_agent="ua-test", max_pages=2, playwright_factory=lambda: fake
+    ) as pool:
+        results = pool.render_many(
+            urls, on_request=lambda page, req: seen.append((page, req.url))
+        )
+        again = pool.render("https://a.test/again")
+
+    assert fake.launches == 1 and pool.launches == 1
+    assert fake.stopped
+    assert fake.peak_pages == 2
+    assert [r.url for r in results[:5]] == urls[:5]
+    assert all(isinstance(r, RenderedPage) for r in results[:5])
+    assert isinstance(results[5], BrowserError)
+    assert again.body == b"<html>ok</html>"
+    # One fresh context per page, closed afterwards, images/fonts blocked.
+    assert len(fake.contexts) == 7
+    assert all(ctx["closed"] for ctx in fake.contexts)
+    assert fake.contexts[0]["kwargs"] == {"user_agent": "ua-test"}
+    assert sorted(fake.contexts[0]["routed"]) == [
+        ("abort", "font"),
+        ("abort", "image"),
+        ("continue", "xhr"),
+    ]
+    assert ("https://a.test/0", "https://a.test/0/xhr") in seen
+
+
+def test_pool_reports_missing_browser() -> None:
+    def factory() -> Any:
+        raise BrowserUnavailable("playwright is not installed")
+
+    with (
+        BrowserPool(playwright_factory=factory) as pool,
+        pytest.raises(BrowserUnavailable),
+    ):
+        pool.render_many(["https://a.test/"])
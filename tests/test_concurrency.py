@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from reference_harvester.concurrency import AdaptiveConcurrency
+from reference_harvester.transport import HttpTransport
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _round(
+    ctl: AdaptiveConcurrency, host: str, status: int, latency: float
+) -> None:
+    # Fill the whole window, then complete every request.
+    slots = ctl.limit(host)
+    for _ in range(slots):
+        ctl.acquire(host)
+    for _ in range(slots):
+        ctl.release(host, status, latency)
+
+
+def test_window_grows_additively_and_halves_on_throttle() -> None:
+    clock = _Clock()
+    ctl = AdaptiveConcurrency(initial=2, maximum=6, cooldown=1.0, clock=clock)
+
+    for _ in range(8):
+        _round(ctl, "a.test", 200, 0.1)
+    assert ctl.limit("a.test") == 6
+    assert ctl.limit("b.test") == 2
+
+    ctl.acquire("a.test")
+    ctl.release("a.test", 429, 0.1)
+    assert ctl.limit("a.test") == 3
+    # A burst of failures within the cooldown counts once.
+    ctl.acquire("a.test")
+    ctl.release("a.test", 503, 0.1)
+    assert ctl.limit("a.test") == 3
+    clock.now += 2
+    ctl.acquire("a.test")
+    ctl.release("a.test", None)
+    assert ctl.limit("a.test") == 1
+
+    snap = ctl.snapshot()["a.test"]
+    assert snap["window"] == 1
+    assert snap["decreases"] == 2
+    assert snap["last_decrease_reason"] == "error"
+
+
+def test_latency_spike_halves_and_idle_hosts_do_not_grow() -> None:
+    ctl = AdaptiveConcurrency(initial=4, min_samples=3, cooldown=0.0)
+    for _ in range(5):
+        ctl.acquire("a.test")
+        ctl.release("a.test", 200, 0.1)
+    # One request at a time never proves a larger window is safe.
+    assert ctl.limit("a.test") == 4
+
+    ctl.acquire("a.test")
+    ctl.release("a.test", 200, 1.0)
+    assert ctl.limit("a.test") == 2
+    assert ctl.snapshot()["a.test"]["last_decrease_reason"] == "latency"
+
+
+def test_transport_holds_requests_to_the_host_window() -> None:
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def fake_get(_url: str, **_kwargs: Any) -> SimpleNamespace:
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return SimpleNamespace(status_code=503, headers={})
+
+    ctl = AdaptiveConcurrency(initial=2)
+    session = SimpleNamespace(get=fake_get, head=fake_get, close=lambda: None)
+    transport = HttpTransport(
+        user_agent="ua", session=session, concurrency=ctl
+    )
+    threads = [
+        threading.Thread(target=transport.get, args=(f"https://a.test/{i}",))
+        for i in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert state["peak"] <= 2
+    assert ctl.limit("a.test") == 1
+    assert ctl.snapshot()["a.test"]["in_flight"] == 0
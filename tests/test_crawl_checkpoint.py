@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from reference_harvester.crawl_checkpoint import CrawlCheckpoint
+from reference_harvester.seen_set import CompactUrlSet
+
+
+def test_snapshot_offset_and_torn_journal_line(tmp_path: Path) -> None:
+    root = tmp_path / "crawl_state"
+    checkpoint = CrawlCheckpoint(root, every=2)
+    assert checkpoint.load() is None
+
+    checkpoint.record({"url": "https://a.test/1"})
+    assert not checkpoint.due
+    checkpoint.record({"url": "https://a.test/2"})
+    assert checkpoint.due
+    checkpoint.save({"frontier": [["https://a.test/3", 1]]})
+    assert not checkpoint.due
+    checkpoint.record({"url": "https://a.test/3"})
+    checkpoint.close()
+    # A crawl killed mid-write leaves half a line behind.
+    with (root / "journal.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"url": "https://a.te')
+
+    resumed = CrawlCheckpoint(root).load()
+    assert resumed is not None
+    assert resumed.state is not None
+    assert resumed.state["frontier"] == [["https://a.test/3", 1]]
+    assert [event["url"] for event in resumed.events] == [
+        "https://a.test/1",
+        "https://a.test/2",
+        "https://a.test/3",
+    ]
+    assert resumed.replay_from == 2
+    lines = (root / "journal.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+
+
+def test_journal_without_snapshot_replays_everything(tmp_path: Path) -> None:
+    root = tmp_path / "crawl_state"
+    checkpoint = CrawlCheckpoint(root, every=10)
+    checkpoint.record({"url": "https://a.test/1"})
+    checkpoint.close()
+
+    reopened = CrawlCheckpoint(root)
+    resumed = reopened.load()
+    assert resumed is not None
+    assert resumed.state is None
+    assert resumed.replay_from == 0
+    reopened.record({"url": "https://a.test/2"})
+    reopened.save({})
+    assert reopened.load().replay_from == 2  # type: ignore[union-attr]
+
+    reopened.clear()
+    assert not root.exists()
+    assert reopened.load() is None
+
+
+def test_set_values_are_saved_as_lists(tmp_path: Path) -> None:
+    root = tmp_path / "crawl_state"
+    checkpoint = CrawlCheckpoint(root)
+    seen = CompactUrlSet(tmp_path / "seen.sqlite")
+    seen.update(["https://a.test/2", "https://a.test/1"])
+    checkpoint.save({"seen_pages": seen, "frontier": [], "pages_fetched": 2})
+    seen.close()
+
+    state = CrawlCheckpoint(root).load().state  # type: ignore[union-attr]
+    assert state == {
+        "seen_pages": ["https://a.test/1", "https://a.test/2"],
+        "frontier": [],
+        "pages_fetched": 2,
+        "journal_offset": 0,
+    }
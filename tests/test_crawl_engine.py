@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from reference_harvester.crawl_engine import (
+    AsyncCrawlEngine,
+    CrawlTask,
+    PatternScorer,
+)
+
+
+def test_engine_caps_global_and_per_host_inflight() -> None:
+    lock = threading.Lock()
+    inflight: dict[str, int] = {}
+    peaks: dict[str, int] = {}
+    total = {"now": 0, "peak": 0}
+    handled: list[str] = []
+
+    def fetch(task: CrawlTask) -> str:
+        with lock:
+            inflight[task.host] = inflight.get(task.host, 0) + 1
+            peaks[task.host] = max(
+                peaks.get(task.host, 0), inflight[task.host]
+            )
+            total["now"] += 1
+            total["peak"] = max(total["peak"], total["now"])
+        time.sleep(0.02)
+        with lock:
+            inflight[task.host] -= 1
+            total["now"] -= 1
+        return task.url
+
+    engine = AsyncCrawlEngine(
+        fetch=fetch,
+        handle=lambda _task, result: handled.append(result),
+        concurrency=3,
+        per_host_concurrency=1,
+    )
+    for idx in range(4):
+        engine.push(f"https://a.test/{idx}", 0)
+        engine.push(f"https://b.test/{idx}", 0)
+    engine.run()
+
+    assert len(handled) == 8
+    assert peaks == {"a.test": 1, "b.test": 1}
+    assert total["peak"] == 2
+
+
+def test_engine_admit_defers_until_inflight_completes() -> None:
+    budget = {"limit": 2, "done": 0, "reserved": 0}
+    fetched: list[str] = []
+
+    def admit(task: CrawlTask) -> bool | None:
+        if budget["done"] >= budget["limit"]:
+            return False
+        if budget["done"] + budget["reserved"] >= budget["limit"]:
+            return None
+        budget["reserved"] += 1
+        return True
+
+    def handle(task: CrawlTask, ok: bool) -> None:
+        budget["reserved"] -= 1
+        if ok:
+            budget["done"] += 1
+            fetched.append(task.url)
+
+    engine = AsyncCrawlEngine(
+        # The first URL "fails", so its reserved slot goes to a later URL.
+        fetch=lambda task: not task.url.endswith("/0"),
+        handle=handle,
+        admit=admit,
+        concurrency=8,
+        per_host_concurrency=8,
+    )
+    for idx in range(5):
+        engine.push(f"https://a.test/{idx}", 0)
+    engine.run()
+
+    assert sorted(fetched) == ["https://a.test/1", "https://a.test/2"]
+
+
+def test_engine_serves_ready_hosts_while_others_cool_down() -> None:
+    start = time.monotonic()
+    ready_at = {"slow.test": start + 0.1, "fast.test": start}
+    order: list[str] = []
+
+    engine = AsyncCrawlEngine(
+        fetch=lambda task: task.url,
+        handle=lambda _task, url: order.append(url),
+        ready_in=lambda task: ready_at[task.host] - time.monotonic(),
+        concurrency=1,
+        per_host_concurrency=1,
+    )
+    engine.push("https://slow.test/a", 0)
+    engine.push("https://fast.test/a", 0)
+    engine.push("https://fast.test/b", 0)
+    engine.run()
+
+    assert order == [
+        "https://fast.test/a",
+        "https://fast.test/b",
+        "https://slow.test/a",
+    ]
+    assert time.monotonic() - start >= 0.1
+
+
+def test_engine_follows_live_host_limit() -> None:
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+    limits = {"a.test": 3}
+
+    def fetch(task: CrawlTask) -> str:
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return task.url
+
+    def handle(_task: CrawlTask, _result: str) -> None:
+        # The controller shrinks the window after the first completion.
+        limits["a.test"] = 1
+
+    engine = AsyncCrawlEngine(
+        fetch=fetch,
+        handle=handle,
+        host_limit=lambda host: limits[host],
+        concurrency=8,
+        per_host_concurrency=8,
+    )
+    for idx in range(8):
+        engine.push(f"https://a.test/{idx}", 0)
+    engine.run()
+
+    assert state["peak"] == 3
+
+
+def test_engine_live_host_limit_never_exceeds_per_host_cap() -> None:
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def fetch(task: CrawlTask) -> str:
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return task.url
+
+    engine = AsyncCrawlEngine(
+        fetch=fetch,
+        handle=lambda _task, _result: None,
+        # An adaptive window that has grown past the operator's cap.
+        host_limit=lambda _host: 6,
+        concurrency=8,
+        per_host_concurrency=2,
+    )
+    for idx in range(8):
+        engine.push(f"https://a.test/{idx}", 0)
+    engine.run()
+
+    assert state["peak"] == 2
+
+
+def test_engine_orders_by_score_and_round_robins_hosts() -> None:
+    order: list[str] = []
+    scorer = PatternScorer(
+        boosts=((r"/documents/", 1.5),),
+        is_known=lambda url: url.endswith("/old"),
+    )
+    engine = AsyncCrawlEngine(
+        fetch=lambda task: task.url,
+        handle=lambda _task, url: order.append(url),
+        score=scorer,
+        concurrency=1,
+        per_host_concurrency=1,
+    )
+    for idx in range(3):
+        engine.push(f"https://big.test/page{idx}", 1)
+    engine.push("https://big.test/old", 0)
+    engine.push("https://big.test/documents/a.pdf", 1)
+    engine.push("https://small.test/", 1)
+    engine.run()
+
+    assert order == [
+        "https://big.test/documents/a.pdf",
+        "https://small.test/",
+        "https://big.test/old",
+        "https://big.test/page0",
+        "https://big.test/page1",
+        "https://big.test/page2",
+    ]
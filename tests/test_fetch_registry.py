@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from reference_harvester.fetch_registry import FetchRegistry
+from reference_harvester.transport import HttpTransport
+
+
+def _transport(registry: FetchRegistry, status: int = 200):
+    lock = threading.Lock()
+    calls: list[tuple[str, dict[str, str]]] = []
+
+    def fake_get(url: str, headers: dict[str, str], **_kwargs: Any):
+        with lock:
+            calls.append((url, dict(headers)))
+        time.sleep(0.02)
+        return SimpleNamespace(
+            status_code=status,
+            headers={"ETag": '"v1"', "Content-Type": "text/html"},
+            content=b"<html>seed</html>",
+        )
+
+    session = SimpleNamespace(get=fake_get, head=fake_get, close=lambda: None)
+    transport = HttpTransport(
+        user_agent="ua-test", session=session, registry=registry
+    )
+    return transport, calls
+
+
+def test_registry_coalesces_in_flight_and_repeated_gets() -> None:
+    registry = FetchRegistry()
+    transport, calls = _transport(registry)
+    url = "https://developer.uspto.gov/api-catalog/"
+
+    registry.begin_stage("crawl")
+    results: list[Any] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(transport.get(url)))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    registry.begin_stage("xhr_inventory")
+    again = transport.get("https://DEVELOPER.uspto.gov/api-catalog/")
+
+    assert len(calls) == 1
+    assert all(r.content == b"<html>seed</html>" for r in results)
+    assert sum(bool(getattr(r, "from_registry", False)) for r in results) == 3
+    assert again.from_registry is True and again.status_code == 200
+
+    # A caller revalidating with the shared ETag gets a 304 locally.
+    registry.begin_stage("swagger")
+    not_modified = transport.get(url, headers={"If-None-Match": '"v1"'})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert len(calls) == 1
+
+    report = registry.report()
+    assert report["requests"] == 6
+    assert report["network_fetches"] == 1
+    assert report["served_from_registry"] == 5
+    assert report["urls"][0]["stages"] == ["crawl", "xhr_inventory", "swagger"]
+
+
+def test_registry_skips_failures_ranges_and_unshared_validators() -> None:
+    registry = FetchRegistry()
+    transport, calls = _transport(registry, status=503)
+    url = "https://data.uspto.gov/apis/getting-started"
+
+    transport.get(url)
+    transport.get(url)
+    assert len(calls) == 2
+
+    ok_registry = FetchRegistry()
+    transport, calls = _transport(ok_registry)
+    transport.get(url, headers={"If-None-Match": '"v0"'})
+    transport.get(url)
+    transport.get(url, headers={"Range": "bytes=0-3"})
+    # The conditional GET did not seed the registry; the range bypassed it.
+    assert len(calls) == 3
+    assert "If-None-Match" not in calls[1][1]
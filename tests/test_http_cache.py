@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from reference_harvester.http_cache import HttpCache, cache_root_for
+from reference_harvester.transport import HttpTransport
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _server(body: bytes, log: list[dict[str, str]], **extra: str):
+    def fake_get(_url: str, headers: dict[str, str], **_kwargs: Any):
+        log.append(dict(headers))
+        etag = f'"{len(body)}"'
+        if headers.get("If-None-Match") == etag:
+            return SimpleNamespace(
+                status_code=304, headers={"ETag": etag}, content=b""
+            )
+        return SimpleNamespace(
+            status_code=200,
+            headers={"ETag": etag, "Content-Type": "text/html", **extra},
+            content=body,
+        )
+
+    return fake_get
+
+
+def _transport(fake_get, cache: HttpCache) -> HttpTransport:
+    session = SimpleNamespace(get=fake_get, head=fake_get, close=lambda: None)
+    return HttpTransport(user_agent="ua-test", session=session, cache=cache)
+
+
+def test_new_run_revalidates_and_serves_cached_body(tmp_path: Path) -> None:
+    url = "https://a.test/page?b=2&a=1"
+    log: list[dict[str, str]] = []
+    fake_get = _server(b"<html>one</html>", log)
+
+    first = _transport(fake_get, HttpCache(tmp_path))
+    assert first.get(url).content == b"<html>one</html>"
+    assert "If-None-Match" not in log[0]
+
+    # A fresh process (new run-id) reuses what the first one stored.
+    cache = HttpCache(tmp_path)
+    resp = _transport(fake_get, cache).get("https://A.test/page?a=1&b=2")
+    assert log[1]["If-None-Match"] == '"16"'
+    assert resp.status_code == 200
+    assert resp.content == b"<html>one</html>"
+    assert resp.text == "<html>one</html>"
+    assert getattr(resp, "from_cache", False) is True
+    assert cache.revalidated == 1
+
+
+def test_fresh_entries_skip_the_network_and_vary_splits(
+    tmp_path: Path,
+) -> None:
+    clock = _Clock()
+    url = "https://a.test/api"
+    log: list[dict[str, str]] = []
+    fake_get = _server(
+        b"{}", log, **{"Cache-Control": "max-age=60", "Vary": "Accept"}
+    )
+    transport = _transport(fake_get, HttpCache(tmp_path, clock=clock))
+
+    transport.get(url, headers={"Accept": "application/json"})
+    transport.get(url, headers={"Accept": "application/json"})
+    assert len(log) == 1
+    transport.get(url, headers={"Accept": "text/html"})
+    assert len(log) == 2
+
+    clock.now += 61
+    transport.get(url, headers={"Accept": "application/json"})
+    assert log[-1]["If-None-Match"] == '"2"'
+
+
+def test_caller_validators_and_streams_bypass_cache(tmp_path: Path) -> None:
+    url = "https://a.test/doc"
+    log: list[dict[str, str]] = []
+    transport = _transport(_server(b"doc", log), HttpCache(tmp_path))
+    transport.get(url)
+
+    resp = transport.get(url, headers={"If-None-Match": '"3"'})
+    assert resp.status_code == 304
+    transport.get(url, stream=True)
+    assert "If-None-Match" not in log[-1]
+
+
+def test_lru_eviction_keeps_shared_bodies(tmp_path: Path) -> None:
+    cache = HttpCache(tmp_path, max_bytes=25)
+    headers = {"ETag": '"x"'}
+    cache.store("https://a.test/1", {}, 200, headers, b"a" * 10)
+    cache.store("https://a.test/2", {}, 200, headers, b"a" * 10)
+    cache.store("https://a.test/3", {}, 200, headers, b"b" * 10)
+    assert cache.size_bytes == 20
+    assert cache.lookup("https://a.test/1") is not None
+
+    cache.store("https://a.test/4", {}, 200, headers, b"c" * 10)
+    # Evicting /2 frees nothing (/1 shares its body), so /3 goes too.
+    assert cache.lookup("https://a.test/2") is None
+    assert cache.lookup("https://a.test/3") is None
+    assert cache.lookup("https://a.test/1") is not None
+    assert cache.lookup("https://a.test/4") is not None
+    assert cache.size_bytes == 20
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 2
+    # The running total is rebuilt from disk by a fresh instance.
+    assert HttpCache(tmp_path, max_bytes=25).size_bytes == 20
+
+
+def test_cache_root_is_shared_by_run_ids(tmp_path: Path) -> None:
+    provider_dir = tmp_path / "out" / "uspto"
+    assert cache_root_for(provider_dir) == provider_dir / "cache"
+    run_dir = provider_dir / "runs" / "2026-01-01"
+    assert cache_root_for(run_dir) == provider_dir / "cache"
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from reference_harvester.json_codec import JSON_BACKENDS, JsonCodec
+from reference_harvester.sidecars import dump_sidecar_text
+
+
+def _installed_codecs() -> list[JsonCodec]:
+    codecs = []
+    for name in JSON_BACKENDS:
+        try:
+            codecs.append(JsonCodec(name))
+        except ValueError:
+            continue
+    return codecs
+
+
+PAYLOAD = {
+    "url": "https://example.test/a?b=1",
+    "title": 'Prüfung   "quoted" \\ \x00\x1f\x7f',
+    "sha256": "3e4" * 21 + "e",
+    "note": "0.00001 and 1e5, as text",
+    "sizes": [0, -1, 2**53, 10**30],
+    "floats": [0.1, -0.0, 1e-05, 0.0001, 1e16, 1.5e300, 123456.789],
+    "nested": {"z": [], "a": {}, "m": [{"k": None, "t": True}]},
+}
+
+
+@pytest.mark.parametrize("sort_keys", [False, True])
+def test_indented_output_matches_stdlib_for_every_backend(
+    sort_keys: bool,
+) -> None:
+    expected = json.dumps(
+        PAYLOAD, indent=2, ensure_ascii=False, sort_keys=sort_keys
+    )
+    for codec in _installed_codecs():
+        assert codec.dumps(PAYLOAD, indent=2, sort_keys=sort_keys) == expected
+        assert codec.dumps_bytes(PAYLOAD, indent=2, sort_keys=sort_keys) == (
+            expected.encode("utf-8")
+        )
+        # Keys the fast encoders reject or order differently fall back.
+        mixed = {2: "b", 10: "a"}
+        assert codec.dumps(mixed, indent=2, sort_keys=True) == json.dumps(
+            mixed, indent=2, sort_keys=True
+        )
+        assert codec.dumps(0.5) == json.dumps(0.5)
+
+    envelope = {"schema": "s", "data": PAYLOAD}
+    assert dump_sidecar_text(envelope) == json.dumps(
+        envelope, indent=2, ensure_ascii=False, sort_keys=True
+    )
+
+
+def test_compact_output_round_trips_and_loads_matches_stdlib() -> None:
+    for codec in _installed_codecs():
+        text = codec.dumps(PAYLOAD, compact=True)
+        assert "\n" not in text and '": ' not in text
+        assert codec.loads(text) == PAYLOAD
+        assert codec.loads(text.encode("utf-8")) == PAYLOAD
+        assert codec.loads("[NaN]")[0] != codec.loads("[NaN]")[0]
+        with pytest.raises(json.JSONDecodeError):
+            codec.loads('{"torn": ')
+        with pytest.raises(ValueError):
+            codec.dumps(PAYLOAD, indent=2, compact=True)
+
+    with pytest.raises(ValueError):
+        JsonCodec("simplejson")
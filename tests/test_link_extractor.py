@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from reference_harvester.link_extractor import (
+    LINK_ASSET,
+    LINK_ATTACHMENT,
+    LINK_PAGE,
+    LinkExtractor,
+    extract_links,
+)
+
+PAGE = b"""<html><head>
+<base href="https://docs.test/v2/">
+<link rel="stylesheet" href="site.css">
+<link rel="alternate" href="/feed">
+<script src="app.js"></script>
+<script>var api = "https://api.test/hidden"; if (a<b) {}</script>
+</head><body>
+<a href="guide#intro">Guide</a>
+<a href="javascript:void(0)">x</a><a href="mailto:a@docs.test">m</a>
+<a href="#top">top</a>
+<img src="logo.png" srcset="logo-2x.png 2x, /img/logo-3x.png 3x">
+<a href="spec.pdf">Spec</a>
+<p>See https://other.test/page, or (https://other.test/more).</p>
+</body></html>"""
+
+
+def test_links_are_resolved_typed_and_deduped() -> None:
+    links = extract_links(PAGE, "https://docs.test/start")
+    kinds = {link.url: link.kind for link in links}
+    assert kinds == {
+        "https://docs.test/v2/site.css": LINK_ASSET,
+        "https://docs.test/feed": LINK_PAGE,
+        "https://docs.test/v2/app.js": LINK_ASSET,
+        "https://docs.test/v2/guide": LINK_PAGE,
+        "https://docs.test/v2/logo.png": LINK_ASSET,
+        "https://docs.test/v2/logo-2x.png": LINK_ASSET,
+        "https://docs.test/img/logo-3x.png": LINK_ASSET,
+        "https://docs.test/v2/spec.pdf": LINK_ATTACHMENT,
+        "https://other.test/page": LINK_PAGE,
+        "https://other.test/more": LINK_PAGE,
+    }
+
+    with_scripts = extract_links(PAGE, "https://docs.test/", script_urls=True)
+    assert "https://api.test/hidden" in {link.url for link in with_scripts}
+
+
+def test_chunked_feed_matches_whole_body() -> None:
+    body = "<a href='/café'>café</a><loc>https://x.test/s.xml</loc>"
+    data = body.encode("utf-8")
+    extractor = LinkExtractor(
+        "https://x.test/",
+        is_attachment=lambda url: url.endswith(".xml"),
+    )
+    # Split inside the multi-byte character and inside the tag.
+    for start in range(0, len(data), 7):
+        extractor.feed(data[start : start + 7])
+    links = extractor.close()
+    assert [(link.url, link.kind) for link in links] == [
+        ("https://x.test/café", LINK_PAGE),
+        ("https://x.test/s.xml", LINK_ATTACHMENT),
+    ]
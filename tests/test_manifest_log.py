@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from reference_harvester.manifest_log import ManifestLog, iter_manifest
+
+
+def test_appends_go_to_the_log_until_compaction(tmp_path: Path) -> None:
+    snapshot = tmp_path / "manifest.json"
+    first = ManifestLog(snapshot)
+    first.extend([{"url": "a", "v": 1}, {"url": "b", "v": 1}])
+    assert first.close()  # no snapshot yet: always compacted
+    assert json.loads(snapshot.read_text("utf-8"))[1] == {"url": "b", "v": 1}
+    assert snapshot.with_suffix(".jsonl").exists()
+    assert not first.log_path.exists()
+
+    before = snapshot.read_bytes()
+    second = ManifestLog(snapshot, compact_min_bytes=1 << 20)
+    second.append({"url": "a", "v": 2})
+    second.append({"url": "c", "v": 1})
+    second.append({"note": "keyless"})
+    assert not second.close()
+    assert snapshot.read_bytes() == before
+    assert list(iter_manifest(snapshot)) == [
+        {"url": "a", "v": 2},
+        {"url": "b", "v": 1},
+        {"url": "c", "v": 1},
+        {"note": "keyless"},
+    ]
+
+    assert ManifestLog(snapshot, compact_min_bytes=0).close()
+    assert [
+        rec.get("v") for rec in json.loads(snapshot.read_text("utf-8"))
+    ] == [
+        2,
+        1,
+        1,
+        None,
+    ]
+
+
+def test_torn_log_lines_are_skipped(tmp_path: Path) -> None:
+    snapshot = tmp_path / "manifest.json"
+    snapshot.write_text('[{"url": "a", "v": 1}]\n', encoding="utf-8")
+    log = ManifestLog(snapshot, fsync_every=1)
+    log.append({"url": "b", "v": 1})
+    log.sync()
+    with log.log_path.open("a", encoding="utf-8") as handle:
+        handle.write('{"url": "a", "v"')
+    assert [rec["url"] for rec in log.latest()] == ["a", "b"]
+    assert next(log.latest())["v"] == 1
+
+
+def test_compaction_writes_the_same_bytes_as_one_dump(tmp_path: Path) -> None:
+    snapshot = tmp_path / "manifest.json"
+    records = [
+        {"url": "a", "title": "Prüfung", "nested": {"k": [1, {"z": None}]}},
+        {"url": "b", "empty": [], "obj": {}},
+    ]
+    log = ManifestLog(snapshot)
+    log.extend(records)
+    assert log.close()
+    assert snapshot.read_text("utf-8") == (
+        json.dumps(records, indent=2, ensure_ascii=False) + "\n"
+    )
+    mirror = snapshot.with_suffix(".jsonl").read_text("utf-8").splitlines()
+    assert [json.loads(line) for line in mirror] == records
+
+    empty = tmp_path / "empty" / "manifest.json"
+    assert ManifestLog(empty).compact() == 0
+    assert empty.read_text("utf-8") == "[]\n"
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from reference_harvester.manifest_reader import (
+    ManifestReader,
+    iter_json_array,
+    manifest_source,
+)
+
+
+def _pieces(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_json_array_parses_across_any_chunking() -> None:
+    values = [{"url": "https://a.test/é", "n": 12345}, 678, "x,]", [], {}]
+    text = " \n" + json.dumps(values, indent=2) + "\n"
+    for size in (1, 2, 7, 64, len(text)):
+        assert list(iter_json_array(_pieces(text, size))) == values
+    assert list(iter_json_array(["[", "]"])) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array(['{"a": 1}']))
+    with pytest.raises(ValueError):
+        list(iter_json_array(["[1, 2"]))
+
+
+def test_reader_prefers_jsonl_and_hashes_in_one_pass(tmp_path: Path) -> None:
+    records = [{"url": f"https://a.test/{i}", "i": i} for i in range(500)]
+    snapshot = tmp_path / "manifest.json"
+    snapshot.write_text(json.dumps(records, indent=2) + "\n", encoding="utf-8")
+    assert manifest_source(snapshot) == snapshot
+
+    reader = ManifestReader(snapshot, chunk_size=333)
+    assert list(reader) == records
+    assert reader.sha256 == hashlib.sha256(snapshot.read_bytes()).hexdigest()
+
+    mirror = snapshot.with_suffix(".jsonl")
+    mirror.write_text(
+        "".join(json.dumps(rec) + "\n" for rec in records[:3]) + '{"torn',
+        encoding="utf-8",
+    )
+    assert manifest_source(snapshot) == mirror
+    reader = ManifestReader(mirror, chunk_size=10)
+    assert list(reader) == records[:3]
+    assert reader.sha256 == hashlib.sha256(mirror.read_bytes()).hexdigest()
+
+    broken = tmp_path / "broken.json"
+    broken.write_text('[{"url": "a"}, {"url": ', encoding="utf-8")
+    reader = ManifestReader(broken)
+    assert list(reader) == [{"url": "a"}]
+    assert reader.error and reader.sha256
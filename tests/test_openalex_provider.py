@@ -259,3 +259,71 @@ def test_openalex_mirror_writes_manifest_with_hashes(
 
     mirror_jsonl = base / "logs" / "mirror_manifest.jsonl"
     assert mirror_jsonl.exists()
+
+
+def test_openalex_fetch_retries_transient_errors(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    calls: list[int] = []
+
+    def fake_get(url: str, **_kwargs: Any) -> Any:
+        calls.append(1)
+        if len(calls) == 1:
+            raise openalex_mod.httpx.ConnectError("reset")
+        if len(calls) == 2:
+            return _FakeHttpxResponse(503, b"", {}, url)
+        return _FakeResponse({"results": []})
+
+    monkeypatch.setattr(openalex_mod, "_http_get", fake_get)
+
+    ctx = ProviderContext(
+        name="openalex",
+        out_dir=tmp_path,
+        options={"query": "ptab", "max_pages": 1, "backoff_factor": 0.0},
+    )
+    OpenAlexProvider().fetch_references(ctx)
+
+    assert len(calls) == 3
+    sample = (
+        tmp_path
+        / "raw"
+        / "harvester"
+        / "openalex"
+        / "api_samples"
+        / "openalex"
+        / "works_search_page_1.json"
+    )
+    assert json.loads(sample.read_text(encoding="utf-8")) == {"results": []}
+
+
+def test_openalex_mirror_reuses_cache_across_run_ids(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    seen: list[dict[str, str]] = []
+    body = b"<html>docs</html>"
+
+    def fake_get(url: str, **kwargs: Any) -> _FakeHttpxResponse:
+        headers = kwargs.get("headers") or {}
+        seen.append(dict(headers))
+        if headers.get("If-None-Match") == '"v1"':
+            return _FakeHttpxResponse(304, b"", {"etag": '"v1"'}, url)
+        return _FakeHttpxResponse(
+            200, body, {"content-type": "text/html", "etag": '"v1"'}, url
+        )
+
+    monkeypatch.setattr(openalex_mod, "_http_get", fake_get)
+
+    for run_id in ("r1", "r2"):
+        out_dir = tmp_path / "openalex" / "runs" / run_id
+        ctx = ProviderContext(
+            name="openalex",
+            out_dir=out_dir,
+            options={"max_pages": 1, "extra_seeds": ["https://openalex.org/"]},
+        )
+        OpenAlexProvider().mirror_sources(ctx)
+
+    assert "If-None-Match" not in seen[0]
+    assert seen[1]["If-None-Match"] == '"v1"'
+    html_dir = out_dir / "raw" / "harvester" / "openalex" / "html"
+    assert [p.read_bytes() for p in html_dir.iterdir()] == [body]
+    assert (tmp_path / "openalex" / "cache" / "objects").is_dir()
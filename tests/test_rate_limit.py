@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+from reference_harvester.rate_limit import HostRateLimiter, parse_retry_after
+from reference_harvester.transport import HttpTransport
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_parse_retry_after_seconds_and_http_date() -> None:
+    now = datetime(2025, 1, 1, 12, 0, 0, tzinfo=UTC)
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 01 Jan 2025 12:00:30 GMT", now=now) == 30.0
+    assert parse_retry_after("Wed, 01 Jan 2025 11:00:00 GMT", now=now) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_limiter_paces_each_host_independently() -> None:
+    clock = _Clock()
+    limiter = HostRateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.set_crawl_delay("slow.test", 5)
+
+    assert limiter.reserve("slow.test") == 0.0
+    assert limiter.reserve("fast.test") == 0.0
+    # The slow host waits out its crawl-delay; the fast one is unaffected.
+    assert limiter.delay("slow.test") == 5.0
+    assert limiter.reserve("fast.test") == 0.0
+    # A stage floor applies on top of per-host settings.
+    assert limiter.reserve("fast.test", floor=1.0) == 0.0
+    assert limiter.delay("fast.test", floor=1.0) == 1.0
+
+    limiter.acquire("slow.test")
+    assert clock.now == 105.0
+
+
+def test_override_wins_over_robots_and_429_backs_off() -> None:
+    clock = _Clock()
+    limiter = HostRateLimiter(
+        overrides={"api.test": 0.5},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    limiter.apply_robots_records(
+        [
+            {"host": "api.test", "crawl_delay": 10},
+            {"host": "www.test", "crawl_delay": 2},
+        ]
+    )
+    assert limiter.interval("api.test") == 0.5
+    assert limiter.interval("www.test") == 2.0
+
+    limiter.observe("api.test", 429, "30")
+    assert limiter.delay("api.test") == 30.0
+    # Without Retry-After the host is still slowed down for later requests.
+    limiter.observe("www.test", 503)
+    assert limiter.interval("www.test") == 4.0
+    limiter.observe("www.test", 404)
+    assert limiter.snapshot()["www.test"] == 4.0
+    limiter.observe("www.test", 503)
+    assert limiter.interval("www.test") == 8.0
+    # Successes decay the learned interval back to the robots delay.
+    limiter.observe("www.test", 200)
+    assert limiter.interval("www.test") == 4.0
+    limiter.observe("www.test", 204)
+    limiter.observe("www.test", 200)
+    assert limiter.interval("www.test") == 2.0
+    limiter.observe("api.test", 200)
+    assert limiter.interval("api.test") == 0.5
+
+
+def test_transport_feeds_limiter_from_responses() -> None:
+    clock = _Clock()
+    limiter = HostRateLimiter(clock=clock, sleep=clock.sleep)
+    calls: list[tuple[str, float]] = []
+
+    def fake_get(url: str, **_kwargs: Any) -> SimpleNamespace:
+        calls.append((url, clock.now))
+        status = 429 if url.endswith("/busy") else 200
+        return SimpleNamespace(
+            status_code=status, headers={"Retry-After": "3"}
+        )
+
+    transport = HttpTransport(
+        user_agent="ua-test",
+        session=SimpleNamespace(
+            get=fake_get, head=fake_get, close=lambda: None
+        ),
+        rate_limiter=limiter,
+    )
+    transport.get("https://a.test/busy")
+    transport.get("https://b.test/ok")
+    transport.get("https://a.test/next", min_interval=0.5)
+
+    assert calls == [
+        ("https://a.test/busy", 100.0),
+        ("https://b.test/ok", 100.0),
+        ("https://a.test/next", 103.0),
+    ]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import random
+import socket
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import requests
+
+from reference_harvester.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    is_unresolvable_host,
+)
+from reference_harvester.transport import HttpTransport
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _resp(status: int, retry_after: str | None = None) -> SimpleNamespace:
+    headers = {"Retry-After": retry_after} if retry_after else {}
+    return SimpleNamespace(status_code=status, headers=headers)
+
+
+def test_decorrelated_jitter_stays_within_bounds() -> None:
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0, rng=random.Random(7))
+    previous = policy.base_delay
+    for _ in range(50):
+        delay = policy.next_delay(previous)
+        assert 0.5 <= delay <= min(4.0, previous * 3)
+        previous = delay
+
+
+def test_retries_5xx_and_honors_http_date_retry_after() -> None:
+    sleeps: list[float] = []
+    responses = [
+        _resp(503, "Thu, 01 Jan 2099 00:00:00 GMT"),
+        _resp(503, "2"),
+        _resp(200),
+    ]
+    policy = RetryPolicy(
+        max_attempts=3,
+        base_delay=0.0,
+        max_retry_after=10.0,
+        sleep=sleeps.append,
+    )
+
+    # A far-future HTTP-date is beyond max_retry_after: give up at once.
+    first = policy.call(lambda: responses.pop(0), host="a.test")
+    assert first.status_code == 503
+    assert sleeps == []
+
+    second = policy.call(lambda: responses.pop(0), host="a.test")
+    assert second.status_code == 200
+    assert sleeps == [2.0]
+
+
+def test_breaker_opens_after_repeated_5xx_and_probes_after_reset() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker(
+        failure_threshold=3, reset_after=30.0, clock=clock
+    )
+    policy = RetryPolicy(
+        max_attempts=2,
+        base_delay=0.0,
+        breaker=breaker,
+        sleep=lambda _s: None,
+    )
+    calls: list[str] = []
+
+    def down() -> SimpleNamespace:
+        calls.append("down")
+        return _resp(500)
+
+    assert policy.call(down, host="portal.test").status_code == 500
+    assert not breaker.is_open("portal.test")
+    # Third consecutive failure opens the circuit mid-retry.
+    with pytest.raises(CircuitOpenError):
+        policy.call(down, host="portal.test")
+    assert len(calls) == 3
+    with pytest.raises(CircuitOpenError):
+        policy.call(down, host="portal.test")
+    assert len(calls) == 3
+    # Other hosts are unaffected.
+    assert policy.call(lambda: _resp(200), host="data.test").status_code == 200
+
+    clock.now = 31.0
+    assert (
+        policy.call(lambda: _resp(200), host="portal.test").status_code == 200
+    )
+    assert not breaker.is_open("portal.test")
+
+
+def test_unresolvable_host_trips_breaker_without_retrying() -> None:
+    breaker = CircuitBreaker()
+    calls: list[str] = []
+
+    def send() -> Any:
+        calls.append("send")
+        try:
+            raise socket.gaierror(
+                socket.EAI_NONAME, "Name or service not known"
+            )
+        except socket.gaierror as exc:
+            raise requests.ConnectionError("lookup failed") from exc
+
+    transport = HttpTransport(
+        user_agent="ua-test",
+        session=SimpleNamespace(
+            get=lambda *_a, **_k: send(), close=lambda: None
+        ),
+        retry=RetryPolicy(
+            max_attempts=3, breaker=breaker, sleep=lambda _s: None
+        ),
+    )
+    with pytest.raises(requests.ConnectionError):
+        transport.get("https://gone.test/a")
+    with pytest.raises(requests.ConnectionError, match="circuit open"):
+        transport.get("https://gone.test/b")
+    assert calls == ["send"]
+
+    transient = requests.ConnectionError("reset")
+    transient.__cause__ = socket.gaierror(socket.EAI_AGAIN, "try again")
+    assert not is_unresolvable_host(transient)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from reference_harvester.robots_cache import RobotsCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_robots_cache_persists_until_ttl(tmp_path: Path) -> None:
+    clock = _Clock()
+    fetched: list[str] = []
+
+    def fetch(url: str) -> tuple[int, str]:
+        fetched.append(url)
+        return 200, "User-agent: *\nDisallow: /private\nCrawl-delay: 2\n"
+
+    first = RobotsCache(fetch, store_dir=tmp_path, ttl=60, clock=clock)
+    assert not first.allows("https://a.test/private/x", "ua")
+    assert first.allows("https://a.test/public", "ua")
+    assert first.entry("a.test").parser.crawl_delay("ua") == 2
+    assert fetched == ["https://a.test/robots.txt"]
+
+    # A new cache (next run) reads the store instead of the network.
+    second = RobotsCache(fetch, store_dir=tmp_path, ttl=60, clock=clock)
+    assert not second.allows("https://a.test/private/x", "ua")
+    assert len(fetched) == 1
+
+    clock.now += 61
+    third = RobotsCache(fetch, store_dir=tmp_path, ttl=60, clock=clock)
+    third.entry("a.test")
+    assert len(fetched) == 2
+
+
+def test_robots_cache_failures_allow_and_are_not_persisted(
+    tmp_path: Path,
+) -> None:
+    def fetch(url: str) -> tuple[int, str]:
+        if "down" in url:
+            raise OSError("connection refused")
+        return 404, "not found"
+
+    robots = RobotsCache(fetch, store_dir=tmp_path)
+    assert robots.allows("https://down.test/x", "ua")
+    assert robots.entry("down.test").error == "connection refused"
+    assert robots.allows("https://missing.test/x", "ua")
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "robots_missing.test.json"
+    ]
+
+
+def test_robots_cache_prefetches_concurrently_once_per_host() -> None:
+    lock = threading.Lock()
+    calls: dict[str, int] = {}
+    in_flight = 0
+    peak = 0
+
+    def fetch(url: str) -> tuple[int, str]:
+        nonlocal in_flight, peak
+        with lock:
+            calls[url] = calls.get(url, 0) + 1
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return 200, ""
+
+    robots = RobotsCache(fetch)
+    hosts = ["c.test", "A.test", "b.test", "a.test"]
+    entries = robots.prefetch(hosts)
+
+    assert [entry.host for entry in entries] == ["c.test", "a.test", "b.test"]
+    assert set(calls.values()) == {1}
+    assert peak > 1
+    robots.entry("b.test")
+    assert calls["https://b.test/robots.txt"] == 1
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+from reference_harvester.run_index import RunIndex, index_path_for
+
+
+def _rec(url: str, sha: str, fetched_at: str, **extra: object) -> dict:
+    return {"url": url, "sha256": sha, "fetched_at": fetched_at, **extra}
+
+
+def test_upserts_keep_order_and_track_changes(tmp_path: Path) -> None:
+    path = index_path_for(tmp_path)
+    with RunIndex(path) as index:
+        index.record_fetches(
+            "bulk",
+            [
+                _rec("https://a.test/1", "s1", "2026-01-01T00:00:00+00:00"),
+                _rec(
+                    "https://a.test/2",
+                    "s2",
+                    "2026-01-01T00:00:00+00:00",
+                    blob_path="blobs/s2/s2",
+                ),
+            ],
+        )
+        # Same body refetched later, then a new body for the other URL.
+        index.record_fetch(
+            "bulk", _rec("https://a.test/1", "s1", "2026-03-01T00:00:00+00:00")
+        )
+        index.record_fetch(
+            "bulk", _rec("https://a.test/2", "s3", "2026-03-01T00:00:00+00:00")
+        )
+        index.record_fetch(
+            "api_samples",
+            _rec("https://b.test/x", "s4", "2026-03-02T00:00:00"),
+        )
+
+        assert [rec["url"] for rec in index.fetches("bulk")] == [
+            "https://a.test/1",
+            "https://a.test/2",
+        ]
+        assert index.count() == 3 and index.count("bulk") == 2
+        since = datetime(2026, 2, 1, tzinfo=UTC)
+        assert index.changed_since("https://a.test/1", since) is False
+        assert index.changed_since("https://a.test/2", since) is True
+        assert index.changed_since("https://a.test/none", since) is None
+        assert index.urls_fetched_since(since, origin="bulk") == [
+            "https://a.test/1",
+            "https://a.test/2",
+        ]
+        assert index.has_sha("s3") and not index.has_sha("s2")
+        assert index.blob_path("s2") == "blobs/s2/s2"
+        assert index.latest_fetch("https://a.test/2")["sha256"] == "s3"
+        assert index.fetch("bulk", "https://a.test/1")["sha256"] == "s1"
+        assert index.fetch("api_samples", "https://a.test/1") is None
+        index.record_fetch(
+            "bulk", _rec("https://a.test/5", "s1", "t", local_path="html/5")
+        )
+        assert index.local_path("s1") == "html/5"
+        assert index.local_path("s1", origin="api_samples") is None
+
+        index.replace_failures("bulk", [{"url": "https://a.test/3"}])
+        index.replace_failures("bulk", [{"url": "https://a.test/4"}])
+        assert [row["url"] for row in index.failures()] == ["https://a.test/4"]
+        mode = index._query("PRAGMA journal_mode")[0][0]
+    assert mode == "wal"
+
+
+def test_concurrent_writers_share_the_index(tmp_path: Path) -> None:
+    path = index_path_for(tmp_path)
+    RunIndex(path).close()
+
+    def _stage(origin: str) -> None:
+        with RunIndex(path) as index:
+            for i in range(50):
+                index.record_fetch(
+                    origin, _rec(f"https://{origin}.test/{i}", f"{i}", "t")
+                )
+
+    threads = [
+        threading.Thread(target=_stage, args=(origin,))
+        for origin in ("additional", "api_samples", "bulk")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with RunIndex(path) as index:
+        assert index.count() == 150
+        assert len(list(index.fetches("bulk"))) == 50
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from reference_harvester.seen_set import CompactUrlSet, ScalableBloomFilter
+
+
+def test_scalable_bloom_grows_and_keeps_error_rate() -> None:
+    bloom = ScalableBloomFilter(initial_capacity=64, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"https://a.test/{i}")
+    assert all(f"https://a.test/{i}" in bloom for i in range(1000))
+    false_hits = sum(f"https://b.test/{i}" in bloom for i in range(5000))
+    # Small stages are noisy; stay well inside twice the target.
+    assert false_hits < 5000 * 0.02
+    # The filter stays far smaller than the URLs it stands for.
+    assert bloom.nbytes < 1000 * len("https://a.test/000")
+
+
+def test_compact_set_is_exact_and_iterates_sorted(tmp_path: Path) -> None:
+    path = tmp_path / "index" / "seen.sqlite"
+    seen = CompactUrlSet(path, initial_capacity=8, error_rate=0.2)
+    urls = [f"https://a.test/{i:04d}" for i in range(2500)]
+    seen.update(reversed(urls))
+    seen.add(urls[0])
+    assert len(seen) == 2500
+    assert all(url in seen for url in urls)
+    assert not any(f"https://b.test/{i}" in seen for i in range(2500))
+    assert list(seen) == urls
+
+    seen.discard(urls[1])
+    assert urls[1] not in seen
+    assert len(seen) == 2499
+    seen.close()
+    assert not path.exists()
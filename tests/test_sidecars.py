@@ -5,8 +5,10 @@ from pathlib import Path
 
 from reference_harvester.sidecars import (
     SIDECAR_SCHEMA,
+    SIDECAR_STREAM,
     build_sidecar_envelope,
     write_sidecar_json,
+    write_sidecar_json_streaming,
 )
 
 
@@ -40,3 +42,32 @@ def test_write_sidecar_json_is_deterministic(tmp_path: Path) -> None:
     assert loaded["kind"] == "record"
     assert loaded["stable_id"] == "abc"
     assert loaded["data"] == {"a": 1, "b": 2}
+
+
+def test_streamed_sidecar_matches_materialized_list(tmp_path: Path) -> None:
+    items = [{"url": "https://a.test/1", "n": [1, 2]}, {"url": "b"}, 3]
+    for values in (items, []):
+        data = {"a": 1, "entries": values, "z": {"k": "v"}}
+        expected = write_sidecar_json(
+            sidecars_dir=tmp_path / "plain",
+            envelope=build_sidecar_envelope(
+                provider="test",
+                kind="bulk",
+                stable_id="abc",
+                exported_at="2026-01-01T00:00:00+00:00",
+                data=data,
+            ),
+        )
+        streamed = write_sidecar_json_streaming(
+            sidecars_dir=tmp_path / "streamed",
+            envelope=build_sidecar_envelope(
+                provider="test",
+                kind="bulk",
+                stable_id="abc",
+                exported_at="2026-01-01T00:00:00+00:00",
+                data={**data, "entries": SIDECAR_STREAM},
+            ),
+            items=iter(values),
+        )
+        assert streamed[0] == expected[0]
+        assert streamed[1].read_bytes() == expected[1].read_bytes()
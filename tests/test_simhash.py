@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from reference_harvester.link_extractor import LinkExtractor
+from reference_harvester.simhash import SimHashIndex, hamming, text_fingerprint
+
+TEMPLATE = (
+    "Patent Public Search help center. Search patents and published "
+    "applications by number, classification, inventor or assignee. "
+    "Results can be exported, printed or saved to a collection. "
+    "Contact the Patent Electronic Business Center for support. {}"
+)
+
+
+def test_near_duplicates_are_close_and_indexed() -> None:
+    first = text_fingerprint(TEMPLATE.format("Updated March 2026."))
+    second = text_fingerprint(TEMPLATE.format("Updated April 2026."))
+    other = text_fingerprint(
+        "Trademark filing fees changed for applications received after "
+        "January; see the fee schedule for class-based amounts."
+    )
+    assert first is not None and second is not None and other is not None
+    assert hamming(first, second) < hamming(first, other)
+    assert text_fingerprint("") is None
+
+    index = SimHashIndex(max_distance=hamming(first, second))
+    index.add(first, "https://a.test/help")
+    index.add(other, "https://a.test/fees")
+    assert index.find(second) == (
+        "https://a.test/help",
+        hamming(first, second),
+    )
+    assert SimHashIndex(max_distance=0).find(first) is None
+
+
+def test_link_extractor_collects_visible_text() -> None:
+    extractor = LinkExtractor("https://a.test/", collect_text=True)
+    extractor.feed(b"<p>Hello <b>world</b></p><script>var x = 1;</script>")
+    extractor.feed(b"<style>p {}</style><p>again</p>")
+    extractor.close()
+    assert extractor.text == "Hello world again"
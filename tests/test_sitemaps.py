@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import gzip
+from datetime import UTC, datetime
+
+from reference_harvester.sitemaps import (
+    SitemapError,
+    SitemapWalker,
+    parse_lastmod,
+)
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+INDEX = f"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex {NS}>
+  <sitemap><loc>https://a.test/pages.xml.gz</loc></sitemap>
+  <sitemap><loc>https://a.test/broken.xml</loc></sitemap>
+  <sitemap><loc>https://a.test/pages.xml.gz</loc></sitemap>
+</sitemapindex>""".encode()
+PAGES = f"""<urlset {NS}>
+  <url><loc>https://a.test/one</loc><lastmod>2026-03-01</lastmod></url>
+  <url><loc> https://a.test/two </loc>
+       <lastmod>2026-03-02T10:00:00Z</lastmod></url>
+  <url><loc>https://a.test/three</loc></url>
+</urlset>""".encode()
+
+
+def _chunks(data: bytes, size: int = 5):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def test_walker_streams_index_and_gzipped_sitemaps() -> None:
+    bodies = {
+        "https://a.test/sitemap.xml": INDEX,
+        "https://a.test/pages.xml.gz": gzip.compress(PAGES),
+        "https://a.test/broken.xml": b"<html><body>nope</body></html>",
+    }
+    fetched: list[str] = []
+
+    def fetch(url: str):
+        fetched.append(url)
+        if url not in bodies:
+            raise SitemapError("HTTP 404")
+        return _chunks(bodies[url])
+
+    walker = SitemapWalker(fetch)
+    entries = list(walker.walk(["https://a.test/sitemap.xml"]))
+
+    assert [(e.loc, e.lastmod) for e in entries] == [
+        ("https://a.test/one", datetime(2026, 3, 1, tzinfo=UTC)),
+        ("https://a.test/two", datetime(2026, 3, 2, 10, tzinfo=UTC)),
+        ("https://a.test/three", None),
+    ]
+    assert {e.sitemap for e in entries} == {"https://a.test/pages.xml.gz"}
+    assert fetched == [
+        "https://a.test/sitemap.xml",
+        "https://a.test/pages.xml.gz",
+        "https://a.test/broken.xml",
+    ]
+    status = {stat["url"]: stat["status"] for stat in walker.stats}
+    assert status["https://a.test/broken.xml"] == "error"
+    assert walker.stats[0]["sitemaps"] == 3
+
+
+def test_parse_lastmod_formats() -> None:
+    assert parse_lastmod("2026-01-02T03:04:05+02:00") == datetime(
+        2026, 1, 2, 1, 4, 5, tzinfo=UTC
+    )
+    assert parse_lastmod("not a date") is None
+    assert parse_lastmod(None) is None
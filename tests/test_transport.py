@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any
+
+from reference_harvester.transport import HttpTransport
+
+
+class _RecordingSession:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def get(self, url: str, **kwargs: Any) -> str:
+        self.calls.append(("GET", url, kwargs))
+        return "ok"
+
+    def head(self, url: str, **kwargs: Any) -> str:
+        self.calls.append(("HEAD", url, kwargs))
+        return "ok"
+
+    def close(self) -> None:
+        self.calls.append(("CLOSE", "", {}))
+
+
+def test_transport_mounts_pooled_adapters() -> None:
+    transport = HttpTransport(
+        user_agent="ua-test",
+        pool_connections=3,
+        pool_maxsize=5,
+    )
+    try:
+        adapter = transport.session.get_adapter("https://data.uspto.gov/")
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 5
+        assert transport.session.headers["User-Agent"] == "ua-test"
+        # Every https host shares the same adapter (and its pool manager).
+        other = transport.session.get_adapter("https://bulkdata.uspto.gov/")
+        assert other is adapter
+    finally:
+        transport.close()
+
+
+def test_transport_merges_headers_and_default_timeout() -> None:
+    session = _RecordingSession()
+    transport = HttpTransport(
+        user_agent="ua-test", timeout=7.0, session=session
+    )
+
+    transport.get("https://a.test/x", headers={"If-None-Match": '"v1"'})
+    transport.head("https://a.test/y", timeout=2.0)
+    with transport:
+        pass
+
+    get_call, head_call, close_call = session.calls
+    assert get_call[2]["headers"] == {
+        "User-Agent": "ua-test",
+        "If-None-Match": '"v1"',
+    }
+    assert get_call[2]["timeout"] == 7.0
+    assert head_call[2]["timeout"] == 2.0
+    assert head_call[2]["allow_redirects"] is True
+    assert close_call[0] == "CLOSE"
@@ -0,0 +1,492 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import requests
+
+from reference_harvester.manifest_log import iter_manifest
+from reference_harvester.providers.uspto.local_download import plan_ranges
+from reference_harvester.transport import HttpTransport
+
+provider_mod = importlib.import_module(
+    "reference_harvester.providers.uspto.provider"
+)
+
+
+@dataclass
+class FakeStreamResponse:
+    url: str
+    status_code: int
+    chunks: list[Any]
+    headers: dict[str, str] = field(default_factory=dict)
+    closed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= int(self.status_code) < 400
+
+    def iter_content(self, chunk_size: int = 1) -> Any:
+        del chunk_size
+        for chunk in self.chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _bare_provider():
+    cls = provider_mod.USPTOProvider
+    return cls.__new__(cls)
+
+
+def _fake_transport(fake_get, fake_head) -> HttpTransport:
+    session = SimpleNamespace(get=fake_get, head=fake_head, close=lambda: None)
+    return HttpTransport(user_agent="ua-test", session=session)
+
+
+def test_bulk_download_streams_and_stops_at_byte_budget(tmp_path: Path):
+    prov = _bare_provider()
+    small = "https://bulkdata.uspto.gov/data/small.zip"
+    large = "https://bulkdata.uspto.gov/data/large.zip"
+    bodies = {
+        small: [b"a" * 10, b"b" * 10],
+        large: [b"c" * 10, b"d" * 10, b"e" * 10],
+    }
+    served: list[FakeStreamResponse] = []
+
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(url=url, status_code=200, chunks=[])
+
+    def fake_get(url: str, **kwargs: Any) -> FakeStreamResponse:
+        assert kwargs["stream"] is True
+        resp = FakeStreamResponse(
+            url=url,
+            status_code=200,
+            chunks=bodies[url],
+            headers={"Content-Type": "application/zip"},
+        )
+        served.append(resp)
+        return resp
+
+    prov.transport = _fake_transport(fake_get, fake_head)
+    out_root = tmp_path / "uspto"
+    prov._download_bulk_artifacts(
+        out_root=out_root,
+        settings=provider_mod.USPTOSettings(user_agent="ua-test"),
+        bulk_urls=[small, large],
+        allow_hosts=set(),
+        deny_hosts=set(),
+        max_bulk=10,
+        max_bulk_bytes=35,
+        throttle_seconds=0.0,
+        since=None,
+    )
+
+    bulk_root = out_root / "bulk"
+    manifest = json.loads((bulk_root / "manifest.json").read_text("utf-8"))
+    assert [rec["url"] for rec in manifest] == [small]
+    assert manifest[0]["size_bytes"] == 20
+    assert (
+        manifest[0]["sha256"]
+        == hashlib.sha256(b"a" * 10 + b"b" * 10).hexdigest()
+    )
+    assert (out_root / manifest[0]["local_path"]).read_bytes() == (
+        b"a" * 10 + b"b" * 10
+    )
+
+    failures = [
+        json.loads(line)
+        for line in (bulk_root / "failures.jsonl")
+        .read_text("utf-8")
+        .splitlines()
+    ]
+    assert failures[0]["url"] == large
+    assert failures[0]["reason"] == "size_limit"
+    # Aborted on the chunk that crossed the 15 bytes left in the budget.
+    assert failures[0]["size_bytes"] == 20
+    assert not list(bulk_root.rglob("large.zip*"))
+    assert not list(bulk_root.rglob("*.part*"))
+    assert [resp.closed for resp in served] == [True, True]
+
+
+def _run_bulk(prov, out_root: Path, urls: list[str]) -> None:
+    prov._download_bulk_artifacts(
+        out_root=out_root,
+        settings=provider_mod.USPTOSettings(user_agent="ua-test"),
+        bulk_urls=urls,
+        allow_hosts=set(),
+        deny_hosts=set(),
+        max_bulk=10,
+        max_bulk_bytes=0,
+        throttle_seconds=0.0,
+        since=None,
+    )
+
+
+def test_incremental_bulk_run_only_appends_to_the_log(tmp_path: Path):
+    prov = _bare_provider()
+    first = "https://bulkdata.uspto.gov/data/first.zip"
+    second = "https://bulkdata.uspto.gov/data/second.zip"
+
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(url, 200, [])
+
+    def fake_get(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(url, 200, [url.encode("utf-8")])
+
+    prov.transport = _fake_transport(fake_get, fake_head)
+    out_root = tmp_path / "uspto"
+    _run_bulk(prov, out_root, [first])
+    bulk_root = out_root / "bulk"
+    snapshot = (bulk_root / "manifest.json").read_bytes()
+    _run_bulk(prov, out_root, [second])
+
+    # The second run leaves the snapshot alone; readers merge the log.
+    assert (bulk_root / "manifest.json").read_bytes() == snapshot
+    assert (bulk_root / "manifest.log.jsonl").exists()
+    urls = [rec["url"] for rec in iter_manifest(bulk_root / "manifest.json")]
+    assert urls == [first, second]
+
+
+def test_bulk_download_resumes_partial_with_range(tmp_path: Path):
+    prov = _bare_provider()
+    url = "https://bulkdata.uspto.gov/data/grants.zip"
+    body = b"0123456789" * 3
+    validators = {"ETag": '"v1"', "Content-Type": "application/zip"}
+    requests_seen: list[dict[str, str]] = []
+
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(url, 200, [], dict(validators))
+
+    def interrupted_get(url: str, **kwargs: Any) -> FakeStreamResponse:
+        requests_seen.append(dict(kwargs["headers"]))
+        return FakeStreamResponse(
+            url,
+            200,
+            [body[:10], requests.ConnectionError("reset mid-stream")],
+            dict(validators),
+        )
+
+    out_root = tmp_path / "uspto"
+    prov.transport = _fake_transport(interrupted_get, fake_head)
+    _run_bulk(prov, out_root, [url])
+
+    bulk_root = out_root / "bulk"
+    failure = json.loads((bulk_root / "failures.jsonl").read_text("utf-8"))
+    assert failure["reason"] == "request_failed"
+    assert failure["resumable"] is True
+    part = next(bulk_root.rglob("grants.zip.part"))
+    journal = json.loads(part.with_name("grants.zip.part.json").read_text())
+    assert part.read_bytes() == body[:10]
+    assert journal["bytes_received"] == 10
+    assert journal["etag"] == '"v1"'
+
+    def resumed_get(url: str, **kwargs: Any) -> FakeStreamResponse:
+        requests_seen.append(dict(kwargs["headers"]))
+        headers = dict(validators, **{"Content-Range": "bytes 10-29/30"})
+        return FakeStreamResponse(url, 206, [body[10:20], body[20:]], headers)
+
+    prov.transport = _fake_transport(resumed_get, fake_head)
+    _run_bulk(prov, out_root, [url])
+
+    assert requests_seen[-1]["Range"] == "bytes=10-"
+    assert requests_seen[-1]["If-Range"] == '"v1"'
+    manifest = list(iter_manifest(bulk_root / "manifest.json"))
+    assert manifest[0]["resumed_from"] == 10
+    assert manifest[0]["size_bytes"] == 30
+    assert manifest[0]["sha256"] == hashlib.sha256(body).hexdigest()
+    assert (out_root / manifest[0]["local_path"]).read_bytes() == body
+    assert not list(bulk_root.rglob("*.part*"))
+
+
+def test_bulk_download_refetches_when_range_does_not_continue_part(
+    tmp_path: Path,
+):
+    prov = _bare_provider()
+    url = "https://bulkdata.uspto.gov/data/grants.zip"
+    body = b"0123456789" * 3
+    dest = provider_mod._path_for_url(tmp_path / "uspto" / "bulk", url)
+    dest.parent.mkdir(parents=True)
+    dest.with_name("grants.zip.part").write_bytes(body[:10])
+    dest.with_name("grants.zip.part.json").write_text(
+        json.dumps({"url": url, "etag": '"v1"', "bytes_received": 10})
+    )
+    seen: list[dict[str, str]] = []
+
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(url, 200, [], {"ETag": '"v1"'})
+
+    def fake_get(url: str, **kwargs: Any) -> FakeStreamResponse:
+        seen.append(dict(kwargs["headers"]))
+        if "Range" in kwargs["headers"]:
+            # A range starting at 0 instead of the part's end.
+            headers = {"ETag": '"v1"', "Content-Range": "bytes 0-29/30"}
+            return FakeStreamResponse(url, 206, [body], headers)
+        return FakeStreamResponse(url, 200, [body], {"ETag": '"v1"'})
+
+    prov.transport = _fake_transport(fake_get, fake_head)
+    _run_bulk(prov, tmp_path / "uspto", [url])
+
+    assert seen[0]["Range"] == "bytes=10-"
+    assert "Range" not in seen[1] and "If-Range" not in seen[1]
+    bulk_root = tmp_path / "uspto" / "bulk"
+    manifest = list(iter_manifest(bulk_root / "manifest.json"))
+    assert manifest[0]["resumed_from"] == 0
+    assert manifest[0]["sha256"] == hashlib.sha256(body).hexdigest()
+    assert dest.read_bytes() == body
+    assert not dest.with_name("grants.zip.part").exists()
+
+
+def test_bulk_download_restarts_when_validator_changed(tmp_path: Path):
+    prov = _bare_provider()
+    url = "https://bulkdata.uspto.gov/data/grants.zip"
+    dest = provider_mod._path_for_url(tmp_path / "uspto" / "bulk", url)
+    dest.parent.mkdir(parents=True)
+    dest.with_name("grants.zip.part").write_bytes(b"stale")
+    dest.with_name("grants.zip.part.json").write_text(
+        json.dumps({"url": url, "etag": '"old"', "bytes_received": 5})
+    )
+    seen: list[dict[str, str]] = []
+
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(url, 200, [], {"ETag": '"new"'})
+
+    def fake_get(url: str, **kwargs: Any) -> FakeStreamResponse:
+        seen.append(dict(kwargs["headers"]))
+        return FakeStreamResponse(url, 200, [b"fresh body"], {"ETag": '"new"'})
+
+    prov.transport = _fake_transport(fake_get, fake_head)
+    _run_bulk(prov, tmp_path / "uspto", [url])
+
+    assert "Range" not in seen[0]
+    assert dest.read_bytes() == b"fresh body"
+    assert not dest.with_name("grants.zip.part").exists()
+
+
+def test_bulk_download_refuses_error_pages(tmp_path: Path):
+    prov = _bare_provider()
+    url = "https://bulkdata.uspto.gov/data/grants.zip"
+    served: list[FakeStreamResponse] = []
+
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(url, 200, [], {"ETag": '"v1"'})
+
+    def fake_get(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        # An interrupted error page must not be parked as a resumable part.
+        resp = FakeStreamResponse(
+            url,
+            404,
+            [b"<html>gone", requests.ConnectionError("reset mid-stream")],
+            {"ETag": '"v1"', "Content-Type": "text/html"},
+        )
+        served.append(resp)
+        return resp
+
+    prov.transport = _fake_transport(fake_get, fake_head)
+    out_root = tmp_path / "uspto"
+    _run_bulk(prov, out_root, [url])
+
+    bulk_root = out_root / "bulk"
+    failure = json.loads((bulk_root / "failures.jsonl").read_text("utf-8"))
+    assert failure["reason"] == "http_error"
+    assert failure["status_code"] == 404
+    assert list(iter_manifest(bulk_root / "manifest.json")) == []
+    assert not list(bulk_root.rglob("*.part*"))
+    assert all(resp.closed for resp in served)
+
+
+def _range_server(body: bytes, *, honor_ranges: bool, log: list[str]):
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        return FakeStreamResponse(
+            url,
+            200,
+            [],
+            {
+                "Content-Length": str(len(body)),
+                "Accept-Ranges": "bytes",
+                "ETag": '"v1"',
+            },
+        )
+
+    def fake_get(url: str, **kwargs: Any) -> FakeStreamResponse:
+        spec = kwargs["headers"].get("Range")
+        log.append(spec or "full")
+        if spec and honor_ranges:
+            start, end = (int(v) for v in spec.split("=", 1)[1].split("-"))
+            chunk = body[start : end + 1]
+            return FakeStreamResponse(
+                url,
+                206,
+                [chunk[:3], chunk[3:]],
+                {"Content-Range": f"bytes {start}-{end}/{len(body)}"},
+            )
+        return FakeStreamResponse(url, 200, [body], {"ETag": '"v1"'})
+
+    return fake_get, fake_head
+
+
+def test_plan_ranges_covers_every_byte_once() -> None:
+    assert plan_ranges(10, 3) == [(0, 3), (4, 6), (7, 9)]
+    assert plan_ranges(2, 8) == [(0, 0), (1, 1)]
+    assert plan_ranges(0, 4) == []
+
+
+def test_bulk_download_fetches_large_files_in_parallel_ranges(tmp_path: Path):
+    prov = _bare_provider()
+    url = "https://bulkdata.uspto.gov/data/big.zip"
+    body = bytes(range(256)) * 4
+    log: list[str] = []
+    prov.transport = _fake_transport(
+        *_range_server(body, honor_ranges=True, log=log)
+    )
+    out_root = tmp_path / "uspto"
+    prov._download_bulk_artifacts(
+        out_root=out_root,
+        settings=provider_mod.USPTOSettings(user_agent="ua-test"),
+        bulk_urls=[url],
+        allow_hosts=set(),
+        deny_hosts=set(),
+        max_bulk=10,
+        max_bulk_bytes=0,
+        throttle_seconds=0.0,
+        since=None,
+        parallel_parts=4,
+        parallel_min_bytes=100,
+    )
+
+    assert sorted(log) == sorted(
+        ["bytes=0-255", "bytes=256-511", "bytes=512-767", "bytes=768-1023"]
+    )
+    manifest = json.loads(
+        (out_root / "bulk" / "manifest.json").read_text("utf-8")
+    )
+    assert manifest[0]["sha256"] == hashlib.sha256(body).hexdigest()
+    assert (out_root / manifest[0]["local_path"]).read_bytes() == body
+
+
+def test_parallel_download_falls_back_when_ranges_ignored(tmp_path: Path):
+    prov = _bare_provider()
+    url = "https://bulkdata.uspto.gov/data/big.zip"
+    body = b"x" * 400
+    log: list[str] = []
+    prov.transport = _fake_transport(
+        *_range_server(body, honor_ranges=False, log=log)
+    )
+    out_root = tmp_path / "uspto"
+    prov._download_bulk_artifacts(
+        out_root=out_root,
+        settings=provider_mod.USPTOSettings(user_agent="ua-test"),
+        bulk_urls=[url],
+        allow_hosts=set(),
+        deny_hosts=set(),
+        max_bulk=10,
+        max_bulk_bytes=0,
+        throttle_seconds=0.0,
+        since=None,
+        parallel_parts=2,
+        parallel_min_bytes=100,
+    )
+
+    assert log[-1] == "full"
+    manifest = json.loads(
+        (out_root / "bulk" / "manifest.json").read_text("utf-8")
+    )
+    assert manifest[0]["size_bytes"] == 400
+    assert (out_root / manifest[0]["local_path"]).read_bytes() == body
+
+
+def test_parallel_download_falls_back_when_a_range_is_short(tmp_path: Path):
+    prov = _bare_provider()
+    url = "https://bulkdata.uspto.gov/data/big.zip"
+    body = bytes(range(200)) * 2
+    log: list[str] = []
+    ranged_get, fake_head = _range_server(body, honor_ranges=True, log=log)
+
+    def short_get(url: str, **kwargs: Any) -> FakeStreamResponse:
+        resp = ranged_get(url, **kwargs)
+        if resp.status_code == 206:
+            # Every range stops one byte early.
+            resp.chunks = [b"".join(resp.chunks)[:-1]]
+        return resp
+
+    prov.transport = _fake_transport(short_get, fake_head)
+    out_root = tmp_path / "uspto"
+    prov._download_bulk_artifacts(
+        out_root=out_root,
+        settings=provider_mod.USPTOSettings(user_agent="ua-test"),
+        bulk_urls=[url],
+        allow_hosts=set(),
+        deny_hosts=set(),
+        max_bulk=10,
+        max_bulk_bytes=0,
+        throttle_seconds=0.0,
+        since=None,
+        parallel_parts=2,
+        parallel_min_bytes=100,
+    )
+
+    assert log[-1] == "full"
+    manifest = list(iter_manifest(out_root / "bulk" / "manifest.json"))
+    assert manifest[0]["sha256"] == hashlib.sha256(body).hexdigest()
+    assert (out_root / manifest[0]["local_path"]).read_bytes() == body
+    assert not (out_root / "bulk" / "failures.jsonl").exists()
+
+
+def test_catalog_heads_assets_concurrently_in_input_order(tmp_path: Path):
+    import threading
+    import time
+
+    prov = _bare_provider()
+    base = "https://bulkdata.uspto.gov/data"
+    urls = [f"{base}/file{idx}.zip" for idx in range(6)]
+    artifacts = tmp_path / "uspto" / "artifacts"
+    artifacts.mkdir(parents=True)
+    catalog = tmp_path / "uspto" / "bulk" / "index.jsonl"
+    catalog.parent.mkdir(parents=True)
+    catalog.write_text(json.dumps({"url": urls[0]}) + "\n", encoding="utf-8")
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_head(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later URLs finish first, so completion order differs from input.
+        time.sleep(0.01 * (len(urls) - urls.index(url)))
+        with lock:
+            in_flight -= 1
+        return FakeStreamResponse(url, 200, [], {"Content-Length": "3"})
+
+    served: list[FakeStreamResponse] = []
+
+    def fake_get(url: str, **_kwargs: Any) -> FakeStreamResponse:
+        resp = FakeStreamResponse(url, 200, [url[-5:-4].encode() * 3])
+        served.append(resp)
+        return resp
+
+    prov.transport = _fake_transport(fake_get, fake_head)
+    prov._catalog_bulk_assets(
+        assets=[*urls, urls[2], "https://evil.example/x.zip"],
+        artifacts=artifacts,
+        settings=provider_mod.USPTOSettings(user_agent="ua-test"),
+        throttle_seconds=0.0,
+        concurrency=4,
+    )
+
+    lines = catalog.read_text("utf-8").splitlines()
+    rows = [json.loads(line) for line in lines]
+    assert [row["url"] for row in rows] == urls
+    assert peak > 1
+    assert rows[3]["sha256"] == hashlib.sha256(b"333").hexdigest()
+    assert len(served) == 5
+    assert all(resp.closed for resp in served)
@@ -3,12 +3,20 @@ from __future__ import annotations
 # pyright: reportMissingImports=false
 # pyright: reportMissingTypeStubs=false
 # pylint: disable=import-error,wrong-import-position
+import gzip
+import hashlib
 import importlib
+import json
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
-import requests  # type: ignore[import-untyped]
+
+from reference_harvester.manifest_log import iter_manifest
+from reference_harvester.run_index import RunIndex, index_path_for
+from reference_harvester.transport import HttpTransport
 
 PROVIDER_MODULE = "reference_harvester.providers.uspto.provider"
 provider_mod = importlib.import_module(PROVIDER_MODULE)
@@ -35,6 +43,11 @@ def _bare_provider():
     return cls.__new__(cls)
 
 
+def _fake_transport(fake_get) -> HttpTransport:
+    session = SimpleNamespace(get=fake_get, head=fake_get, close=lambda: None)
+    return HttpTransport(user_agent="ua-test", session=session)
+
+
 def test_harvest_additional_subdomains_writes_manifest(
     monkeypatch,
     tmp_path: Path,
@@ -74,7 +87,7 @@ def test_harvest_additional_subdomains_writes_manifest(
             headers={"Content-Type": "text/html"},
         )
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    prov.transport = _fake_transport(fake_get)
 
     harvester = getattr(
         prov,
@@ -142,7 +155,7 @@ def test_harvest_additional_subdomains_respects_allow_hosts(
             headers={"Content-Type": "text/html"},
         )
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    prov.transport = _fake_transport(fake_get)
 
     harvester = getattr(prov, "_harvest_additional_subdomains")
     settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
@@ -163,3 +176,657 @@ def test_harvest_additional_subdomains_respects_allow_hosts(
 
     payload = (out_root / "manifest.json").read_text(encoding="utf-8")
     assert ("developer.uspto.gov" in payload) is expect_in_scope
+
+
+def test_concurrent_crawl_respects_page_budget_and_dedup(tmp_path: Path):
+    prov = _bare_provider()
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        return FakeResponse(
+            url, 200, b"<html>same</html>", {"Content-Type": "text/html"}
+        )
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+
+    out_root = tmp_path / "out" / "uspto"
+    prov._harvest_additional_subdomains(
+        out_root=out_root,
+        settings=settings,
+        max_pages=5,
+        max_attachments=0,
+        extra_seeds=None,
+        allow_hosts={"developer.uspto.gov", "data.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=2,
+        since=None,
+        concurrency=4,
+        per_host_concurrency=4,
+    )
+
+    records = json.loads((out_root / "manifest.json").read_text("utf-8"))
+    urls = [rec["url"] for rec in records]
+    assert len(records) == 5
+    assert len(set(urls)) == len(urls)
+    # Identical bodies are stored once and referenced by later entries.
+    deduped = [rec for rec in records if rec["deduped_by_hash"]]
+    assert len(deduped) == 4
+    assert len({rec["local_path"] for rec in records}) == 1
+
+
+def test_crawler_reuses_robots_fetched_by_inventory(tmp_path: Path):
+    prov = _bare_provider()
+    seed = "https://developer.uspto.gov/api-catalog/"
+    robots_fetches: list[str] = []
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            robots_fetches.append(url)
+            return FakeResponse(
+                url=url,
+                status_code=200,
+                content=b"User-agent: *\nDisallow: /private\n",
+                headers={"Content-Type": "text/plain"},
+            )
+        return FakeResponse(
+            url=url,
+            status_code=200,
+            content=b"<html></html>",
+            headers={"Content-Type": "text/html"},
+        )
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test")
+    artifacts = tmp_path / "artifacts"
+    prov._inventory_robots(
+        hosts=["developer.uspto.gov", "data.uspto.gov"],
+        artifacts=artifacts,
+        settings=settings,
+    )
+    assert len(robots_fetches) == 2
+
+    out_root = tmp_path / "out"
+    prov._harvest_additional_subdomains(
+        out_root=out_root,
+        settings=settings,
+        max_pages=100,
+        max_attachments=0,
+        extra_seeds=[seed, "https://developer.uspto.gov/private/x"],
+        allow_hosts={"developer.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=0,
+        since=None,
+        robots=prov._robots_cache_for(
+            settings, store_dir=artifacts / "robots"
+        ),
+    )
+
+    assert len(robots_fetches) == 2
+    disallowed = (out_root / "disallowed.jsonl").read_text(encoding="utf-8")
+    assert "/private/x" in disallowed
+    manifest = (out_root / "manifest.json").read_text(encoding="utf-8")
+    assert "/private/x" not in manifest
+
+
+def test_crawl_spreads_pages_across_hosts_within_budget(tmp_path: Path):
+    prov = _bare_provider()
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        return FakeResponse(
+            url, 200, url.encode("utf-8"), {"Content-Type": "text/html"}
+        )
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+
+    out_root = tmp_path / "out" / "uspto"
+    prov._harvest_additional_subdomains(
+        out_root=out_root,
+        settings=settings,
+        max_pages=10,
+        max_attachments=0,
+        extra_seeds=None,
+        allow_hosts={"developer.uspto.gov", "data.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=0,
+        since=None,
+        concurrency=1,
+        per_host_concurrency=1,
+        host_page_budget=3,
+    )
+
+    records = json.loads((out_root / "manifest.json").read_text("utf-8"))
+    hosts = [rec["url"].split("/")[2] for rec in records]
+    assert hosts.count("developer.uspto.gov") == 3
+    assert hosts.count("data.uspto.gov") == 3
+    # API docs outrank the data.uspto.gov home page.
+    assert "https://data.uspto.gov/" not in {rec["url"] for rec in records}
+
+
+class _Killed(BaseException):
+    pass
+
+
+@pytest.mark.parametrize("compact_seen", [False, True])
+def test_interrupted_crawl_resumes_from_checkpoint(
+    tmp_path: Path, compact_seen: bool
+):
+    prov = _bare_provider()
+    base = "https://developer.uspto.gov"
+    fetched: list[str] = []
+    kill_at = {f"{base}/chain3"}
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        if url in kill_at:
+            raise _Killed(url)
+        fetched.append(url)
+        step = int(url.rsplit("chain", 1)[1]) if "/chain" in url else 0
+        links = (
+            f"<a href='{base}/chain{step + 1}'>next</a>" if step < 5 else ""
+        )
+        body = f"<html>{url}{links}</html>".encode()
+        return FakeResponse(url, 200, body, {"Content-Type": "text/html"})
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+    out_root = tmp_path / "out" / "uspto"
+    kwargs = {
+        "out_root": out_root,
+        "settings": settings,
+        "max_pages": 50,
+        "max_attachments": 0,
+        "extra_seeds": None,
+        "allow_hosts": {"developer.uspto.gov"},
+        "deny_hosts": None,
+        "throttle_seconds": 0.0,
+        "max_depth": 10,
+        "since": None,
+        "concurrency": 1,
+        "per_host_concurrency": 1,
+        "checkpoint_every": 2,
+        "compact_seen": compact_seen,
+    }
+
+    with pytest.raises(_Killed):
+        prov._harvest_additional_subdomains(**kwargs)
+    assert not (out_root / "manifest.json").exists()
+    assert (out_root / "crawl_state" / "journal.jsonl").exists()
+    first_run = list(fetched)
+    assert f"{base}/chain2" in first_run
+
+    kill_at.clear()
+    fetched.clear()
+    prov._harvest_additional_subdomains(resume=True, **kwargs)
+
+    assert not set(first_run) & set(fetched)
+    records = json.loads((out_root / "manifest.json").read_text("utf-8"))
+    urls = [rec["url"] for rec in records]
+    assert len(urls) == len(set(urls))
+    assert set(urls) == set(first_run) | set(fetched)
+    assert {f"{base}/chain{n}" for n in range(1, 6)} <= set(urls)
+    assert not (out_root / "crawl_state").exists()
+    assert not (out_root / "crawl_index").exists()
+
+
+def test_compact_crawl_serves_history_from_the_run_index(
+    monkeypatch, tmp_path: Path
+):
+    prov = _bare_provider()
+    base = "https://developer.uspto.gov"
+    histories: list[object] = []
+    conditional: dict[str, str | None] = {}
+
+    class _Spy(provider_mod._IndexedCrawlHistory):
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            histories.append(self)
+
+    monkeypatch.setattr(provider_mod, "_IndexedCrawlHistory", _Spy)
+
+    def fake_get(url: str, headers=None, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        conditional[url] = (headers or {}).get("If-None-Match")
+        if conditional[url]:
+            return FakeResponse(url, 304, b"", {})
+        if url == f"{base}/a":
+            body = f"<a href='{base}/b'>b</a><a href='{base}/c'>c</a>"
+        elif url in {f"{base}/b", f"{base}/c"}:
+            body = "<html>same body</html>"
+        else:
+            body = f"<html>{url}</html>"
+        return FakeResponse(
+            url,
+            200,
+            body.encode(),
+            {"Content-Type": "text/html", "ETag": "v1"},
+        )
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+    out_root = tmp_path / "out" / "uspto"
+    kwargs = {
+        "out_root": out_root,
+        "settings": settings,
+        "max_pages": 50,
+        "max_attachments": 0,
+        "extra_seeds": [f"{base}/a"],
+        "allow_hosts": {"developer.uspto.gov"},
+        "deny_hosts": None,
+        "throttle_seconds": 0.0,
+        "max_depth": 2,
+        "concurrency": 1,
+        "per_host_concurrency": 1,
+        "compact_seen": True,
+    }
+
+    prov._harvest_additional_subdomains(since=None, **kwargs)
+    manifest = iter_manifest(out_root / "manifest.json")
+    records = {rec["url"]: rec for rec in manifest}
+    # The second identical body reuses the first one's file.
+    first, second = records[f"{base}/b"], records[f"{base}/c"]
+    assert second["local_path"] == first["local_path"]
+    assert second["deduped_by_hash"] is True
+
+    conditional.clear()
+    future = datetime(2999, 1, 1, tzinfo=UTC)
+    prov._harvest_additional_subdomains(since=future, **kwargs)
+    # Stale records are refetched conditionally, from the index's copy.
+    assert conditional and all(conditional.values())
+    assert len(histories) == 2
+    for history in histories:
+        assert history.records == {} and history.paths == {}
+
+
+def test_crawl_skips_embedded_assets_and_script_urls(tmp_path: Path):
+    prov = _bare_provider()
+    base = "https://developer.uspto.gov"
+    fetched: list[str] = []
+    page = (
+        b"<html><head><base href='https://developer.uspto.gov/docs/'>"
+        b"<script>fetch('https://developer.uspto.gov/from-script')</script>"
+        b"</head><body><img src='logo.png' srcset='logo2.png 2x'>"
+        b"<a href='guide'>Guide</a><a href='spec.pdf'>Spec</a>"
+        b"</body></html>"
+    )
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        fetched.append(url)
+        if url.endswith(".pdf"):
+            return FakeResponse(
+                url, 200, b"%PDF", {"Content-Type": "application/pdf"}
+            )
+        return FakeResponse(url, 200, page, {"Content-Type": "text/html"})
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+    prov._harvest_additional_subdomains(
+        out_root=tmp_path / "out" / "uspto",
+        settings=settings,
+        max_pages=50,
+        max_attachments=5,
+        extra_seeds=None,
+        allow_hosts={"developer.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=1,
+        since=None,
+        concurrency=1,
+        per_host_concurrency=1,
+    )
+
+    assert f"{base}/docs/guide" in fetched
+    assert f"{base}/docs/spec.pdf" in fetched
+    assert not [url for url in fetched if "logo" in url or "script" in url]
+
+
+def test_sitemap_discovery_fetches_only_new_or_changed_urls(tmp_path: Path):
+    prov = _bare_provider()
+    base = "https://developer.uspto.gov"
+    sitemap = (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f"<url><loc>{base}/one</loc><lastmod>2026-03-01</lastmod></url>"
+        f"<url><loc>{base}/two</loc><lastmod>2026-03-02</lastmod></url>"
+        f"<url><loc>{base}/three</loc></url>"
+        "</urlset>"
+    ).encode()
+    fetched: list[str] = []
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        if url.endswith("/sitemap.xml"):
+            return SimpleNamespace(
+                status_code=200,
+                headers={"Content-Type": "application/xml"},
+                iter_content=lambda chunk_size: iter([sitemap]),
+                close=lambda: None,
+            )
+        fetched.append(url)
+        body = f"<html><a href='{base}/linked'>x</a></html>".encode()
+        return FakeResponse(url, 200, body, {"Content-Type": "text/html"})
+
+    out_root = tmp_path / "out" / "uspto"
+    out_root.mkdir(parents=True)
+    previous = [
+        {"url": f"{base}/one", "fetched_at": "2026-03-05T00:00:00+00:00"},
+        {"url": f"{base}/two", "fetched_at": "2026-03-01T00:00:00+00:00"},
+    ]
+    (out_root / "manifest.json").write_text(json.dumps(previous), "utf-8")
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+    prov._harvest_additional_subdomains(
+        out_root=out_root,
+        settings=settings,
+        max_pages=50,
+        max_attachments=0,
+        extra_seeds=None,
+        allow_hosts={"developer.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=3,
+        since=None,
+        concurrency=1,
+        per_host_concurrency=1,
+        discovery="sitemaps",
+        sitemap_urls=[f"{base}/sitemap.xml"],
+    )
+
+    assert sorted(fetched) == [f"{base}/three", f"{base}/two"]
+    records = list(iter_manifest(out_root / "manifest.json"))
+    assert [rec["url"] for rec in records] == [
+        f"{base}/one",
+        f"{base}/two",
+        f"{base}/three",
+    ]
+    assert records[0] == previous[0]
+    assert records[1]["fetched_at"] > previous[1]["fetched_at"]
+    stats = (out_root / "sitemaps.jsonl").read_text("utf-8")
+    assert '"entries": 3' in stats
+
+
+def test_near_duplicate_pages_are_flagged_and_not_expanded(tmp_path: Path):
+    prov = _bare_provider()
+    base = "https://developer.uspto.gov"
+    template = " ".join(f"section{i % 37} topic{i % 11}" for i in range(150))
+    fetched: list[str] = []
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        fetched.append(url)
+        if url in {f"{base}/t1", f"{base}/t2"}:
+            name = url.rsplit("/", 1)[1]
+            html = (
+                f"<html><p>{template} page {name}</p>"
+                f"<a href='{url}/child'>child</a></html>"
+            )
+        else:
+            html = (
+                f"<html>{url}<a href='{base}/t1'>1</a>"
+                f"<a href='{base}/t2'>2</a></html>"
+            )
+        return FakeResponse(
+            url, 200, html.encode("utf-8"), {"Content-Type": "text/html"}
+        )
+
+    out_root = tmp_path / "out" / "uspto"
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+    prov._harvest_additional_subdomains(
+        out_root=out_root,
+        settings=settings,
+        max_pages=50,
+        max_attachments=0,
+        extra_seeds=None,
+        allow_hosts={"developer.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=2,
+        since=None,
+        concurrency=1,
+        per_host_concurrency=1,
+    )
+
+    records = {
+        rec["url"]: rec
+        for rec in json.loads((out_root / "manifest.json").read_text("utf-8"))
+    }
+    assert records[f"{base}/t2"]["near_duplicate_of"] == f"{base}/t1"
+    assert "near_duplicate_of" not in records[f"{base}/t1"]
+    assert len(records[f"{base}/t1"]["simhash"]) == 16
+    assert f"{base}/t1/child" in fetched
+    assert f"{base}/t2/child" not in fetched
+
+
+def test_crawl_stores_identical_bodies_once_across_runs(tmp_path: Path):
+    prov = _bare_provider()
+    base = "https://developer.uspto.gov"
+    body = b"<html><p>Shared maintenance notice</p></html>"
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        if url == f"{base}/":
+            html = f"<html><a href='{base}/a'>a</a><a href='{base}/b'>b</a>"
+            return FakeResponse(
+                url, 200, html.encode("utf-8"), {"Content-Type": "text/html"}
+            )
+        return FakeResponse(url, 200, body, {"Content-Type": "text/html"})
+
+    provider_dir = tmp_path / "out" / "uspto"
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(
+        user_agent="ua-test",
+        max_retries=1,
+        blob_dir=str(provider_dir / "blobs"),
+    )
+    for run_id in ("r1", "r2"):
+        prov._harvest_additional_subdomains(
+            out_root=provider_dir / "runs" / run_id,
+            settings=settings,
+            max_pages=10,
+            max_attachments=0,
+            extra_seeds=[f"{base}/"],
+            allow_hosts={"developer.uspto.gov"},
+            deny_hosts=None,
+            throttle_seconds=0.0,
+            max_depth=1,
+            since=None,
+            concurrency=1,
+            per_host_concurrency=1,
+        )
+
+    sha = hashlib.sha256(body).hexdigest()
+    blob = provider_dir / "blobs" / sha[:2] / sha
+    inodes = set()
+    for run_id in ("r1", "r2"):
+        run_root = provider_dir / "runs" / run_id
+        records = {
+            rec["url"]: rec
+            for rec in json.loads(
+                (run_root / "manifest.json").read_text("utf-8")
+            )
+        }
+        for name in ("a", "b"):
+            rec = records[f"{base}/{name}"]
+            assert rec["blob_path"] == f"blobs/{sha[:2]}/{sha}"
+            view = run_root / rec["local_path"]
+            assert view.read_bytes() == body
+            inodes.add(view.stat().st_ino)
+    assert inodes == {blob.stat().st_ino}
+    assert blob.stat().st_nlink > 4
+
+
+def _crawl_body_site(body: bytes):
+    base = "https://developer.uspto.gov"
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        if url == f"{base}/":
+            html = f"<html><a href='{base}/a'>a</a></html>"
+            return FakeResponse(
+                url, 200, html.encode("utf-8"), {"Content-Type": "text/html"}
+            )
+        return FakeResponse(url, 200, body, {"Content-Type": "text/html"})
+
+    return _fake_transport(fake_get)
+
+
+def _crawl_once(
+    prov,
+    out_root: Path,
+    settings,
+    since: datetime | None = None,
+) -> dict[str, dict]:
+    base = "https://developer.uspto.gov"
+    prov._harvest_additional_subdomains(
+        out_root=out_root,
+        settings=settings,
+        max_pages=10,
+        max_attachments=0,
+        extra_seeds=[f"{base}/"],
+        allow_hosts={"developer.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=1,
+        since=since,
+        concurrency=1,
+        per_host_concurrency=1,
+    )
+    return {
+        rec["url"]: rec for rec in iter_manifest(out_root / "manifest.json")
+    }
+
+
+def test_crawl_without_blob_store_replaces_blob_views(tmp_path: Path):
+    prov = _bare_provider()
+    out_root = tmp_path / "out" / "uspto"
+    old_body = b"<html><p>Old notice</p></html>"
+    prov.transport = _crawl_body_site(old_body)
+    blob_settings = provider_mod.USPTOSettings(
+        user_agent="ua-test",
+        max_retries=1,
+        blob_dir=str(out_root / "blobs"),
+    )
+    first = _crawl_once(prov, out_root, blob_settings)
+    view = out_root / first["https://developer.uspto.gov/a"]["local_path"]
+    sha = hashlib.sha256(old_body).hexdigest()
+    blob = out_root / "blobs" / sha[:2] / sha
+    assert view.stat().st_ino == blob.stat().st_ino
+
+    new_body = b"<html><p>New notice</p></html>"
+    prov.transport = _crawl_body_site(new_body)
+    plain_settings = provider_mod.USPTOSettings(
+        user_agent="ua-test", max_retries=1
+    )
+    # A `since` in the future marks every recorded URL stale.
+    future = datetime.fromisoformat("2999-01-01T00:00:00+00:00")
+    second = _crawl_once(prov, out_root, plain_settings, since=future)
+
+    rec = second["https://developer.uspto.gov/a"]
+    assert (out_root / rec["local_path"]).read_bytes() == new_body
+    assert blob.read_bytes() == old_body
+
+
+def test_compressed_blobs_are_read_through_blob_path(tmp_path: Path):
+    prov = _bare_provider()
+    out_root = tmp_path / "out" / "uspto"
+    body = b"<html><p>Compressed notice</p></html>"
+    prov.transport = _crawl_body_site(body)
+    settings = provider_mod.USPTOSettings(
+        user_agent="ua-test",
+        max_retries=1,
+        blob_dir=str(out_root / "blobs"),
+        blob_compression="gzip",
+    )
+    records = _crawl_once(prov, out_root, settings)
+
+    rec = records["https://developer.uspto.gov/a"]
+    assert rec["local_path"] is None
+    assert rec["blob_compression"] == "gzip"
+    assert gzip.decompress((out_root / rec["blob_path"]).read_bytes()) == body
+
+
+def test_run_manifest_and_reports_are_exported_from_the_index(tmp_path: Path):
+    prov = _bare_provider()
+    base = "https://developer.uspto.gov"
+
+    def fake_get(url: str, **_kwargs):
+        if url.endswith("/robots.txt"):
+            return FakeResponse(url, 200, b"", {"Content-Type": "text/plain"})
+        if url == f"{base}/gone":
+            return FakeResponse(url, 404, b"<html>gone</html>", {})
+        html = f"<html><a href='{base}/gone'>gone</a></html>"
+        return FakeResponse(
+            url, 200, html.encode("utf-8"), {"Content-Type": "text/html"}
+        )
+
+    out_root = tmp_path / "out" / "uspto"
+    # A bulk manifest from before the index existed is picked up too.
+    (out_root / "bulk").mkdir(parents=True)
+    legacy = {
+        "url": "https://bulkdata.uspto.gov/a.zip",
+        "is_bulk_artifact": True,
+    }
+    (out_root / "bulk" / "manifest.json").write_text(
+        json.dumps([legacy]), encoding="utf-8"
+    )
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test", max_retries=1)
+    prov._harvest_additional_subdomains(
+        out_root=out_root,
+        settings=settings,
+        max_pages=50,
+        max_attachments=0,
+        extra_seeds=[f"{base}/"],
+        allow_hosts={"developer.uspto.gov"},
+        deny_hosts=None,
+        throttle_seconds=0.0,
+        max_depth=1,
+        since=None,
+        concurrency=1,
+        per_host_concurrency=1,
+    )
+    prov._write_run_manifest(out_root=out_root)
+
+    with RunIndex(index_path_for(out_root)) as index:
+        crawled = [rec["url"] for rec in index.fetches("additional")]
+        assert {f"{base}/", f"{base}/gone"} <= set(crawled)
+        assert index.count("bulk") == 1
+        assert [row["url"] for row in index.failures("additional")] == [
+            f"{base}/gone"
+        ]
+    lines = (out_root / "run_manifest.jsonl").read_text("utf-8").splitlines()
+    exported = [json.loads(line) for line in lines]
+    assert [(rec["origin"], rec["url"]) for rec in exported] == [
+        *(("additional", url) for url in crawled),
+        ("bulk", legacy["url"]),
+    ]
+    failures = json.loads(
+        (out_root / "failures_summary.json").read_text("utf-8")
+    )
+    assert (f"{base}/gone", "html") in {
+        (row["url"], row["source"]) for row in failures
+    }
+    # Exports read the manifests themselves, in path order.
+    sources: list[dict[str, str]] = []
+    entries = prov._iter_harvester_manifest_entries(out_root, sources=sources)
+    assert [rec["url"] for rec in entries] == [legacy["url"], *crawled]
+    assert [src["path"] for src in sources] == [
+        "bulk/manifest.json",
+        "manifest.jsonl",
+    ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
 import json
 from pathlib import Path
@@ -95,3 +96,50 @@ def test_export_endnote_writes_sidecar_and_ris(tmp_path: Path):
     assert any(
         v.startswith("uspto:") and not v.startswith("uspto:bulk:") for v in an_values
     )
+
+
+def test_export_endnote_streams_manifest_and_log(tmp_path: Path):
+    prov = provider_mod.USPTOProvider()
+    out_dir = tmp_path / "out" / "uspto"
+    provider_home = (
+        out_dir / "raw" / "harvester" / provider_mod.USPTO_PROVIDER_ID
+    )
+    bulk_manifest = provider_home / "bulk" / "manifest.json"
+    log = provider_mod.ManifestLog(bulk_manifest)
+    log.extend(
+        {
+            "url": f"https://bulkdata.test/{i}.zip",
+            "fetched_at": f"2026-01-0{i}",
+        }
+        for i in range(1, 4)
+    )
+    log.close()
+    log = provider_mod.ManifestLog(bulk_manifest)
+    log.append(
+        {"url": "https://bulkdata.test/1.zip", "fetched_at": "2026-02-01"}
+    )
+    log.close(compact=False)
+
+    prov.export_endnote(SimpleNamespace(name="uspto", out_dir=out_dir))
+
+    sidecars = out_dir / "endnote" / "sidecars"
+    envelopes = [
+        json.loads(p.read_text("utf-8")) for p in sidecars.glob("*.json")
+    ]
+    bulk = next(e for e in envelopes if e["kind"] == "bulk_manifest")["data"]
+    assert bulk["records_count"] == 3
+    assert [e["url"] for e in bulk["manifest_entries"]] == [
+        f"https://bulkdata.test/{i}.zip" for i in range(1, 4)
+    ]
+    assert bulk["manifest_entries"][0]["fetched_at"] == "2026-02-01"
+    assert bulk["observed_date_max"].startswith("2026-02-01")
+    # The mirror and log were hashed while being read.
+    assert {src["path"] for src in bulk["manifest_sources"]} == {
+        "bulk/manifest.jsonl",
+        "bulk/manifest.log.jsonl",
+    }
+    for src in bulk["manifest_sources"]:
+        data = (provider_home / src["path"]).read_bytes()
+        assert src["sha256"] == hashlib.sha256(data).hexdigest()
+    ris_text = (out_dir / "endnote" / "uspto.ris").read_text("utf-8")
+    assert ris_text.count("ER  -") == 4
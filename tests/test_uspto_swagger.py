@@ -15,6 +15,7 @@ import requests
 from reference_harvester.providers import (  # type: ignore[import]
     base as providers_base,
 )
+from reference_harvester.transport import HttpTransport
 
 ProviderContext = providers_base.ProviderContext
 
@@ -29,6 +30,11 @@ def _bare_provider():
     return cls.__new__(cls)
 
 
+def _fake_transport(fake_get, user_agent: str = "ua-test") -> HttpTransport:
+    session = SimpleNamespace(get=fake_get, head=fake_get, close=lambda: None)
+    return HttpTransport(user_agent=user_agent, session=session)
+
+
 def test_refresh_inventory_uses_packaged_swagger(tmp_path: Path):
     prov = provider_mod.USPTOProvider()
     ctx = ProviderContext(name="uspto", out_dir=tmp_path / "out")
@@ -96,7 +102,7 @@ def test_fetch_swagger_specs_handles_request_failure(
     ) -> None:
         raise requests.RequestException("boom")
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    prov.transport = _fake_transport(fake_get, "test-agent")
 
     fetch_specs = getattr(
         prov,
@@ -124,7 +130,7 @@ def test_fetch_swagger_specs_rejects_bad_json(monkeypatch, tmp_path: Path):
         def json(self):
             raise ValueError("not json")
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: FakeResp())
+    prov.transport = _fake_transport(lambda *_, **__: FakeResp(), "test-agent")
 
     fetch_specs = getattr(
         prov,
@@ -160,7 +166,7 @@ def test_fetch_swagger_specs_success_writes_meta(monkeypatch, tmp_path: Path):
         calls.append((url, headers, timeout))
         return FakeResp()
 
-    monkeypatch.setattr(requests, "get", fake_get)
+    prov.transport = _fake_transport(fake_get)
 
     fetch_specs = getattr(
         prov,
@@ -380,3 +386,130 @@ def test_refresh_inventory_with_stubbed_inventory(monkeypatch, tmp_path: Path):
     assert md_endpoints[0] == "| path | method | tags |"
     assert md_endpoints[1] == "| --- | --- | --- |"
     assert "| /datasets/products | GET | |" in md_endpoints[2]
+
+
+def test_fetch_swagger_specs_revalidates_with_etag(tmp_path: Path):
+    prov = _bare_provider()
+    body = b'{"paths": {"/datasets": {"get": {}}}}'
+    seen: list[dict | None] = []
+
+    class FakeResp:
+        def __init__(self, status_code: int) -> None:
+            self.status_code = status_code
+            self.ok = status_code < 400
+            self.content = body if status_code == 200 else b""
+            self.headers = {"ETag": '"v1"'}
+
+        def json(self):
+            return json.loads(self.content)
+
+    def fake_get(url: str, headers: dict | None = None, timeout=None):
+        seen.append(headers)
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return FakeResp(304)
+        return FakeResp(200)
+
+    prov.transport = _fake_transport(fake_get)
+    settings = provider_mod.USPTOSettings(user_agent="ua-test")
+    urls = ["https://a.test/swagger.json", "https://b.test/swagger.json"]
+
+    first = prov._fetch_swagger_specs(
+        swagger_urls=urls, artifacts_dir=tmp_path, settings=settings
+    )
+    second = prov._fetch_swagger_specs(
+        swagger_urls=urls, artifacts_dir=tmp_path, settings=settings
+    )
+
+    assert [name for name, _, _ in second] == ["live0", "live1"]
+    assert [spec for _, _, spec in second] == [spec for _, _, spec in first]
+    assert second[1][2]["_source_url"] == urls[1]
+    assert all("If-None-Match" not in (h or {}) for h in seen[:2])
+    assert all(h and h["If-None-Match"] == '"v1"' for h in seen[2:])
+    meta = json.loads((tmp_path / "swagger_live0.meta.json").read_text())
+    assert meta["not_modified"] is True
+    assert (tmp_path / "swagger_live0.json").read_bytes() == body
+
+
+def test_emit_swagger_artifacts_skips_unchanged_specs(tmp_path: Path):
+    prov = _bare_provider()
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text('{"paths": {"/a": {"get": {}}}}', encoding="utf-8")
+    spec = json.loads(spec_path.read_text(encoding="utf-8"))
+    artifacts = tmp_path / "artifacts"
+    artifacts.mkdir()
+    extracted: list[str] = []
+
+    def extract(spec_val):
+        extracted.append("x")
+        return []
+
+    def emit() -> None:
+        prov._emit_swagger_artifacts(
+            specs=[("live0", spec_path, spec)],
+            artifacts=artifacts,
+            endpoints_md_columns=None,
+            coverage_md_columns=None,
+            extract_fn=extract,
+            write_json_fn=lambda p, eps: p.write_text("[]", encoding="utf-8"),
+            write_md_fn=lambda p, eps: p.write_text("#", encoding="utf-8"),
+        )
+
+    emit()
+    emit()
+    assert extracted == ["x"]
+
+    spec_path.write_text('{"paths": {"/b": {"get": {}}}}', encoding="utf-8")
+    emit()
+    assert extracted == ["x", "x"]
+
+
+def test_xhr_inventory_renders_pages_through_shared_pool(tmp_path: Path):
+    from reference_harvester.browser_pool import BrowserError, RenderedPage
+
+    calls: list[list[str]] = []
+
+    class _Pool:
+        def render_many(self, urls, *, timeout_ms, on_request):
+            calls.append(list(urls))
+            on_request(
+                urls[0],
+                SimpleNamespace(
+                    url="https://data.uspto.gov/api/v1/datasets",
+                    method="GET",
+                    resource_type="xhr",
+                    headers={"accept": "application/json"},
+                ),
+            )
+            return [
+                RenderedPage(urls[0], 200, "text/html", b"<html></html>"),
+                BrowserError(f"{urls[1]}: timeout"),
+            ]
+
+    prov = _bare_provider()
+    prov.transport = _fake_transport(lambda *_a, **_k: None)
+    prov.browser_pool = _Pool()
+    artifacts = tmp_path / "artifacts"
+    pages = [
+        "https://data.uspto.gov/apis/getting-started",
+        "https://data.uspto.gov/apis/api-rate-limits",
+        "https://data.uspto.gov/apis/getting-started",
+    ]
+
+    prov._inventory_xhr_endpoints(
+        pages=pages,
+        artifacts=artifacts,
+        settings=provider_mod.USPTOSettings(),
+        throttle_seconds=0.0,
+        use_playwright=True,
+    )
+
+    assert calls == [pages[:2]]
+    records = json.loads(
+        (artifacts / "xhr_inventory.json").read_text(encoding="utf-8")
+    )
+    assert [r["page_url"] for r in records] == pages
+    assert records[0]["status_code"] == 200
+    assert records[0]["network_calls"][0]["resource_type"] == "xhr"
+    assert records[1]["status"] == "error"
+    assert "timeout" in records[1]["error"]
+    assert records[2]["sha256"] == records[0]["sha256"]